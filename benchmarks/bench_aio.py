@@ -0,0 +1,75 @@
+"""
+Benchmark: latência das outras tarefas do event loop durante um lote grande.
+
+Enquanto um lote de 200 mil valores é convertido, uma tarefa "requisição"
+acorda a cada 1 ms e mede o atraso em relação ao horário marcado. Compara
+por_extenso_lote() direto no loop (trava tudo até acabar) com
+por_extenso_lote_async() em fatias e com o pool de threads e de processos.
+
+Uso:
+    python benchmarks/bench_aio.py
+"""
+
+import asyncio
+import random
+import time
+
+from numextenso import por_extenso_lote
+from numextenso.aio import configurar_pool, encerrar_pool, por_extenso_lote_async
+
+INTERVALO = 0.001
+
+
+async def _requisicoes(parar: asyncio.Event, atrasos: list):
+    while not parar.is_set():
+        marcado = time.perf_counter() + INTERVALO
+        await asyncio.sleep(INTERVALO)
+        atrasos.append(time.perf_counter() - marcado)
+
+
+async def _medir(converter) -> tuple:
+    parar = asyncio.Event()
+    atrasos = []
+    tarefa = asyncio.create_task(_requisicoes(parar, atrasos))
+    await asyncio.sleep(0.05)  # a tarefa começa a medir antes do lote
+
+    inicio = time.perf_counter()
+    await converter()
+    duracao = time.perf_counter() - inicio
+
+    parar.set()
+    await tarefa
+    atrasos.sort()
+    return duracao, atrasos[len(atrasos) // 2], atrasos[int(len(atrasos) * 0.99)], atrasos[-1]
+
+
+async def principal():
+    rng = random.Random(42)
+    valores = [rng.randrange(10_000_000) / 100 for _ in range(200_000)]
+
+    async def direto():
+        por_extenso_lote(valores, modo="moeda")
+
+    async def fatias():
+        await por_extenso_lote_async(valores, modo="moeda", usar_pool=False)
+
+    async def pool():
+        await por_extenso_lote_async(valores, modo="moeda", usar_pool=True)
+
+    cenarios = [("direto no loop", direto, None), ("fatias", fatias, None),
+                ("pool de threads (4)", pool, "thread"), ("pool de processos (4)", pool, "processo")]
+    for nome, converter, tipo in cenarios:
+        if tipo is not None:
+            configurar_pool(tipo, tamanho=4)
+            await por_extenso_lote_async(valores[:40_000], modo="moeda", usar_pool=True)  # sobe o pool
+        duracao, p50, p99, maximo = await _medir(converter)
+        if tipo is not None:
+            encerrar_pool()
+        print(
+            f"{nome:<22} lote {duracao * 1e3:7.1f} ms   atraso das outras tarefas: "
+            f"p50 {p50 * 1e3:6.2f} ms  p99 {p99 * 1e3:6.2f} ms  máx {maximo * 1e3:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(principal())
@@ -0,0 +1,56 @@
+"""
+Benchmark: saída em bytes (numextenso.utf8) vs. str + encode().
+
+Pra quem grava o extenso em arquivo ou socket, o caminho antigo é montar
+a str e depois codificar. O utf8.py escreve direto num bytearray a partir
+das tabelas já codificadas. Mede os dois, valor a valor e em lote
+(tudo separado por "\\n", como num arquivo).
+
+Uso:
+    python benchmarks/bench_bytes.py
+"""
+
+import random
+import timeit
+
+from numextenso import por_extenso, por_extenso_lote
+from numextenso.utf8 import por_extenso_bytes, por_extenso_bytes_lote
+
+
+def main():
+    rng = random.Random(42)
+    faixas = {
+        "pequenos": [rng.randrange(1000) for _ in range(20_000)],
+        "milhares": [rng.randrange(1_000_000) for _ in range(20_000)],
+        "bilhões": [rng.randrange(10**12) for _ in range(20_000)],
+    }
+    moeda = [rng.randrange(1_000_000) / 100 for _ in range(20_000)]
+
+    cargas = {}
+    for faixa, valores in faixas.items():
+        cargas[f"valor a valor, {faixa}"] = (
+            lambda valores=valores: [por_extenso(v).encode() for v in valores],
+            lambda valores=valores: [por_extenso_bytes(v) for v in valores],
+        )
+        cargas[f"lote, {faixa}"] = (
+            lambda valores=valores: "".join(t + "\n" for t in por_extenso_lote(valores)).encode(),
+            lambda valores=valores: por_extenso_bytes_lote(valores),
+        )
+    cargas["lote, moeda"] = (
+        lambda: "".join(t + "\n" for t in por_extenso_lote(moeda, modo="moeda")).encode(),
+        lambda: por_extenso_bytes_lote(moeda, modo="moeda"),
+    )
+
+    for nome, (funcao_str, funcao_bytes) in cargas.items():
+        tempos = [
+            min(timeit.repeat(funcao, number=3, repeat=5)) / (3 * 20_000)
+            for funcao in (funcao_str, funcao_bytes)
+        ]
+        print(
+            f"{nome:<24} str+encode {tempos[0] * 1e9:6.0f} ns/valor   "
+            f"bytes {tempos[1] * 1e9:6.0f} ns/valor   ({tempos[0] / tempos[1]:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark: moeda em centavos inteiros e Decimal vs. o caminho com float.
+
+Simula um razão contábil (valores até R$ 1 milhão, guardados como
+centavos inteiros) e converte os mesmos valores de três jeitos:
+
+- float:    por_extenso_moeda(centavos / 100)
+- Decimal:  por_extenso_moeda(Decimal) - direto, sem float
+- centavos: por_extenso_centavos(int)   - sem float nem arredondamento
+
+Uso:
+    python benchmarks/bench_centavos.py
+"""
+
+import random
+import timeit
+from decimal import Decimal
+
+from numextenso import por_extenso_centavos, por_extenso_moeda
+
+
+def main():
+    rng = random.Random(42)
+    centavos = [rng.randrange(100_000_000) for _ in range(20_000)]
+    floats = [c / 100 for c in centavos]
+    decimais = [Decimal(c).scaleb(-2) for c in centavos]
+
+    esperado = [por_extenso_moeda(v) for v in floats]
+    assert [por_extenso_centavos(c) for c in centavos] == esperado
+    assert [por_extenso_moeda(d) for d in decimais] == esperado
+
+    cargas = {
+        "float": lambda: [por_extenso_moeda(v) for v in floats],
+        "Decimal": lambda: [por_extenso_moeda(d) for d in decimais],
+        "centavos (int)": lambda: [por_extenso_centavos(c) for c in centavos],
+    }
+
+    base = None
+    for nome, funcao in cargas.items():
+        duracao = min(timeit.repeat(funcao, number=3, repeat=3)) / (3 * len(centavos))
+        base = base or duracao
+        print(f"{nome:<16} {duracao * 1e9:7.0f} ns/valor   ({base / duracao:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: cardinal feminino vs. masculino.
+
+O feminino usa as próprias tabelas pré-calculadas (GRUPOS_FEMININO,
+MILHARES_FEMININO...), então tem que custar o mesmo que o masculino.
+Converte os mesmos valores nos dois gêneros, valor a valor, em lote e
+com o Conversor.
+
+Uso:
+    python benchmarks/bench_feminino.py
+"""
+
+import random
+import timeit
+
+from numextenso import Conversor, por_extenso, por_extenso_lote
+
+
+def main():
+    rng = random.Random(42)
+    faixas = {
+        "milhares": [rng.randrange(1_000_000) for _ in range(20_000)],
+        "bilhões": [rng.randrange(10**12) for _ in range(20_000)],
+    }
+
+    for faixa, valores in faixas.items():
+        masculino = Conversor()
+        feminino = Conversor(feminino=True)
+        cargas = {
+            "por_extenso": (
+                lambda: [por_extenso(v) for v in valores],
+                lambda: [por_extenso(v, feminino=True) for v in valores],
+            ),
+            "por_extenso_lote": (
+                lambda: por_extenso_lote(valores),
+                lambda: por_extenso_lote(valores, feminino=True),
+            ),
+            "Conversor": (
+                lambda: [masculino(v) for v in valores],
+                lambda: [feminino(v) for v in valores],
+            ),
+        }
+
+        print(f"{faixa}:")
+        for nome, (funcao_masculino, funcao_feminino) in cargas.items():
+            tempos = [
+                min(timeit.repeat(funcao, number=3, repeat=5)) / (3 * len(valores))
+                for funcao in (funcao_masculino, funcao_feminino)
+            ]
+            print(
+                f"  {nome:<18} masculino {tempos[0] * 1e9:6.0f} ns/valor   "
+                f"feminino {tempos[1] * 1e9:6.0f} ns/valor   ({tempos[0] / tempos[1]:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: tabela mapeada (numextenso.mapeada) vs. montar tudo no processo.
+
+Compara, num processo novo cada:
+    - montar a lista com todo cardinal de 0 a 999.999 (o que cada
+      trabalhador teria que fazer pra ter tudo pronto)
+    - abrir a tabela compilada com mmap e ler os mesmos valores
+
+e mede tempo de subida, memória própria do processo (RSS anônima, que
+não é dividida com os outros) e consultas aleatórias por segundo.
+
+Uso:
+    python benchmarks/bench_mapeada.py   (Linux: lê /proc/self/status)
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from numextenso.mapeada import compilar_tabela
+
+_MONTAR = """
+import random, time
+t = time.perf_counter()
+from numextenso import por_extenso_lote
+tabela = por_extenso_lote(range(1_000_000))
+subida = time.perf_counter() - t
+consultar = tabela.__getitem__
+"""
+
+_MAPEAR = """
+import random, time
+t = time.perf_counter()
+from numextenso.mapeada import abrir_tabela
+tabela = abrir_tabela({caminho!r})
+tabela.texto("cardinal", 0)
+subida = time.perf_counter() - t
+consultar = tabela.por_extenso
+"""
+
+_MEDIR = """
+rng = random.Random(42)
+numeros = [rng.randrange(1_000_000) for _ in range(200_000)]
+t = time.perf_counter()
+for n in numeros:
+    consultar(n)
+consultas = len(numeros) / (time.perf_counter() - t)
+anonima = 0
+for linha in open("/proc/self/status"):
+    if linha.startswith("RssAnon:"):
+        anonima = int(linha.split()[1]) / 1024
+print(f"subida {{subida * 1e3:7.1f}} ms   memória própria {{anonima:6.1f}} MB   "
+      f"{{consultas / 1e6:5.2f}} M consultas/s")
+"""
+
+
+def main():
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "extensos.bin")
+        t = time.perf_counter()
+        tamanho = compilar_tabela(caminho)
+        print(f"compilar: {time.perf_counter() - t:.1f} s, {tamanho / 1e6:.0f} MB\n")
+
+        for nome, codigo in (("montar no processo", _MONTAR), ("tabela mapeada", _MAPEAR)):
+            codigo = (codigo + _MEDIR).format(caminho=caminho)
+            saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+            print(f"{nome:<20} {saida.stdout.strip()}")
+
+
+if __name__ == "__main__":
+    main()
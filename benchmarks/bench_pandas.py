@@ -0,0 +1,49 @@
+"""
+Benchmark: acessor .extenso (numextenso.pandas) e por_extenso_arrow vs.
+Series.map(por_extenso_moeda).
+
+Um milhão de linhas com poucos valores distintos (preços se repetindo),
+que é o caso das planilhas de vendas. Mede tempo e memória da coluna
+resultante.
+
+Uso:
+    python benchmarks/bench_pandas.py   (precisa de pandas e pyarrow)
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Só importar já registra o acessor .extenso nas Series do pandas
+import numextenso.pandas  # noqa: F401
+from numextenso import por_extenso_moeda
+from numextenso.arrow import por_extenso_arrow
+
+
+def main():
+    rng = np.random.default_rng(42)
+    for distintos in (100, 10_000, 100_000):
+        precos = pd.Series(rng.integers(0, distintos, 1_000_000) / 100)
+
+        cargas = {
+            "Series.map": lambda: precos.map(por_extenso_moeda),
+            "s.extenso.moeda()": lambda: precos.extenso.moeda(),
+            "por_extenso_arrow": lambda: por_extenso_arrow(pa.array(precos), modo="moeda"),
+        }
+        quantidade = f"{distintos:,}".replace(",", ".")
+        print(f"1.000.000 linhas, {quantidade} valores distintos:")
+        for nome, funcao in cargas.items():
+            inicio = time.perf_counter()
+            resultado = funcao()
+            duracao = time.perf_counter() - inicio
+            if isinstance(resultado, pd.Series):
+                memoria = resultado.memory_usage(deep=True)
+            else:
+                memoria = resultado.nbytes
+            print(f"  {nome:<20} {duracao * 1e3:8.1f} ms   {memoria / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Benchmark: vazão da conversão paralela por número de processos.
+
+Converte o mesmo lote com 1, 2, 4 e 8 processos e mostra valores/s e
+o ganho em relação a 1 processo. O ganho só chega perto de linear se a
+máquina tiver pelo menos esse número de núcleos livres.
+
+Uso:
+    python benchmarks/bench_paralelo.py [quantidade]
+"""
+
+import os
+import random
+import sys
+import time
+
+from numextenso.paralelo import por_extenso_lote_paralelo
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    rng = random.Random(42)
+    valores = [rng.randrange(100_000_000) / 100 for _ in range(quantidade)]
+
+    print(f"{quantidade:,} valores (modo moeda), {os.cpu_count()} núcleo(s) disponíveis")
+    base = None
+    for jobs in (1, 2, 4, 8):
+        inicio = time.perf_counter()
+        por_extenso_lote_paralelo(valores, modo="moeda", jobs=jobs)
+        duracao = time.perf_counter() - inicio
+        base = base or duracao
+        print(
+            f"  {jobs} processo(s): {quantidade / duracao:12,.0f} valores/s   "
+            f"({base / duracao:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: motor com tabelas pré-calculadas vs. o algoritmo antigo.
+
+O algoritmo antigo (montar cada grupo na hora com _converter_grupo e
+decidir a concordância a cada chamada) tá reproduzido aqui embaixo só
+pra servir de referência. O script também confere que as duas versões
+dão exatamente o mesmo texto.
+
+Uso:
+    python benchmarks/bench_tabelas.py
+"""
+
+import random
+import timeit
+
+from numextenso import por_extenso
+from numextenso.constantes import CLASSES
+from numextenso.tabelas import _converter_grupo
+
+
+def por_extenso_antigo(numero: int) -> str:
+    """Versão antiga de por_extenso (sem tabelas), só pra comparação."""
+    if numero == 0:
+        return "zero"
+
+    grupos = []
+    temp = numero
+    while temp > 0:
+        grupos.append(temp % 1000)
+        temp //= 1000
+
+    partes = []
+    for i, grupo in enumerate(grupos):
+        if grupo == 0:
+            continue
+        texto_grupo = _converter_grupo(grupo)
+        if i == 1:
+            texto_grupo = "mil" if grupo == 1 else texto_grupo + " mil"
+        elif i > 1:
+            if grupo == 1:
+                texto_grupo = "um " + CLASSES[i][0]
+            else:
+                texto_grupo += " " + CLASSES[i][1]
+        partes.append((texto_grupo, grupo))
+
+    partes.reverse()
+    resultado = []
+    for i, (texto, valor) in enumerate(partes):
+        resultado.append(texto)
+        if i < len(partes) - 1:
+            prox_valor = partes[i + 1][1]
+            if prox_valor < 100 or prox_valor % 100 == 0:
+                resultado.append(" e ")
+            elif valor == 1 and texto == "mil":
+                resultado.append(" ")
+            else:
+                resultado.append(", ")
+    return "".join(resultado)
+
+
+def main():
+    rng = random.Random(42)
+    cargas = {
+        "pequenos (0-999)": [rng.randrange(1000) for _ in range(10_000)],
+        "faturas (até 1 milhão)": [rng.randrange(1_000_000) for _ in range(10_000)],
+        "grandes (até trilhões)": [rng.randrange(10**15) for _ in range(10_000)],
+    }
+
+    for nome, valores in cargas.items():
+        for v in valores:
+            assert por_extenso(v) == por_extenso_antigo(v), v
+
+        antigo = min(timeit.repeat(
+            lambda: [por_extenso_antigo(v) for v in valores], number=5, repeat=3
+        ))
+        novo = min(timeit.repeat(
+            lambda: [por_extenso(v) for v in valores], number=5, repeat=3
+        ))
+        chamadas = len(valores) * 5
+        print(
+            f"{nome:<24} antigo: {antigo / chamadas * 1e9:7.0f} ns/chamada   "
+            f"tabelas: {novo / chamadas * 1e9:7.0f} ns/chamada   "
+            f"({antigo / novo:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
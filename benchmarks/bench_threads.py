@@ -0,0 +1,188 @@
+"""
+Benchmark: vazão com 1, 2, 4 e 8 threads (Python com e sem GIL).
+
+Cada thread converte a mesma quantidade de valores (todas começam juntas,
+numa Barrier), e o resultado de cada uma é conferido com o de uma
+conversão feita antes numa thread só - se alguma conversão dependesse de
+estado compartilhado, os textos viriam trocados. Mede por_extenso,
+por_extenso_moeda e por_extenso_ordinal, a moeda com o cache e com as
+métricas ligados, e por_extenso_lote_paralelo(pool="thread").
+
+Antes de medir, roda uma conferência (conferir()): 8 threads chamando
+as três funções com o cache (pequeno, pra ter despejo o tempo todo) e as
+métricas ligados. Além dos textos, confere que nenhuma contagem se perdeu:
+hits + misses de cada cache e as chamadas de cada função nas métricas
+têm que bater com o número de chamadas feitas. Sai com erro se não bater.
+
+No Python com GIL a vazão total fica parada em ~1x (só uma thread roda
+por vez). No Python sem GIL (3.13t ou mais novo) deve crescer quase
+linear até o número de núcleos.
+
+Uso:
+    python benchmarks/bench_threads.py
+    python3.13t benchmarks/bench_threads.py
+    python3.13t benchmarks/bench_threads.py --conferir   (só a conferência)
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+from numextenso import cache, metricas, por_extenso, por_extenso_lote, por_extenso_moeda, por_extenso_ordinal
+from numextenso.paralelo import gil_ativo, por_extenso_lote_paralelo
+
+THREADS = (1, 2, 4, 8)
+POR_THREAD = 50_000
+
+# Chamada -> (função, modo do cache que ela usa)
+CONFERIDAS = {
+    "por_extenso": (por_extenso, "cardinal"),
+    "por_extenso_moeda": (por_extenso_moeda, "moeda"),
+    "por_extenso_ordinal": (por_extenso_ordinal, "ordinal_masculino"),
+}
+
+
+def _rodar(funcao, valores: list, threads: int) -> float:
+    """Roda funcao em cada valor em `threads` threads ao mesmo tempo; devolve valores/s."""
+    esperado = [funcao(v) for v in valores]
+    barreira = threading.Barrier(threads + 1)
+    errados = []
+
+    def trabalhar():
+        barreira.wait()
+        resultado = [funcao(v) for v in valores]
+        if resultado != esperado:
+            errados.append(threading.get_ident())
+
+    trabalhadores = [threading.Thread(target=trabalhar) for _ in range(threads)]
+    for t in trabalhadores:
+        t.start()
+    barreira.wait()
+    inicio = time.perf_counter()
+    for t in trabalhadores:
+        t.join()
+    duracao = time.perf_counter() - inicio
+
+    if errados:
+        raise AssertionError(f"{len(errados)} thread(s) com resultado diferente")
+    return threads * len(valores) / duracao
+
+
+def _rodar_lote(valores: list, threads: int) -> float:
+    esperado = por_extenso_lote(valores, modo="moeda")
+    inicio = time.perf_counter()
+    resultado = por_extenso_lote_paralelo(valores, modo="moeda", jobs=threads, pool="thread")
+    duracao = time.perf_counter() - inicio
+    if resultado != esperado:
+        raise AssertionError("lote em threads diferente do lote normal")
+    return len(valores) / duracao
+
+
+def conferir(threads: int = 8, por_thread: int = 20_000) -> None:
+    """
+    Confere o cache e as métricas sob várias threads ao mesmo tempo.
+
+    Levanta AssertionError se algum texto vier errado ou se alguma
+    contagem (hits + misses, chamadas) não bater com o que foi chamado.
+    """
+    rng = random.Random(7)
+    # Valores de 1 pra cima (o zero volta antes de chegar no cache) e com
+    # repetição, pra ter hit, miss e despejo ao mesmo tempo
+    valores = {
+        "por_extenso": [rng.randrange(1, 5000) for _ in range(por_thread)],
+        "por_extenso_moeda": [rng.randrange(1, 5000) / 100 for _ in range(por_thread)],
+        "por_extenso_ordinal": [rng.randrange(1, 5000) for _ in range(por_thread)],
+    }
+    esperado = {
+        nome: [funcao(v) for v in valores[nome]]
+        for nome, (funcao, _) in CONFERIDAS.items()
+    }
+
+    cache.ativar(tamanho=256)
+    metricas.ativar()
+    metricas.zerar()
+    try:
+        barreira = threading.Barrier(threads)
+        errados = []
+
+        def trabalhar():
+            barreira.wait()
+            for nome, (funcao, _) in CONFERIDAS.items():
+                if [funcao(v) for v in valores[nome]] != esperado[nome]:
+                    errados.append(nome)
+
+        trabalhadores = [threading.Thread(target=trabalhar) for _ in range(threads)]
+        for t in trabalhadores:
+            t.start()
+        for t in trabalhadores:
+            t.join()
+
+        info = cache.cache_info()
+        contadas = metricas.snapshot()
+    finally:
+        cache.desativar()
+        metricas.desativar()
+
+    assert not errados, f"texto errado em: {', '.join(sorted(set(errados)))}"
+    chamadas = threads * por_thread
+    for nome, (_, modo) in CONFERIDAS.items():
+        assert info[modo].hits + info[modo].misses == chamadas, (
+            f"cache {modo}: {info[modo].hits} hits + {info[modo].misses} misses, "
+            f"esperava {chamadas} consultas"
+        )
+        assert info[modo].currsize <= info[modo].maxsize, f"cache {modo} passou do tamanho: {info[modo]}"
+        assert contadas[nome]["chamadas"] == chamadas, (
+            f"métricas de {nome}: {contadas[nome]['chamadas']} chamadas, esperava {chamadas}"
+        )
+        assert sum(contadas[nome]["latencia"]["baldes"]) == chamadas, f"baldes de {nome} não batem"
+    print(f"conferência ok: {threads} threads x {por_thread} valores x {len(CONFERIDAS)} funções")
+
+
+def main():
+    conferir()
+    if "--conferir" in sys.argv[1:]:
+        return
+    print()
+
+    rng = random.Random(42)
+    inteiros = [rng.randrange(10**9) for _ in range(POR_THREAD)]
+    precos = [rng.randrange(100_000) / 100 for _ in range(POR_THREAD)]
+    ordinais = [rng.randrange(1, 10**6) for _ in range(POR_THREAD)]
+    # Mil preços se repetindo: o caso em que o cache compensa
+    repetidos = [rng.randrange(1000) / 10 for _ in range(POR_THREAD)]
+
+    cargas = {
+        "por_extenso": lambda n: _rodar(por_extenso, inteiros, n),
+        "por_extenso_moeda": lambda n: _rodar(por_extenso_moeda, precos, n),
+        "por_extenso_ordinal": lambda n: _rodar(por_extenso_ordinal, ordinais, n),
+        "moeda com cache": lambda n: _rodar(por_extenso_moeda, repetidos, n),
+        "moeda com métricas": lambda n: _rodar(por_extenso_moeda, precos, n),
+        "lote em threads": lambda n: _rodar_lote(precos * 8, n),
+    }
+
+    print(f"Python {sys.version.split()[0]}, GIL {'ligado' if gil_ativo() else 'desligado'}, "
+          f"{os.cpu_count()} núcleo(s)\n")
+    print(f"{'carga':<22}" + "".join(f"{f'{n} thread(s)':>22}" for n in THREADS))
+
+    for nome, carga in cargas.items():
+        if nome == "moeda com cache":
+            cache.ativar()
+        elif nome == "moeda com métricas":
+            metricas.ativar()
+        try:
+            base = None
+            colunas = []
+            for n in THREADS:
+                vazao = carga(n)
+                base = base or vazao
+                colunas.append(f"{vazao / 1e3:8.0f} k/s ({vazao / base:4.1f}x)")
+        finally:
+            cache.desativar()
+            metricas.desativar()
+        print(f"{nome:<22}" + "".join(f"{c:>22}" for c in colunas))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,40 @@ Uma biblioteca simples e direta pra transformar números em texto.
 precisa escrever o valor por extenso.
 """
 
-from .conversor import por_extenso, por_extenso_moeda, por_extenso_ordinal
+from .conversor import (
+    por_extenso,
+    por_extenso_centavos,
+    por_extenso_moeda,
+    por_extenso_ordinal,
+)
+from .compilado import Conversor
+from .leitura import ler_centavos, ler_centavos_lote, ler_inteiro
+from .lote import por_extenso_lote
+from .sequencia import gerar_extenso
+from .reverso import (
+    para_centavos,
+    para_numero,
+    para_numero_lote,
+    para_valor_moeda,
+    para_valor_moeda_lote,
+)
 
 __version__ = "1.0.0"
 __author__ = "Ricardo Willian"
-__all__ = ["por_extenso", "por_extenso_moeda", "por_extenso_ordinal"]
+__all__ = [
+    "Conversor",
+    "gerar_extenso",
+    "ler_centavos",
+    "ler_centavos_lote",
+    "ler_inteiro",
+    "para_centavos",
+    "para_numero",
+    "para_numero_lote",
+    "para_valor_moeda",
+    "para_valor_moeda_lote",
+    "por_extenso",
+    "por_extenso_centavos",
+    "por_extenso_lote",
+    "por_extenso_moeda",
+    "por_extenso_ordinal",
+]
@@ -0,0 +1,237 @@
+"""
+Conversão em lote pra quem roda dentro de um event loop (asyncio).
+
+Um por_extenso_lote() de 100 mil valores dentro de um handler async
+segura o loop inteiro até acabar: todas as outras requisições esperam.
+Aqui o lote é convertido em fatias pequenas, devolvendo o controle pro
+loop entre uma fatia e outra:
+
+    >>> await por_extenso_lote_async(valores, modo="moeda")
+
+Chamadas de um valor só (por_extenso_moeda(19.9)) levam microssegundos
+e podem continuar síncronas.
+
+Lotes grandes também podem ir pra um pool compartilhado, de threads ou
+de processos, configurado uma vez na subida do serviço:
+
+    configurar_pool("processo", tamanho=4)
+    ...
+    await por_extenso_lote_async(valores)   # >= LIMITE_POOL valores vão pro pool
+    ...
+    encerrar_pool()
+
+Pra latência das outras requisições, as fatias sozinhas já são o melhor
+caminho. Processos liberam a CPU do processo do loop (cada um tem seu
+núcleo), mas mandar os blocos e receber os resultados ainda custa alguns
+ms por vez. Threads disputam o GIL com o loop e, no Python normal, deixam
+o atraso pior que só as fatias; só valem a pena no Python sem GIL
+(free-threaded).
+"""
+
+import asyncio
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from .conversor import _resolver_moeda
+from .lote import MODOS, por_extenso_lote
+from .paralelo import TIPOS_POOL, _converter_bloco_valores, _jobs
+
+# Valores convertidos entre uma devolução e outra pro loop (bem menos de 1 ms)
+TAMANHO_FATIA = 250
+
+# A partir de quantos valores um lote vai pro pool (se tiver um configurado)
+LIMITE_POOL = 50_000
+
+# Valores por tarefa mandada pro pool. Menor que o paralelo.TAMANHO_BLOCO:
+# quem serializa as tarefas e os resultados (no pool de processos) é uma
+# thread do próprio processo do loop, e bloco grande segura o GIL por mais
+# tempo de uma vez
+TAMANHO_BLOCO_POOL = 2000
+
+# Pool compartilhado: (executor, tamanho), ou None sem pool. A trava
+# protege a troca dele e as contas abaixo
+_pool = None
+_trava_pool = threading.Lock()
+
+# executor -> quantos lotes estão usando ele agora. Um pool trocado ou
+# encerrado com lote rodando vai pra _aposentados e só é desligado quando
+# o último lote dele termina (senão os blocos que faltam não têm onde rodar)
+_em_uso = {}
+_aposentados = set()
+
+
+def configurar_pool(tipo: str = "thread", tamanho: int = None) -> None:
+    """
+    Cria o pool compartilhado usado pros lotes grandes.
+
+    Parâmetros:
+        tipo: "thread" ou "processo"
+        tamanho: Número de threads/processos (None = um por núcleo)
+
+    Se já tinha um pool, ele é encerrado: os lotes que já estavam nele
+    terminam lá, e os novos vão pro pool novo.
+    """
+    global _pool
+    if tipo not in TIPOS_POOL:
+        raise ValueError(f"Tipo de pool inválido: {tipo!r}. Use um de: {', '.join(TIPOS_POOL)}")
+    tamanho = _jobs(tamanho)
+
+    if tipo == "thread":
+        novo = ThreadPoolExecutor(max_workers=tamanho, thread_name_prefix="numextenso")
+    else:
+        novo = ProcessPoolExecutor(max_workers=tamanho)
+
+    with _trava_pool:
+        antigo, _pool = _pool, (novo, tamanho)
+        livre = _aposentar(antigo)
+    if livre:
+        antigo[0].shutdown(wait=False)
+
+
+def encerrar_pool(esperar: bool = True) -> None:
+    """
+    Encerra o pool compartilhado (os lotes voltam a rodar só em fatias).
+
+    Com lote rodando no pool, ele só é desligado quando o último terminar
+    (aí sem esperar: quem espera é o próprio lote).
+    """
+    global _pool
+    with _trava_pool:
+        antigo, _pool = _pool, None
+        livre = _aposentar(antigo)
+    if livre:
+        antigo[0].shutdown(wait=esperar)
+
+
+def _aposentar(pool: tuple) -> bool:
+    """Tira o pool de circulação; True se ninguém usa e dá pra desligar já."""
+    if pool is None:
+        return False
+    if _em_uso.get(pool[0]):
+        _aposentados.add(pool[0])
+        return False
+    return True
+
+
+def _pegar_pool() -> tuple:
+    """O pool atual (ou None), marcado como em uso até _devolver_pool()."""
+    with _trava_pool:
+        pool = _pool
+        if pool is not None:
+            _em_uso[pool[0]] = _em_uso.get(pool[0], 0) + 1
+    return pool
+
+
+def _devolver_pool(pool: tuple) -> None:
+    executor = pool[0]
+    with _trava_pool:
+        restantes = _em_uso[executor] - 1
+        if restantes:
+            _em_uso[executor] = restantes
+            return
+        del _em_uso[executor]
+        if executor not in _aposentados:
+            return
+        _aposentados.discard(executor)
+    executor.shutdown(wait=False)
+
+
+async def por_extenso_lote_async(
+    valores,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    moeda: dict | str = None,
+    usar_pool: bool = None,
+    tamanho_fatia: int = TAMANHO_FATIA,
+) -> list:
+    """
+    Mesmo que por_extenso_lote(), sem travar o event loop.
+
+    Parâmetros:
+        valores, modo, feminino, moeda: Como em por_extenso_lote()
+        usar_pool: None (padrão) manda pro pool compartilhado os lotes com
+            LIMITE_POOL valores ou mais, se configurar_pool() foi chamado;
+            True manda sempre (ValueError sem pool configurado); False
+            nunca manda
+        tamanho_fatia: Valores convertidos antes de devolver o controle
+            pro loop (fora do pool)
+
+    Retorna:
+        Lista de strings, na mesma ordem dos valores
+
+    Exemplos:
+        >>> await por_extenso_lote_async([1, 2.5], modo="moeda")
+        ['um real', 'dois reais e cinquenta centavos']
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: {modo!r}. Use um de: {', '.join(MODOS)}")
+    if tamanho_fatia < 1:
+        raise ValueError("O tamanho da fatia precisa ser positivo")
+    if modo == "moeda":
+        # Resolve o código uma vez (e dá o erro de moeda antes de começar)
+        moeda = _resolver_moeda(moeda)
+
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(valores, np.ndarray):
+        # Fatias do array continuam arrays (e caem no caminho vetorizado)
+        valores = valores.ravel()
+    elif not isinstance(valores, list):
+        valores = list(valores)
+
+    if usar_pool is False or (usar_pool is None and len(valores) < LIMITE_POOL):
+        pool = None
+    else:
+        # Pega o pool uma vez só pro lote inteiro: se configurar_pool()
+        # trocar ele no meio, este lote termina no mesmo
+        pool = _pegar_pool()
+        if usar_pool and pool is None:
+            raise ValueError("Nenhum pool configurado: chame configurar_pool() antes")
+
+    if pool is not None:
+        try:
+            return await _lote_no_pool(pool, valores, modo, feminino, moeda)
+        finally:
+            _devolver_pool(pool)
+
+    if len(valores) <= tamanho_fatia:
+        return por_extenso_lote(valores, modo=modo, feminino=feminino, moeda=moeda)
+
+    resultado = []
+    for inicio in range(0, len(valores), tamanho_fatia):
+        resultado.extend(por_extenso_lote(
+            valores[inicio:inicio + tamanho_fatia], modo=modo, feminino=feminino, moeda=moeda
+        ))
+        # Deixa as outras tarefas do loop rodarem antes da próxima fatia
+        await asyncio.sleep(0)
+    return resultado
+
+
+async def _lote_no_pool(pool: tuple, valores, modo: str, feminino: bool, moeda) -> list:
+    """
+    Divide em blocos de TAMANHO_BLOCO_POOL e converte no pool, em ordem.
+
+    Igual ao paralelo._mapear_em_ordem(): no máximo 2 blocos por
+    trabalhador ficam em voo, em vez de serializar o lote inteiro de uma vez.
+    """
+    executor, tamanho = pool
+    loop = asyncio.get_running_loop()
+    funcao = partial(_converter_bloco_valores, modo, feminino, moeda)
+
+    resultado = []
+    pendentes = deque()
+    try:
+        for inicio in range(0, len(valores), TAMANHO_BLOCO_POOL):
+            bloco = valores[inicio:inicio + TAMANHO_BLOCO_POOL]
+            pendentes.append(loop.run_in_executor(executor, funcao, bloco))
+            if len(pendentes) >= tamanho * 2:
+                resultado.extend(await pendentes.popleft())
+        while pendentes:
+            resultado.extend(await pendentes.popleft())
+    finally:
+        # Erro ou cancelamento: os blocos que nem começaram não rodam mais
+        for futuro in pendentes:
+            futuro.cancel()
+    return resultado
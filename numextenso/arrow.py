@@ -0,0 +1,70 @@
+"""
+Integração com o Apache Arrow (pyarrow).
+
+Uma função no estilo do pyarrow.compute: entra um array, sai um array.
+
+    >>> from numextenso.arrow import por_extenso_arrow
+    >>> por_extenso_arrow(pa.array([19.9, 5, 19.9, None]), modo="moeda")
+    <pyarrow.lib.DictionaryArray object at ...>
+    -- dictionary:
+      ["dezenove reais e noventa centavos", "cinco reais"]
+    -- indices:
+      [0, 1, 0, null]
+
+O array é codificado em dicionário (dictionary_encode), só os valores
+distintos são convertidos e o resultado é outro array de dicionário
+apontando pros textos. Tempo e memória crescem com a quantidade de
+valores diferentes, não de linhas. Nulos continuam nulos.
+
+O pyarrow só é importado aqui: "import numextenso" não carrega nada disso.
+"""
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    raise ImportError("numextenso.arrow precisa do pyarrow: pip install numextenso[arrow]") from None
+
+from .lote import _categorias
+
+
+def por_extenso_arrow(
+    valores,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    moeda: dict | str = None,
+):
+    """
+    Converte um array do Arrow, devolvendo um DictionaryArray de strings.
+
+    Parâmetros:
+        valores: pyarrow.Array ou ChunkedArray (inteiros, floats, decimais,
+            textos como "1.234,56" ou um array que já é de dicionário).
+            Qualquer outra sequência passa antes por pyarrow.array()
+        modo: "cardinal", "moeda" ou "ordinal"
+        feminino: Forma feminina ("duas mil", "segunda"); não vale pro modo "moeda"
+        moeda: Código ISO 4217 ou dicionário da moeda (só pro modo "moeda")
+
+    Retorna:
+        pyarrow.DictionaryArray (índices int32, dicionário de strings).
+        ChunkedArray é juntado num array só antes.
+    """
+    if isinstance(valores, pa.ChunkedArray):
+        valores = valores.combine_chunks()
+    elif not isinstance(valores, pa.Array):
+        valores = pa.array(valores)
+
+    if not pa.types.is_dictionary(valores.type):
+        valores = pc.dictionary_encode(valores)
+
+    dicionario = valores.dictionary
+    if pa.types.is_integer(dicionario.type) or pa.types.is_floating(dicionario.type):
+        # Sem nulos no dicionário: vira ndarray e cai no caminho vetorizado
+        unicos = dicionario.to_numpy(zero_copy_only=False)
+    else:
+        # Decimais viram decimal.Decimal (sem passar por float), textos viram str
+        unicos = dicionario.to_pylist()
+
+    categorias, posicoes = _categorias(unicos, modo, feminino, moeda)
+    indices = pc.take(pa.array(posicoes, pa.int32()), valores.indices)
+    return pa.DictionaryArray.from_arrays(indices, pa.array(categorias, pa.string()))
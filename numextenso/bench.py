@@ -0,0 +1,251 @@
+"""
+Suíte de benchmarks do numextenso.
+
+Roda cargas fixas (mesma semente, mesmos valores toda vez) em cada
+função pública e mede também o tempo de startup do CLI. O resultado
+sai em JSON, pra guardar e comparar duas versões.
+
+Uso:
+    python -m numextenso.bench                      # JSON no stdout
+    python -m numextenso.bench -o antes.json        # salva num arquivo
+    python -m numextenso.bench --comparar antes.json
+    python -m numextenso.bench --rapido             # menos repetições
+
+Não precisa de rede nem de nada além da biblioteca padrão.
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+from decimal import Decimal
+
+from . import (
+    __version__,
+    ler_centavos,
+    para_numero,
+    para_valor_moeda,
+    por_extenso,
+    por_extenso_centavos,
+    por_extenso_lote,
+    por_extenso_moeda,
+    por_extenso_ordinal,
+)
+from .conversor import MAX_VALOR
+from .utf8 import por_extenso_bytes
+
+SEMENTE = 42
+
+# Preços que dominam as vendas reais: a maioria das chamadas cai neles
+PRECOS_COMUNS = (9.90, 19.90, 99.90, 4.99, 49.90, 29.90, 199.90)
+
+
+def _cargas(tamanho: int) -> dict:
+    """Monta as cargas de trabalho: nome -> (função, lista de argumentos)."""
+    rng = random.Random(SEMENTE)
+
+    def sortear(funcao):
+        return [funcao() for _ in range(tamanho)]
+
+    moeda_assimetrica = sortear(
+        lambda: rng.choice(PRECOS_COMUNS) if rng.random() < 0.8
+        else rng.randrange(1_000_000) / 100
+    )
+    textos = [por_extenso(v) for v in sortear(lambda: rng.randrange(10**9))]
+    textos_moeda = [por_extenso_moeda(v) for v in moeda_assimetrica]
+
+    return {
+        "cardinal_pequenos": (por_extenso, sortear(lambda: rng.randrange(1000))),
+        "cardinal_milhares": (por_extenso, sortear(lambda: rng.randrange(1_000_000))),
+        "cardinal_feminino_milhares": (
+            lambda n: por_extenso(n, feminino=True), sortear(lambda: rng.randrange(1_000_000))
+        ),
+        "cardinal_trilhoes": (por_extenso, sortear(lambda: rng.randrange(10**15))),
+        "cardinal_perto_do_maximo": (
+            por_extenso, sortear(lambda: MAX_VALOR - rng.randrange(10**6))
+        ),
+        "cardinal_negativos": (por_extenso, sortear(lambda: -rng.randrange(1, 10**9))),
+        "moeda_precos_comuns": (por_extenso_moeda, moeda_assimetrica),
+        "moeda_decimal": (
+            por_extenso_moeda, [Decimal(str(v)) for v in moeda_assimetrica]
+        ),
+        "moeda_centavos": (
+            por_extenso_centavos, [round(v * 100) for v in moeda_assimetrica]
+        ),
+        "ordinal_1_a_1000": (por_extenso_ordinal, list(range(1, 1001))),
+        "ordinal_feminino_1_a_1000": (
+            lambda n: por_extenso_ordinal(n, feminino=True), list(range(1, 1001))
+        ),
+        "ordinal_milhares": (por_extenso_ordinal, sortear(lambda: rng.randrange(1, 10_000))),
+        "ordinal_milhoes": (por_extenso_ordinal, sortear(lambda: rng.randrange(1, 10**9))),
+        "leitura_centavos": (
+            ler_centavos, [f"R$ {v:_.2f}".replace(".", ",").replace("_", ".") for v in moeda_assimetrica]
+        ),
+        "reverso_cardinal": (para_numero, textos),
+        "reverso_moeda": (para_valor_moeda, textos_moeda),
+        "cardinal_bytes_milhares": (por_extenso_bytes, sortear(lambda: rng.randrange(1_000_000))),
+    }
+
+
+def _percentil(ordenados: list, p: float) -> float:
+    indice = min(len(ordenados) - 1, int(len(ordenados) * p))
+    return ordenados[indice]
+
+
+def medir(funcao, valores: list, repeticoes: int) -> dict:
+    """
+    Mede vazão e latência de funcao(v) pra cada v em valores.
+
+    A vazão vem de um loop sem nada no meio; a latência (p50/p99) de
+    chamadas cronometradas uma a uma.
+    """
+    # Aquecimento
+    for v in valores:
+        funcao(v)
+
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for v in valores:
+            funcao(v)
+        melhor = min(melhor, time.perf_counter() - inicio)
+
+    relogio = time.perf_counter_ns
+    latencias = []
+    for v in valores:
+        inicio = relogio()
+        funcao(v)
+        latencias.append(relogio() - inicio)
+    latencias.sort()
+
+    return {
+        "chamadas": len(valores),
+        "ops_por_segundo": round(len(valores) / melhor),
+        "p50_ns": _percentil(latencias, 0.50),
+        "p99_ns": _percentil(latencias, 0.99),
+    }
+
+
+def medir_lote(valores: list, repeticoes: int) -> dict:
+    """Mede por_extenso_lote() no lote inteiro (uma chamada = um lote)."""
+    duracoes = []
+    for _ in range(repeticoes + 1):
+        inicio = time.perf_counter_ns()
+        por_extenso_lote(valores, modo="moeda")
+        duracoes.append(time.perf_counter_ns() - inicio)
+    duracoes = sorted(duracoes[1:])  # a primeira é aquecimento
+
+    return {
+        "chamadas": len(valores),
+        "ops_por_segundo": round(len(valores) / (duracoes[0] / 1e9)),
+        "p50_ns": _percentil(duracoes, 0.50),
+        "p99_ns": _percentil(duracoes, 0.99),
+    }
+
+
+def _comando_cli() -> list:
+    """O script numextenso instalado, ou python -m numextenso.cli."""
+    script = shutil.which("numextenso")
+    if script:
+        return [script]
+    return [sys.executable, "-m", "numextenso.cli"]
+
+
+def medir_startup(execucoes: int) -> dict:
+    """Tempo de uma execução completa do CLI, do processo novo até a saída."""
+    comando = _comando_cli() + ["1234.56", "--moeda"]
+    duracoes = []
+    for _ in range(execucoes):
+        inicio = time.perf_counter_ns()
+        subprocess.run(comando, check=True, stdout=subprocess.DEVNULL)
+        duracoes.append(time.perf_counter_ns() - inicio)
+    duracoes.sort()
+
+    return {
+        "comando": " ".join(comando),
+        "execucoes": execucoes,
+        "p50_ms": round(_percentil(duracoes, 0.50) / 1e6, 2),
+        "p99_ms": round(_percentil(duracoes, 0.99) / 1e6, 2),
+    }
+
+
+def executar(rapido: bool = False, startup: bool = True) -> dict:
+    """Roda a suíte inteira e devolve o resultado (pronto pra virar JSON)."""
+    tamanho = 2_000 if rapido else 20_000
+    repeticoes = 2 if rapido else 5
+
+    definicoes = _cargas(tamanho)
+    cargas = {}
+    for nome, (funcao, valores) in definicoes.items():
+        cargas[nome] = medir(funcao, valores, repeticoes)
+    cargas["lote_moeda"] = medir_lote(definicoes["moeda_precos_comuns"][1], repeticoes)
+
+    resultado = {
+        "numextenso": __version__,
+        "python": platform.python_version(),
+        "implementacao": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "cargas": cargas,
+    }
+    if startup:
+        resultado["startup_cli"] = medir_startup(5 if rapido else 20)
+    return resultado
+
+
+def comparar(base: dict, atual: dict) -> str:
+    """Tabela com a variação de ops/s de cada carga entre duas rodadas."""
+    linhas = [f"{'carga':<28} {'ops/s antes':>12} {'ops/s agora':>12} {'variação':>9}"]
+    for nome, agora in atual["cargas"].items():
+        antes = base.get("cargas", {}).get(nome)
+        if antes is None:
+            linhas.append(f"{nome:<28} {'-':>12} {agora['ops_por_segundo']:>12,} {'novo':>9}")
+            continue
+        variacao = agora["ops_por_segundo"] / antes["ops_por_segundo"] - 1
+        linhas.append(
+            f"{nome:<28} {antes['ops_por_segundo']:>12,} "
+            f"{agora['ops_por_segundo']:>12,} {variacao:>+8.1%}"
+        )
+
+    if "startup_cli" in base and "startup_cli" in atual:
+        antes = base["startup_cli"]["p50_ms"]
+        agora = atual["startup_cli"]["p50_ms"]
+        linhas.append(f"{'startup_cli (p50 ms)':<28} {antes:>12} {agora:>12} {agora / antes - 1:>+8.1%}")
+    return "\n".join(linhas)
+
+
+def main(args: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m numextenso.bench",
+        description="Benchmarks do numextenso (resultado em JSON).",
+    )
+    parser.add_argument("-o", "--saida", metavar="ARQUIVO", help="Salva o JSON no arquivo")
+    parser.add_argument(
+        "--comparar", metavar="ARQUIVO",
+        help="Compara com o JSON de uma rodada anterior"
+    )
+    parser.add_argument("--rapido", action="store_true", help="Cargas menores, menos repetições")
+    parser.add_argument("--sem-startup", action="store_true", help="Pula a medição do CLI")
+    opts = parser.parse_args(args)
+
+    resultado = executar(rapido=opts.rapido, startup=not opts.sem_startup)
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+
+    if opts.saida:
+        with open(opts.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto + "\n")
+    elif not opts.comparar:
+        print(texto)
+
+    if opts.comparar:
+        with open(opts.comparar, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        print(comparar(base, resultado))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
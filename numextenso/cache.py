@@ -0,0 +1,166 @@
+"""
+Cache opcional de resultados (memoização com LRU).
+
+Em sistema de cobrança os mesmos valores aparecem o tempo todo
+(9,90, 19,90, 99,90...). Com o cache ligado, um valor repetido custa
+uma consulta num dicionário em vez de uma conversão inteira.
+
+Vem desligado. Pra ligar:
+
+    >>> from numextenso import cache
+    >>> cache.ativar(tamanho=4096)
+    >>> cache.cache_info()["moeda"]
+    CacheInfo(hits=0, misses=0, maxsize=4096, currsize=0)
+
+Cada modo tem o seu cache (cardinal, cardinal feminino, moeda, ordinal
+masculino e ordinal feminino). Na moeda a chave é o valor em centavos (int), não o
+float - 9.9 e 9.90000000001 viram a mesma chave, igual ao round() da
+conversão. Só a moeda padrão (BRL) passa pelo cache.
+
+Tudo aqui é thread-safe, e as threads não ficam todas esperando a mesma
+trava (ver CacheLRU), o que importa no Python sem GIL.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+MODOS_CACHE = (
+    "cardinal", "cardinal_feminino", "moeda", "ordinal_masculino", "ordinal_feminino",
+)
+
+TAMANHO_PADRAO = 4096
+
+# Pedaços de cada cache, cada um com a sua trava (ver CacheLRU). Primo:
+# hash(int) é o próprio número e preço quase sempre termina em 0 (990,
+# 1990...) - com 16 fatias, metade delas nunca seria usada
+FATIAS = 17
+
+# None = cache desligado. Quando ligado, dicionário modo -> CacheLRU.
+# O conversor só olha essa variável, então desligado custa um "is None".
+CACHES = None
+
+
+class _Fatia:
+    """Um pedaço do cache: LRU próprio, estatísticas e trava."""
+
+    __slots__ = ("dados", "trava", "maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int):
+        self.dados = OrderedDict()
+        self.trava = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+
+class CacheLRU:
+    """
+    Cache LRU com limite de tamanho, estatísticas e trava.
+
+    As chaves são divididas em FATIAS pedaços (pelo hash), cada um com a
+    sua trava. Com uma trava só, várias threads consultando o cache ao
+    mesmo tempo ficam numa fila - e no Python sem GIL (3.13t) isso vira
+    o gargalo. O "usado há mais tempo" que sai é o da fatia da chave nova.
+    """
+
+    __slots__ = ("_fatias", "_quantidade", "maxsize")
+
+    def __init__(self, maxsize: int):
+        quantidade = self._quantidade = min(FATIAS, maxsize)
+        # Divide o tamanho sem passar do total: as primeiras levam o resto
+        base, resto = divmod(maxsize, quantidade)
+        self._fatias = tuple(_Fatia(base + (i < resto)) for i in range(quantidade))
+        self.maxsize = maxsize
+
+    def obter(self, chave, funcao, *args):
+        """Devolve o valor da chave, calculando com funcao(*args) se faltar."""
+        fatia = self._fatias[hash(chave) % self._quantidade]
+        dados = fatia.dados
+        with fatia.trava:
+            try:
+                valor = dados[chave]
+            except KeyError:
+                fatia.misses += 1
+            else:
+                fatia.hits += 1
+                dados.move_to_end(chave)
+                return valor
+
+        # Calcula fora da trava pra não segurar as outras threads
+        valor = funcao(*args)
+
+        with fatia.trava:
+            dados[chave] = valor
+            if len(dados) > fatia.maxsize:
+                dados.popitem(last=False)  # tira o usado há mais tempo
+        return valor
+
+    def info(self) -> CacheInfo:
+        hits = misses = tamanho = 0
+        for fatia in self._fatias:
+            with fatia.trava:
+                hits += fatia.hits
+                misses += fatia.misses
+                tamanho += len(fatia.dados)
+        return CacheInfo(hits, misses, self.maxsize, tamanho)
+
+    def limpar(self) -> None:
+        for fatia in self._fatias:
+            with fatia.trava:
+                fatia.dados.clear()
+                fatia.hits = 0
+                fatia.misses = 0
+
+
+def ativar(tamanho: int = TAMANHO_PADRAO) -> None:
+    """
+    Liga o cache (ou recria, se já estava ligado).
+
+    O tamanho é repartido entre as FATIAS fatias de cada cache, e o LRU
+    vale por fatia: o que sai é o usado há mais tempo na fatia da chave
+    nova, não no cache todo. Com ativar(tamanho=17) cada fatia guarda um
+    resultado só - dois valores que caem na mesma fatia se expulsam,
+    mesmo com as outras vazias.
+
+    Parâmetros:
+        tamanho: Máximo de resultados guardados por modo (somando as fatias)
+    """
+    global CACHES
+    if tamanho < 1:
+        raise ValueError("O tamanho do cache precisa ser pelo menos 1")
+    CACHES = {modo: CacheLRU(tamanho) for modo in MODOS_CACHE}
+
+
+def desativar() -> None:
+    """Desliga o cache e descarta tudo que estava guardado."""
+    global CACHES
+    CACHES = None
+
+
+def ativo() -> bool:
+    """True se o cache está ligado."""
+    return CACHES is not None
+
+
+def cache_info() -> dict:
+    """
+    Estatísticas de cada cache, no formato do functools.lru_cache.
+
+    Retorna:
+        Dicionário modo -> CacheInfo(hits, misses, maxsize, currsize).
+        Vazio se o cache estiver desligado.
+    """
+    caches = CACHES
+    if caches is None:
+        return {}
+    return {modo: c.info() for modo, c in caches.items()}
+
+
+def cache_clear() -> None:
+    """Esvazia todos os caches e zera as estatísticas (continua ligado)."""
+    caches = CACHES
+    if caches is not None:
+        for c in caches.values():
+            c.limpar()
@@ -4,14 +4,38 @@ Interface de linha de comando (CLI) do numextenso.
 Uso:
     numextenso 1234              # Saída: mil duzentos e trinta e quatro
     numextenso 1234.56 --moeda   # Saída: mil duzentos e trinta e quatro reais...
+    numextenso "R$ 1.234,56" -m # mesma coisa, no formato brasileiro
     numextenso 5 --ordinal       # Saída: quinto
     numextenso 5 -o -f           # Saída: quinta (ordinal feminino)
+
+Modo fluxo (um número por linha, sem abrir um Python novo pra cada valor):
+    cat valores.txt | numextenso --stdin --moeda
+    numextenso -i valores.txt --erros marcar > extensos.txt
+    numextenso -i valores.txt --jobs 8 > extensos.txt
+    numextenso -i valores.txt --jobs 8 --threads > extensos.txt   # Python sem GIL
+    numextenso -i valores.txt --stats > extensos.txt   # métricas no stderr
+
+Servidor (um processo só atendendo vários programas por um socket Unix):
+    numextenso serve --socket /tmp/numextenso.sock
+    numextenso cliente --socket /tmp/numextenso.sock 99,90 --moeda
+
+Coluna de CSV (acrescenta a coluna por extenso, arquivo de qualquer tamanho):
+    numextenso csv --coluna valor --modo moeda entrada.csv saida.csv
+
+Tabela pré-calculada (mmap, compartilhada entre processos):
+    numextenso tabela compilar extensos.bin
+    numextenso tabela info extensos.bin
 """
 
 import argparse
+import io
 import sys
 
-from . import __version__, por_extenso, por_extenso_moeda, por_extenso_ordinal
+from . import __version__, metricas
+from .fluxo import ERROS, converter_linhas, converter_texto
+
+# Buffer de saída do modo fluxo (1 MiB): menos syscalls em arquivos grandes
+TAMANHO_BUFFER = 1 << 20
 
 
 def criar_parser() -> argparse.ArgumentParser:
@@ -22,14 +46,62 @@ def criar_parser() -> argparse.ArgumentParser:
         epilog="Exemplos:\n"
                "  numextenso 1234\n"
                "  numextenso 99.90 --moeda\n"
-               "  numextenso 3 --ordinal --feminino\n",
+               "  numextenso 3 --ordinal --feminino\n"
+               "  cat valores.txt | numextenso --stdin --moeda\n"
+               "\n"
+               "Subcomandos:\n"
+               "  numextenso serve --socket CAMINHO    sobe o servidor\n"
+               "  numextenso cliente --socket CAMINHO  usa o servidor\n"
+               "  numextenso csv --coluna NOME ENTRADA SAIDA\n"
+               "                                       converte uma coluna de CSV\n"
+               "  numextenso tabela compilar ARQUIVO   gera a tabela pra mmap\n",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
     parser.add_argument(
         "numero",
         type=str,
-        help="O número a ser convertido (use ponto pra decimal: 1234.56)"
+        nargs="?",
+        help="O número a ser convertido (1234, 1.234,56, R$ 99,90 ou 1234.56)"
+    )
+
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Lê um número por linha da entrada padrão"
+    )
+
+    parser.add_argument(
+        "-i", "--entrada",
+        metavar="ARQUIVO",
+        help="Lê um número por linha do arquivo"
+    )
+
+    parser.add_argument(
+        "--erros",
+        choices=ERROS,
+        default="abortar",
+        help="No modo fluxo, o que fazer com linhas inválidas (padrão: abortar)"
+    )
+
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="No modo fluxo, usa N processos (0 = um por núcleo; padrão: 1)"
+    )
+
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="Com --jobs, usa threads em vez de processos (compensa no Python sem GIL, 3.13t)"
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="No modo fluxo, mostra no stderr chamadas, erros e latência ao final"
     )
 
     parser.add_argument(
@@ -47,7 +119,7 @@ def criar_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-f", "--feminino",
         action="store_true",
-        help="Usa forma feminina do ordinal (primeira, segunda...)"
+        help="Usa a forma feminina (duas mil, duzentas; primeira, segunda...)"
     )
 
     parser.add_argument(
@@ -59,6 +131,108 @@ def criar_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _modo(opts: argparse.Namespace) -> str:
+    """Traduz as flags --ordinal/--moeda pro modo de conversão."""
+    if opts.ordinal:
+        return "ordinal"
+    if opts.moeda:
+        return "moeda"
+    return "cardinal"
+
+
+def _converter_fluxo(opts: argparse.Namespace) -> int:
+    """Modo fluxo: converte linha a linha da entrada pra saída padrão."""
+    erros_encontrados = 0
+
+    def avisar(numero_linha, erro):
+        nonlocal erros_encontrados
+        erros_encontrados += 1
+        print(f"Aviso: linha {numero_linha}: {erro}", file=sys.stderr)
+
+    if opts.entrada:
+        entrada = open(opts.entrada, encoding="utf-8")
+    else:
+        entrada = sys.stdin
+
+    saida = io.FileIO(sys.stdout.fileno(), "w", closefd=False)
+
+    try:
+        if opts.jobs == 1 and not opts.stats:
+            # Caminho direto em bytes: blocos de 1 MiB montados já em
+            # UTF-8, sem str nem TextIOWrapper (import tardio: as tabelas
+            # em bytes só valem a pena no modo fluxo)
+            from .utf8 import converter_linhas_bytes
+
+            for bloco in converter_linhas_bytes(
+                entrada,
+                modo=_modo(opts),
+                feminino=opts.feminino,
+                erros=opts.erros,
+                avisar=avisar,
+            ):
+                _escrever_tudo(saida, bloco)
+        else:
+            _escrever_texto(saida, opts, entrada, avisar)
+    except ValueError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+
+    if erros_encontrados:
+        print(f"{erros_encontrados} linha(s) com erro", file=sys.stderr)
+    return 0
+
+
+def _escrever_tudo(saida, bloco) -> None:
+    """write() cru pode escrever só um pedaço (pipe cheio): repete até o fim."""
+    visao = memoryview(bloco)
+    while visao:
+        visao = visao[saida.write(visao):]
+
+
+def _escrever_texto(saida, opts: argparse.Namespace, entrada, avisar) -> None:
+    """Modo fluxo com --jobs ou --stats: resultado em str, pelo TextIOWrapper."""
+    texto = io.TextIOWrapper(
+        io.BufferedWriter(saida, TAMANHO_BUFFER),
+        encoding="utf-8",
+        newline="\n",
+    )
+    try:
+        if opts.jobs == 1:
+            resultados = converter_linhas(
+                entrada,
+                modo=_modo(opts),
+                feminino=opts.feminino,
+                erros=opts.erros,
+                avisar=avisar,
+            )
+        else:
+            # Import tardio: multiprocessing sozinho custa dezenas de ms no
+            # startup, e a maioria das chamadas do CLI nem usa --jobs
+            from .paralelo import converter_linhas_paralelo
+
+            # Sem --threads, o padrão do paralelo: threads só no Python sem GIL
+            pool = "thread" if opts.threads else None
+
+            resultados = converter_linhas_paralelo(
+                entrada,
+                modo=_modo(opts),
+                feminino=opts.feminino,
+                erros=opts.erros,
+                avisar=avisar,
+                jobs=opts.jobs,
+                pool=pool,
+            )
+        for resultado in resultados:
+            texto.write(resultado)
+            texto.write("\n")
+    finally:
+        texto.flush()
+        texto.detach()
+
+
 def main(args: list = None) -> int:
     """
     Função principal do CLI.
@@ -66,37 +240,56 @@ def main(args: list = None) -> int:
     Retorna:
         0 em caso de sucesso, 1 em caso de erro
     """
-    parser = criar_parser()
-    opts = parser.parse_args(args)
+    if args is None:
+        args = sys.argv[1:]
 
-    try:
-        # Converte o input pra número
-        numero_str = opts.numero.replace(",", ".")  # aceita vírgula como decimal
+    # Subcomandos têm parser próprio. Import tardio: asyncio pesa no
+    # startup e só o servidor/cliente precisam dele
+    if args and args[0] in ("serve", "cliente"):
+        from . import servidor
 
-        if "." in numero_str:
-            numero = float(numero_str)
-        else:
-            numero = int(numero_str)
+        if args[0] == "serve":
+            return servidor.main_servir(args[1:])
+        return servidor.main_cliente(args[1:])
 
-        # Decide qual conversão usar
-        if opts.ordinal:
-            if isinstance(numero, float):
-                print("Erro: ordinais não suportam decimais", file=sys.stderr)
-                return 1
-            resultado = por_extenso_ordinal(numero, feminino=opts.feminino)
+    if args and args[0] == "csv":
+        from .planilha import main_csv
 
-        elif opts.moeda:
-            resultado = por_extenso_moeda(numero)
+        return main_csv(args[1:])
 
-        else:
-            if isinstance(numero, float) and numero != int(numero):
-                print(
-                    "Dica: use --moeda pra converter valores com centavos",
-                    file=sys.stderr
-                )
-                return 1
-            resultado = por_extenso(int(numero))
+    if args and args[0] == "tabela":
+        from .mapeada import main_tabela
 
+        return main_tabela(args[1:])
+
+    parser = criar_parser()
+    opts = parser.parse_args(args)
+
+    if opts.stdin or opts.entrada:
+        if opts.numero is not None:
+            parser.error("passe um número OU use --stdin/--entrada, não os dois")
+        if opts.stats and opts.jobs != 1 and not opts.threads:
+            # Com --jobs a conversão roda em outros processos, fora do coletor
+            parser.error("--stats não funciona junto com --jobs (só com --jobs --threads)")
+        if opts.stats:
+            metricas.ativar()
+        try:
+            return _converter_fluxo(opts)
+        except OSError as e:
+            print(f"Erro: {e}", file=sys.stderr)
+            return 1
+        finally:
+            if opts.stats:
+                print(metricas.resumo(), file=sys.stderr)
+                metricas.desativar()
+
+    if opts.numero is None:
+        parser.error("informe um número (ou use --stdin/--entrada)")
+    if opts.stats:
+        parser.error("--stats só vale no modo fluxo (--stdin/--entrada)")
+
+    try:
+        resultado = converter_texto(opts.numero, _modo(opts), opts.feminino)
         print(resultado)
         return 0
 
@@ -0,0 +1,168 @@
+"""
+Conversor pré-configurado: resolve a configuração uma vez só.
+
+As funções soltas (por_extenso_moeda, por_extenso_ordinal...) olham a
+configuração a cada chamada: se moeda é None, qual tabela de ordinais
+usar, moeda["inteiro_plural"]... Num loop quente isso pesa. O Conversor
+faz tudo isso no __init__ e guarda o resultado em slots, inclusive os
+textos de centavos já montados ("cinquenta centavos", " e um centavo"):
+
+    >>> real = Conversor("moeda")
+    >>> real(1234.56)
+    'mil duzentos e trinta e quatro reais e cinquenta e seis centavos'
+    >>> real.lote([1, 2.5])
+    ['um real', 'dois reais e cinquenta centavos']
+
+Valores "normais" (int/float positivos dentro do limite) vão direto pras
+tabelas; o resto (zero, negativos, Decimal, valores inválidos) passa pela
+função solta correspondente, então o resultado e os erros são sempre
+os mesmos dela.
+"""
+
+from .constantes import MOEDA_BRL
+from .conversor import (
+    MAX_VALOR,
+    _fator,
+    _resolver_moeda,
+    por_extenso,
+    por_extenso_moeda,
+    por_extenso_ordinal,
+)
+from .lote import MODOS, por_extenso_lote
+from .tabelas import (
+    ORDINAIS_PRE_CALCULADOS,
+    extenso_positivo,
+    extenso_positivo_feminino,
+    ordinais,
+    ordinal_positivo,
+)
+
+
+class Conversor:
+    """
+    Conversor com modo, moeda e gênero fixos.
+
+    Parâmetros:
+        modo: "cardinal", "moeda" ou "ordinal"
+        moeda: Código ISO 4217 ou dicionário da moeda (só pro modo "moeda",
+            padrão BRL)
+        feminino: Forma feminina ("duas mil", "segunda"); não vale pro
+            modo "moeda" (lá o gênero vem da moeda: "duas libras")
+
+    Conversor(modo) devolve uma instância da subclasse daquele modo, cada
+    uma com seu próprio __call__ - assim a chamada não passa por nenhum
+    if nem por uma função intermediária.
+    """
+
+    __slots__ = ("modo", "moeda", "feminino")
+
+    def __new__(cls, modo: str = "cardinal", moeda: dict | str = None, feminino: bool = False):
+        if cls is Conversor:
+            cls = _POR_MODO.get(modo, cls)
+        return object.__new__(cls)
+
+    def __init__(self, modo: str = "cardinal", moeda: dict | str = None, feminino: bool = False):
+        if modo not in MODOS:
+            raise ValueError(f"Modo inválido: {modo!r}. Use um de: {', '.join(MODOS)}")
+
+        self.modo = modo
+        self.moeda = _resolver_moeda(moeda)
+        self.feminino = feminino
+        self._compilar()
+
+    def _compilar(self) -> None:
+        """Pré-calcula o que o modo precisa (cada subclasse faz o seu)."""
+
+    def lote(self, valores) -> list:
+        """Converte vários valores de uma vez (ver por_extenso_lote)."""
+        return por_extenso_lote(valores, modo=self.modo, feminino=self.feminino, moeda=self.moeda)
+
+    def __repr__(self) -> str:
+        partes = [repr(self.modo)]
+        if self.modo == "moeda" and self.moeda is not MOEDA_BRL:
+            partes.append(f"moeda={self.moeda!r}")
+        if self.feminino:
+            partes.append("feminino=True")
+        return f"Conversor({', '.join(partes)})"
+
+
+class _ConversorCardinal(Conversor):
+    __slots__ = ("_extenso",)
+
+    def _compilar(self) -> None:
+        self._extenso = extenso_positivo_feminino if self.feminino else extenso_positivo
+
+    def __call__(self, numero) -> str:
+        if type(numero) is int and 0 < numero <= MAX_VALOR:
+            return self._extenso(numero)
+        return por_extenso(numero, feminino=self.feminino)
+
+
+class _ConversorOrdinal(Conversor):
+    __slots__ = ("_textos",)
+
+    def _compilar(self) -> None:
+        # A tabela de 1 a 9999 do gênero (índice 0 fica vazio)
+        self._textos = ordinais(self.feminino)
+
+    def __call__(self, numero) -> str:
+        if type(numero) is int and 0 < numero:
+            if numero < ORDINAIS_PRE_CALCULADOS:
+                return self._textos[numero]
+            if numero <= MAX_VALOR:
+                return ordinal_positivo(numero, self.feminino)
+        return por_extenso_ordinal(numero, feminino=self.feminino)
+
+
+class _ConversorMoeda(Conversor):
+    __slots__ = (
+        "_fator",
+        "_max_centavos",
+        "_extenso",
+        "_inteiro_singular",
+        "_inteiro_plural",
+        "_centavos",
+        "_e_centavos",
+    )
+
+    def _compilar(self) -> None:
+        moeda = self.moeda
+        fator = self._fator = _fator(moeda)
+        # Acima disso a parte inteira passa do limite
+        self._max_centavos = (MAX_VALOR + 1) * fator
+        # Moeda e fração concordam cada uma com o seu nome ("duas libras", "dois pence")
+        self._extenso = extenso_positivo_feminino if moeda.get("feminino") else extenso_positivo
+        extenso_centavos = extenso_positivo_feminino if moeda.get("decimal_feminino") else extenso_positivo
+        self._inteiro_singular = " " + moeda["inteiro_singular"]
+        self._inteiro_plural = " " + moeda["inteiro_plural"]
+
+        # _centavos[c] -> "cinquenta centavos" (c de 0 a fator - 1; zero vira "zero reais")
+        centavos = [f"zero {moeda['inteiro_plural']}"]
+        if fator > 1:
+            centavos.append(f"{extenso_centavos(1)} {moeda['decimal_singular']}")
+            centavos.extend(
+                f"{extenso_centavos(c)} {moeda['decimal_plural']}" for c in range(2, fator)
+            )
+        self._centavos = tuple(centavos)
+
+        # _e_centavos[c] -> " e cinquenta centavos", pra grudar depois dos inteiros
+        self._e_centavos = ("",) + tuple(" e " + texto for texto in centavos[1:])
+
+    def __call__(self, valor) -> str:
+        tipo = type(valor)
+        if (tipo is float or tipo is int) and valor >= 0:
+            valor_cents = round(valor * self._fator)
+            if valor_cents < self._max_centavos:
+                inteiros, centavos = divmod(valor_cents, self._fator)
+                if not inteiros:
+                    return self._centavos[centavos]
+                nome = self._inteiro_singular if inteiros == 1 else self._inteiro_plural
+                return self._extenso(inteiros) + nome + self._e_centavos[centavos]
+        return por_extenso_moeda(valor, self.moeda)
+
+
+_POR_MODO = {
+    "cardinal": _ConversorCardinal,
+    "moeda": _ConversorMoeda,
+    "ordinal": _ConversorOrdinal,
+}
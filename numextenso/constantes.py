@@ -2,8 +2,8 @@
 Aqui ficam todas as palavras usadas na conversão.
 
 Separei num arquivo próprio pra facilitar manutenção e deixar
-o código principal mais limpo. Se um dia precisar adicionar
-outra língua, é só criar outro arquivo de constantes.
+o código principal mais limpo. Essas são as palavras do pt_BR;
+as diferenças de outros locales (pt_PT...) ficam em locais/.
 """
 
 # Números de 0 a 19 (casos especiais do português)
@@ -28,46 +28,70 @@ CENTENAS = (
     "quinhentos", "seiscentos", "setecentos", "oitocentos", "novecentos"
 )
 
-# Classes numéricas (mil, milhão, bilhão, trilhão)
+# No feminino só mudam o 1, o 2 e as centenas de 200 a 900
+# ("duas mil", "duzentas e uma") - o resto é igual
+UNIDADES_FEMININO = ("zero", "uma", "duas") + UNIDADES[3:]
+CENTENAS_FEMININO = ("", "cento") + tuple(c[:-2] + "as" for c in CENTENAS[2:])
+
+# Classes numéricas a partir do milhão: raiz latina + "lhão"/"lhões"
+# Do 1 ao 9 as raízes são irregulares (mi-lhão, bi-lhão, tri-lhão...)
+RAIZES_CLASSES = (
+    "mi", "bi", "tri", "quatri", "quinti",
+    "sexti", "septi", "octi", "noni"
+)
+
+# Da 10ª classe em diante o nome é montado: prefixo da unidade + raiz da dezena
+# Ex: "un" + "deci" = undecilhão, "tre" + "viginti" = trevigintilhão
+PREFIXOS_UNIDADES = (
+    "", "un", "duo", "tre", "quator",
+    "quin", "sex", "sete", "octo", "nove"
+)
+RAIZES_DEZENAS = (
+    "", "deci", "viginti", "triginti", "quadraginti",
+    "quinquaginti", "sexaginti", "septuaginti", "octoginti", "nonaginti"
+)
+
+
+def _raizes_classes():
+    """Raízes de milhão até centilhão (10^303): "mi", "bi", ..., "centi"."""
+    raizes = list(RAIZES_CLASSES)
+    for dezena in RAIZES_DEZENAS[1:]:
+        raizes.extend(prefixo + dezena for prefixo in PREFIXOS_UNIDADES)
+    raizes.append("centi")
+    return raizes
+
+
+def _nomes_classes():
+    """Gera (singular, plural) de milhão até centilhão (10^303)."""
+    return tuple((raiz + "lhão", raiz + "lhões") for raiz in _raizes_classes())
+
+
+# Classes numéricas (mil, milhão, bilhão, trilhão...)
 # Cada tupla tem: (singular, plural)
 # A concordância muda: "um milhão" vs "dois milhões"
 CLASSES = (
     ("", ""),                      # unidades (sem nome)
     ("mil", "mil"),                # milhares (não muda no plural)
-    ("milhão", "milhões"),         # milhões
-    ("bilhão", "bilhões"),         # bilhões
-    ("trilhão", "trilhões"),       # trilhões
-)
+) + _nomes_classes()               # milhões, bilhões, ..., decilhões, ..., centilhões
 
-# Ordinais masculinos (1º, 2º, 3º...)
-ORDINAIS_MASCULINO = {
-    1: "primeiro", 2: "segundo", 3: "terceiro", 4: "quarto", 5: "quinto",
-    6: "sexto", 7: "sétimo", 8: "oitavo", 9: "nono", 10: "décimo",
-    11: "décimo primeiro", 12: "décimo segundo", 13: "décimo terceiro",
-    14: "décimo quarto", 15: "décimo quinto", 16: "décimo sexto",
-    17: "décimo sétimo", 18: "décimo oitavo", 19: "décimo nono",
-    20: "vigésimo", 30: "trigésimo", 40: "quadragésimo", 50: "quinquagésimo",
-    60: "sexagésimo", 70: "septuagésimo", 80: "octogésimo", 90: "nonagésimo",
-    100: "centésimo", 200: "ducentésimo", 300: "trecentésimo",
-    400: "quadringentésimo", 500: "quingentésimo", 600: "sexcentésimo",
-    700: "septingentésimo", 800: "octingentésimo", 900: "nongentésimo",
-    1000: "milésimo"
-}
+# Raízes dos ordinais: o gênero (e o plural) entra só no fim da palavra,
+# "primeir" + "o"/"a", "milésim" + "os"/"as". Uma tabela só pros dois gêneros.
+ORDINAIS_UNIDADES = (
+    "", "primeir", "segund", "terceir", "quart",
+    "quint", "sext", "sétim", "oitav", "non"
+)
+ORDINAIS_DEZENAS = (
+    "", "décim", "vigésim", "trigésim", "quadragésim",
+    "quinquagésim", "sexagésim", "septuagésim", "octogésim", "nonagésim"
+)
+ORDINAIS_CENTENAS = (
+    "", "centésim", "ducentésim", "trecentésim", "quadringentésim",
+    "quingentésim", "sexcentésim", "septingentésim", "octingentésim", "nongentésim"
+)
 
-# Ordinais femininos
-ORDINAIS_FEMININO = {
-    1: "primeira", 2: "segunda", 3: "terceira", 4: "quarta", 5: "quinta",
-    6: "sexta", 7: "sétima", 8: "oitava", 9: "nona", 10: "décima",
-    11: "décima primeira", 12: "décima segunda", 13: "décima terceira",
-    14: "décima quarta", 15: "décima quinta", 16: "décima sexta",
-    17: "décima sétima", 18: "décima oitava", 19: "décima nona",
-    20: "vigésima", 30: "trigésima", 40: "quadragésima", 50: "quinquagésima",
-    60: "sexagésima", 70: "septuagésima", 80: "octogésima", 90: "nonagésima",
-    100: "centésima", 200: "ducentésima", 300: "trecentésima",
-    400: "quadringentésima", 500: "quingentésima", 600: "sexcentésima",
-    700: "septingentésima", 800: "octingentésima", 900: "nongentésima",
-    1000: "milésima"
-}
+# Ordinais das classes: milésimo, milionésimo, bilionésimo... (mesmas raízes
+# dos nomes das classes, com "lionésim" no lugar de "lhão")
+ORDINAIS_CLASSES = ("", "milésim") + tuple(raiz + "lionésim" for raiz in _raizes_classes())
 
 # Moeda brasileira
 MOEDA_BRL = {
@@ -75,5 +99,8 @@ MOEDA_BRL = {
     "inteiro_plural": "reais",
     "decimal_singular": "centavo",
     "decimal_plural": "centavos",
-    "simbolo": "R$"
+    "simbolo": "R$",
+    "casas": 2,
+    "feminino": False,
+    "decimal_feminino": False,
 }
@@ -12,59 +12,32 @@ Exemplo: 1.234.567
 - Resultado: "um milhão, duzentos e trinta e quatro mil, quinhentos e sessenta e sete"
 """
 
-from .constantes import (
-    CENTENAS,
-    CLASSES,
-    DEZENAS,
-    MOEDA_BRL,
-    ORDINAIS_FEMININO,
-    ORDINAIS_MASCULINO,
-    UNIDADES,
-)
-
-
-def _converter_grupo(n: int) -> str:
-    """
-    Converte um número de 0 a 999 em extenso.
-
-    Essa é a função base - ela sabe lidar com centenas, dezenas e unidades.
-    Números maiores são quebrados em grupos de 3 dígitos e essa função
-    é chamada pra cada grupo.
-    """
-    if n == 0:
-        return ""
-
-    if n < 20:
-        return UNIDADES[n]
-
-    if n < 100:
-        dezena = n // 10
-        unidade = n % 10
-        if unidade == 0:
-            return DEZENAS[dezena]
-        return f"{DEZENAS[dezena]} e {UNIDADES[unidade]}"
+import sys
 
-    # Centenas
-    centena = n // 100
-    resto = n % 100
+from . import cache, metricas
+from .constantes import CLASSES, MOEDA_BRL
+from .tabelas import extenso_positivo, extenso_positivo_feminino, ordinal_positivo
 
-    # Caso especial: 100 é "cem", não "cento"
-    if n == 100:
-        return "cem"
+# Limite: o maior número com nome de classe (999... centilhões, 306 dígitos)
+MAX_VALOR = 1000 ** len(CLASSES) - 1
 
-    if resto == 0:
-        return CENTENAS[centena]
 
-    return f"{CENTENAS[centena]} e {_converter_grupo(resto)}"
-
-
-def por_extenso(numero: int | float, aceitar_decimal: bool = False) -> str:
+def por_extenso(
+    numero: int | float,
+    aceitar_decimal: bool = False,
+    feminino: bool = False,
+    locale: str = None,
+) -> str:
     """
     Converte um número inteiro em extenso.
 
     Parâmetros:
-        numero: O número a ser convertido (até trilhões)
+        numero: O número a ser convertido (até centilhões, 306 dígitos)
         aceitar_decimal: Se True, trunca decimais; se False, levanta erro
+        feminino: Se True, concorda com palavra feminina ("duas mil
+            pessoas", "duzentas toneladas"); milhão, bilhão... continuam
+            masculinos ("dois milhões")
+        locale: "pt_BR" (padrão) ou "pt_PT" (escala longa, "dezasseis")
 
     Retorna:
         String com o número por extenso
@@ -78,7 +51,25 @@ def por_extenso(numero: int | float, aceitar_decimal: bool = False) -> str:
         'mil e um'
         >>> por_extenso(1000000)
         'um milhão'
+        >>> por_extenso(10**33)
+        'um decilhão'
+        >>> por_extenso(2201, feminino=True)
+        'duas mil, duzentas e uma'
+        >>> por_extenso(2_000_000_000, locale="pt_PT")
+        'dois mil milhões'
     """
+    coletor = metricas.COLETOR
+    if coletor is not None:
+        return coletor.medir(
+            "por_extenso", _por_extenso, numero, aceitar_decimal, feminino, locale
+        )
+    return _por_extenso(numero, aceitar_decimal, feminino, locale)
+
+
+def _por_extenso(
+    numero: int | float, aceitar_decimal: bool, feminino: bool = False, locale: str = None
+) -> str:
+    """Miolo de por_extenso() - sem métricas, é o que as recursões chamam."""
     # Validação de tipo
     if not isinstance(numero, (int, float)):
         raise TypeError(f"Esperava int ou float, recebi {type(numero).__name__}")
@@ -92,88 +83,68 @@ def por_extenso(numero: int | float, aceitar_decimal: bool = False) -> str:
             )
         numero = int(numero)
 
+    if locale is not None:
+        return _por_extenso_no_locale(numero, feminino, locale)
+
     # Números negativos
     if numero < 0:
-        return f"menos {por_extenso(abs(numero))}"
+        return f"menos {_por_extenso(abs(numero), False, feminino)}"
 
     # Zero é caso especial
     if numero == 0:
         return "zero"
 
-    # Limite: trilhões
-    max_valor = 999_999_999_999_999
-    if numero > max_valor:
-        raise ValueError(f"Número muito grande. Máximo suportado: {max_valor:,}")
+    if numero > MAX_VALOR:
+        raise _erro_muito_grande()
 
-    # Quebra em grupos de 3 dígitos (da direita pra esquerda)
-    grupos = []
-    temp = numero
-    while temp > 0:
-        grupos.append(temp % 1000)
-        temp //= 1000
+    # Grupos e classes já vêm prontos das tabelas (ver tabelas.py)
+    converter = extenso_positivo_feminino if feminino else extenso_positivo
 
-    # Converte cada grupo e adiciona a classe
-    partes = []
-    for i, grupo in enumerate(grupos):
-        if grupo == 0:
-            continue
-
-        texto_grupo = _converter_grupo(grupo)
-        nome_classe = CLASSES[i]
-
-        # Adiciona nome da classe (mil, milhão, etc)
-        if i > 0:  # Não adiciona nada pras unidades
-            # Concordância especial pro português:
-            # - "mil" (sem "um" na frente)
-            # - "um milhão", "dois milhões" (com número e concordância)
-            if i == 1:  # milhares
-                if grupo == 1:
-                    texto_grupo = "mil"  # "um mil" -> "mil"
-                else:
-                    texto_grupo += " mil"
-            else:  # milhões, bilhões, trilhões
-                plural = grupo > 1
-                if grupo == 1:
-                    texto_grupo = "um " + nome_classe[0]  # "um milhão"
-                else:
-                    texto_grupo += " " + nome_classe[1 if plural else 0]
-
-        partes.append((texto_grupo, grupo))
-
-    # Junta as partes com conectivos apropriados
-    partes.reverse()
-    grupos.reverse()
-
-    if len(partes) == 1:
-        return partes[0][0]
-
-    resultado = []
-    for i, (texto, valor) in enumerate(partes):
-        resultado.append(texto)
-
-        # Decide se usa vírgula, "e" ou espaço
-        if i < len(partes) - 1:
-            prox_valor = partes[i + 1][1]
-            # Usa "e" se o próximo é < 100 ou centena exata (100, 200, etc)
-            if prox_valor < 100 or prox_valor % 100 == 0:
-                resultado.append(" e ")
-            # Se o grupo atual é só "mil" (1000) e próximo tem centenas com resto,
-            # usa só espaço (não vírgula)
-            elif valor == 1 and texto == "mil":
-                resultado.append(" ")
-            else:
-                resultado.append(", ")
-
-    return "".join(resultado)
-
-
-def por_extenso_moeda(valor: float | int, moeda: dict = None) -> str:
+    caches = cache.CACHES
+    if caches is not None:
+        modo = "cardinal_feminino" if feminino else "cardinal"
+        return caches[modo].obter(numero, converter, numero)
+
+    return converter(numero)
+
+
+def _por_extenso_no_locale(numero: int, feminino: bool, locale: str) -> str:
+    """Inteiro (já validado o tipo) no locale pedido, carregado só no primeiro uso."""
+    # Import tardio: quem só usa pt_BR nunca importa o pacote de locales
+    from .locais import carregar
+
+    pacote = carregar(locale)
+    absoluto = -numero if numero < 0 else numero
+    if absoluto == 0:
+        return "zero"
+    if absoluto > pacote.MAX_VALOR:
+        raise _erro_muito_grande(pacote.MAX_VALOR, pacote.MAIOR_CLASSE)
+
+    if feminino:
+        texto = pacote.extenso_positivo_feminino(absoluto)
+    else:
+        texto = pacote.extenso_positivo(absoluto)
+    return "menos " + texto if numero < 0 else texto
+
+
+def _erro_muito_grande(max_valor: int = MAX_VALOR, maior_classe: str = CLASSES[-1][1]) -> ValueError:
+    """Erro padrão pra números acima de MAX_VALOR (ou do máximo do locale)."""
+    return ValueError(
+        f"Número muito grande. Máximo suportado: {len(str(max_valor))} dígitos "
+        f"(até {maior_classe})"
+    )
+
+
+def por_extenso_moeda(valor: float | int, moeda: dict | str = None) -> str:
     """
     Converte um valor monetário em extenso.
 
     Parâmetros:
-        valor: O valor a ser convertido (ex: 1234.56)
-        moeda: Dicionário com nomes da moeda (opcional, padrão é BRL)
+        valor: O valor a ser convertido (ex: 1234.56). Aceita int, float
+            ou decimal.Decimal - Decimal não passa por float, então não
+            perde precisão em valores grandes.
+        moeda: Código ISO 4217 ("USD", "EUR"...) ou dicionário com os
+            nomes da moeda (opcional, padrão é BRL)
 
     Retorna:
         String com o valor por extenso
@@ -185,33 +156,171 @@ def por_extenso_moeda(valor: float | int, moeda: dict = None) -> str:
         'mil duzentos e trinta e quatro reais e cinquenta e seis centavos'
         >>> por_extenso_moeda(0.01)
         'um centavo'
+        >>> por_extenso_moeda(Decimal("19.90"))
+        'dezenove reais e noventa centavos'
+        >>> por_extenso_moeda(2.5, moeda="USD")
+        'dois dólares e cinquenta centavos'
     """
+    coletor = metricas.COLETOR
+    if coletor is not None:
+        return coletor.medir("por_extenso_moeda", _por_extenso_moeda, valor, moeda)
+    return _por_extenso_moeda(valor, moeda)
+
+
+def _por_extenso_moeda(valor, moeda) -> str:
+    """Miolo de por_extenso_moeda() - sem métricas, é o que as recursões chamam."""
+    # O real (padrão) não precisa consultar o registro de moedas
     if moeda is None:
-        moeda = MOEDA_BRL
+        moeda, fator = MOEDA_BRL, 100
+    else:
+        moeda = _resolver_moeda(moeda)
+        fator = _fator(moeda)
 
-    if not isinstance(valor, (int, float)):
+    if not isinstance(valor, (int, float)) and not _eh_decimal(valor):
         raise TypeError(f"Esperava int ou float, recebi {type(valor).__name__}")
 
-    if valor < 0:
-        return f"menos {por_extenso_moeda(abs(valor), moeda)}"
+    if isinstance(valor, (int, float)):
+        if valor < 0:
+            return f"menos {_por_extenso_moeda(-valor, moeda)}"
+        # Usa round pra evitar problemas de ponto flutuante (0.1 + 0.2 = 0.30000000004)
+        valor_cents = round(valor * fator)
+    else:
+        valor_cents = _centavos_decimal(valor, moeda.get("casas", 2))
+        if valor < 0:
+            return f"menos {_moeda_validada(valor_cents, moeda, fator)}"
+    return _moeda_validada(valor_cents, moeda, fator)
+
+
+def por_extenso_centavos(centavos: int, moeda: dict | str = None) -> str:
+    """
+    Converte um valor monetário já em centavos (inteiro) em extenso.
+
+    É o caminho mais rápido pra quem guarda dinheiro como inteiro:
+    não passa por float nem por arredondamento. Em moedas com outro
+    número de casas, o valor vem na menor unidade delas (fils no dinar
+    kuwaitiano, o próprio guarani no PYG).
+
+    Parâmetros:
+        centavos: O valor em centavos (ex: 123456 pra R$ 1.234,56)
+        moeda: Código ISO 4217 ou dicionário com nomes da moeda (padrão é BRL)
+
+    Retorna:
+        String com o valor por extenso
+
+    Exemplos:
+        >>> por_extenso_centavos(123456)
+        'mil duzentos e trinta e quatro reais e cinquenta e seis centavos'
+        >>> por_extenso_centavos(1)
+        'um centavo'
+    """
+    coletor = metricas.COLETOR
+    if coletor is not None:
+        return coletor.medir("por_extenso_centavos", _por_extenso_centavos, centavos, moeda)
+    return _por_extenso_centavos(centavos, moeda)
+
 
+def _por_extenso_centavos(centavos, moeda) -> str:
+    """Miolo de por_extenso_centavos() - sem métricas, é o que as recursões chamam."""
+    moeda = _resolver_moeda(moeda)
+
+    if not isinstance(centavos, int):
+        raise TypeError(f"Esperava int (centavos), recebi {type(centavos).__name__}")
+
+    if centavos < 0:
+        return f"menos {_por_extenso_centavos(-centavos, moeda)}"
+
+    return _moeda_validada(centavos, moeda, _fator(moeda))
+
+
+def _eh_decimal(valor) -> bool:
+    """True se valor é decimal.Decimal (sem importar o módulo decimal à toa)."""
+    decimal = sys.modules.get("decimal")
+    return decimal is not None and isinstance(valor, decimal.Decimal)
+
+
+def _centavos_decimal(valor, casas: int) -> int:
+    """
+    |valor| (Decimal) na menor unidade da moeda, arredondando meio pro par.
+
+    Conta exata: valor * 100, abs() e companhia arredondam pro contexto
+    do decimal (28 dígitos), o que comia os centavos - e parte dos
+    inteiros - de valores grandes sem avisar.
+    """
+    decimal = sys.modules["decimal"]
+    with decimal.localcontext() as contexto:
+        contexto.prec = max(contexto.prec, len(valor.as_tuple().digits) + 2)
+        return int(valor.copy_abs().scaleb(casas).to_integral_value(decimal.ROUND_HALF_EVEN))
+
+
+# 10 ** casas, pras casas decimais que existem no ISO 4217 (0 a 4)
+_FATORES = (1, 10, 100, 1000, 10000)
+
+
+def _resolver_moeda(moeda) -> dict:
+    """None vira o real; um código ("USD") vira a moeda registrada."""
+    if moeda is None:
+        return MOEDA_BRL
+    if isinstance(moeda, str):
+        # Import tardio: o registro de moedas só carrega se alguém usar
+        from .moedas import obter_moeda
+
+        return obter_moeda(moeda)
+    if not isinstance(moeda, dict):
+        raise TypeError(f"moeda precisa ser um código (str) ou dict, recebi {type(moeda).__name__}")
+    # Dicionário montado na mão não passou pelo criar_moeda(): confere as
+    # casas aqui (mesma regra do CASAS_VALIDAS), senão _FATORES[casas]
+    # estoura IndexError - ou, com -1, pega o fator errado calado
+    casas = moeda.get("casas", 2)
+    if type(casas) is not int or not 0 <= casas < len(_FATORES):
+        raise ValueError(f"casas precisa ser um int de 0 a 4, recebi {casas!r}")
+    return moeda
+
+
+def _fator(moeda: dict) -> int:
+    """Quantas unidades menores (centavos) cabem numa unidade da moeda."""
+    return _FATORES[moeda.get("casas", 2)]
+
+
+def _moeda_validada(valor_cents: int, moeda: dict, fator: int = 100) -> str:
+    """Confere o limite, passa pelo cache (se ligado) e monta o texto."""
+    if valor_cents // fator > MAX_VALOR:
+        raise _erro_muito_grande()
+
+    # Chave do cache é o valor em centavos (int), nunca o float
+    caches = cache.CACHES
+    if caches is not None and moeda is MOEDA_BRL:
+        return caches["moeda"].obter(valor_cents, _moeda_de_centavos, valor_cents, moeda)
+
+    return _moeda_de_centavos(valor_cents, moeda, fator)
+
+
+def _moeda_de_centavos(valor_cents: int, moeda: dict, fator: int = 100) -> str:
+    """
+    Monta o texto de um valor monetário já em centavos (int >= 0).
+
+    Não valida nada - é o miolo de por_extenso_moeda(), reaproveitado
+    pelas conversões em lote. `fator` é 10 ** casas da moeda.
+    """
     # Separa inteiros e centavos
-    # Usa round pra evitar problemas de ponto flutuante (0.1 + 0.2 = 0.30000000004)
-    valor_cents = round(valor * 100)
-    inteiros = valor_cents // 100
-    centavos = valor_cents % 100
+    inteiros, centavos = divmod(valor_cents, fator)
 
     partes = []
 
-    # Parte inteira
+    # Parte inteira ("duas libras": o número concorda com o nome da moeda)
     if inteiros > 0:
-        texto_inteiro = por_extenso(inteiros)
+        if moeda.get("feminino"):
+            texto_inteiro = extenso_positivo_feminino(inteiros)
+        else:
+            texto_inteiro = extenso_positivo(inteiros)
         nome_moeda = moeda["inteiro_plural"] if inteiros > 1 else moeda["inteiro_singular"]
         partes.append(f"{texto_inteiro} {nome_moeda}")
 
     # Centavos
     if centavos > 0:
-        texto_centavos = por_extenso(centavos)
+        if moeda.get("decimal_feminino"):
+            texto_centavos = extenso_positivo_feminino(centavos)
+        else:
+            texto_centavos = extenso_positivo(centavos)
         nome_centavos = moeda["decimal_plural"] if centavos > 1 else moeda["decimal_singular"]
         partes.append(f"{texto_centavos} {nome_centavos}")
 
@@ -226,7 +335,7 @@ def por_extenso_ordinal(numero: int, feminino: bool = False) -> str:
     Converte um número em ordinal por extenso.
 
     Parâmetros:
-        numero: O número a ser convertido (1-1000)
+        numero: O número a ser convertido (de 1 até centilionésimo, 306 dígitos)
         feminino: Se True, usa forma feminina (primeira, segunda...)
 
     Retorna:
@@ -239,36 +348,31 @@ def por_extenso_ordinal(numero: int, feminino: bool = False) -> str:
         'primeira'
         >>> por_extenso_ordinal(42)
         'quadragésimo segundo'
+        >>> por_extenso_ordinal(1234)
+        'milésimo ducentésimo trigésimo quarto'
+        >>> por_extenso_ordinal(2_000_000)
+        'dois milionésimos'
     """
-    if not isinstance(numero, int):
-        raise TypeError(f"Ordinais só funcionam com inteiros, recebi {type(numero).__name__}")
-
-    if numero < 1 or numero > 1000:
-        raise ValueError("Ordinais suportados de 1 a 1000")
-
-    tabela = ORDINAIS_FEMININO if feminino else ORDINAIS_MASCULINO
+    coletor = metricas.COLETOR
+    if coletor is not None:
+        return coletor.medir("por_extenso_ordinal", _por_extenso_ordinal, numero, feminino)
+    return _por_extenso_ordinal(numero, feminino)
 
-    # Caso direto na tabela
-    if numero in tabela:
-        return tabela[numero]
 
-    # Decompõe o número
-    partes = []
-
-    # Centenas
-    if numero >= 100:
-        centena = (numero // 100) * 100
-        partes.append(tabela[centena])
-        numero = numero % 100
+def _por_extenso_ordinal(numero, feminino: bool) -> str:
+    """Miolo de por_extenso_ordinal() - sem métricas."""
+    if not isinstance(numero, int):
+        raise TypeError(f"Ordinais só funcionam com inteiros, recebi {type(numero).__name__}")
 
-    # Dezenas
-    if numero >= 20:
-        dezena = (numero // 10) * 10
-        partes.append(tabela[dezena])
-        numero = numero % 10
+    if numero < 1:
+        raise ValueError("Ordinais começam no 1")
+    if numero > MAX_VALOR:
+        raise _erro_muito_grande()
 
-    # Unidades (ou 11-19)
-    if numero > 0:
-        partes.append(tabela[numero])
+    feminino = bool(feminino)
+    caches = cache.CACHES
+    if caches is not None:
+        modo = "ordinal_feminino" if feminino else "ordinal_masculino"
+        return caches[modo].obter(numero, ordinal_positivo, numero, feminino)
 
-    return " ".join(partes)
+    return ordinal_positivo(numero, feminino)
@@ -0,0 +1,160 @@
+"""
+Conversão em fluxo: texto entra, extenso sai, uma linha por vez.
+
+É o que o CLI usa no modo --stdin/--entrada. Tudo aqui é gerador, então
+dá pra passar um arquivo de 50 milhões de linhas que a memória fica
+do mesmo tamanho do começo ao fim.
+"""
+
+from . import metricas
+from .conversor import (
+    _por_extenso,
+    _por_extenso_centavos,
+    _por_extenso_ordinal,
+    por_extenso,
+    por_extenso_moeda,
+    por_extenso_ordinal,
+)
+from .leitura import ler_centavos, ler_partes
+from .lote import MODOS
+
+# O que fazer quando uma linha não dá pra converter
+ERROS = ("abortar", "pular", "marcar")
+
+
+def ler_numero(texto: str) -> int | float:
+    """
+    Converte o texto digitado pelo usuário em int ou float.
+
+    Usa as regras de leitura.py ("1.234,56", "R$ 9,90", "1234.56").
+    Sem casas decimais vira int, senão float. Pra dinheiro prefira
+    leitura.ler_centavos(), que não passa por float.
+    """
+    negativo, inteiro, fracao = ler_partes(texto)
+    numero = float(f"{inteiro}.{fracao}") if fracao else inteiro
+    return -numero if negativo else numero
+
+
+def converter_texto(texto: str, modo: str = "cardinal", feminino: bool = False) -> str:
+    """
+    Lê um número em texto e converte no modo pedido.
+
+    Parâmetros:
+        texto: O número como o usuário escreveu ("1234", "1.234,56", "R$ 99,90"...)
+        modo: "cardinal", "moeda" ou "ordinal"
+        feminino: Forma feminina ("duas mil", "segunda"); não vale pro modo "moeda"
+
+    Retorna:
+        String com o número por extenso
+
+    Levanta ValueError se o texto não for um número válido pro modo.
+    """
+    coletor = metricas.COLETOR
+    if coletor is not None:
+        return coletor.medir("converter_texto", _converter_texto, texto, modo, feminino)
+    return _converter_texto(texto, modo, feminino)
+
+
+def ler_texto(texto: str, modo: str) -> int:
+    """
+    Lê o texto como converter_texto() lê, sem converter.
+
+    Retorna o int que vai ser escrito por extenso: centavos no modo
+    "moeda", o próprio número nos outros. Levanta os mesmos erros.
+    """
+    # Dinheiro vai do texto direto pra centavos, sem float no meio
+    if modo == "moeda":
+        return ler_centavos(texto)
+
+    negativo, numero, fracao = ler_partes(texto)
+    if fracao.strip("0"):
+        if modo == "ordinal":
+            raise ValueError("ordinais não suportam decimais")
+        raise ValueError("use --moeda pra converter valores com centavos")
+    return -numero if negativo else numero
+
+
+def _converter_texto(texto: str, modo: str, feminino: bool) -> str:
+    """Miolo de converter_texto() - sem métricas."""
+    # Os miolos, sem métricas: a linha já conta como um converter_texto
+    numero = ler_texto(texto, modo)
+    if modo == "moeda":
+        return _por_extenso_centavos(numero, None)
+    if modo == "ordinal":
+        return _por_extenso_ordinal(numero, feminino)
+    return _por_extenso(numero, False, feminino)
+
+
+def converter_numero(numero, modo: str = "cardinal", feminino: bool = False) -> str:
+    """
+    Mesmo que converter_texto(), pra um número que já veio como int/float
+    (de um JSON, por exemplo) - sem passar pelo leitor de texto.
+    """
+    if isinstance(numero, bool) or not isinstance(numero, (int, float)):
+        raise TypeError(f"Esperava número ou texto, recebi {type(numero).__name__}")
+
+    if modo == "ordinal":
+        if isinstance(numero, float):
+            raise ValueError("ordinais não suportam decimais")
+        return por_extenso_ordinal(numero, feminino=feminino)
+
+    if modo == "moeda":
+        return por_extenso_moeda(numero)
+
+    if isinstance(numero, float) and numero != int(numero):
+        raise ValueError("use --moeda pra converter valores com centavos")
+    return por_extenso(int(numero), feminino=feminino)
+
+
+def validar_opcoes(modo: str, erros: str) -> None:
+    """Confere modo e tratamento de erro antes de começar a ler a entrada."""
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: {modo!r}. Use um de: {', '.join(MODOS)}")
+    if erros not in ERROS:
+        raise ValueError(f"Tratamento de erro inválido: {erros!r}. Use um de: {', '.join(ERROS)}")
+
+
+def converter_linhas(
+    linhas,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    erros: str = "abortar",
+    avisar=None,
+    primeira_linha: int = 1,
+):
+    """
+    Gerador que converte cada linha de um iterável de texto.
+
+    Parâmetros:
+        linhas: Iterável de strings (um arquivo aberto serve)
+        modo: "cardinal", "moeda" ou "ordinal"
+        feminino: Forma feminina ("duas mil", "segunda"); não vale pro modo "moeda"
+        erros: O que fazer com linhas inválidas:
+            "abortar" levanta ValueError na primeira linha ruim,
+            "pular" ignora a linha,
+            "marcar" gera "ERRO: <motivo>" no lugar do resultado
+        avisar: Função opcional chamada como avisar(numero_linha, erro)
+            pra cada linha pulada ou marcada
+        primeira_linha: Número da primeira linha nas mensagens de erro
+            (útil quando o iterável é só um pedaço do arquivo)
+
+    Gera:
+        Uma string por linha convertida (sem o "\\n"). Linhas em branco
+        são ignoradas.
+    """
+    validar_opcoes(modo, erros)
+
+    for numero_linha, linha in enumerate(linhas, primeira_linha):
+        texto = linha.strip()
+        if not texto:
+            continue
+
+        try:
+            yield converter_texto(texto, modo, feminino)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            if erros == "abortar":
+                raise ValueError(f"linha {numero_linha}: {e}") from e
+            if avisar is not None:
+                avisar(numero_linha, e)
+            if erros == "marcar":
+                yield f"ERRO: {e}"
@@ -4,23 +4,94 @@ Interface gráfica do numextenso.
 Uma GUI moderna usando CustomTkinter pra converter números em extenso
 sem precisar abrir o terminal.
 
+Duas abas:
+    - "Um número": converte enquanto você digita (com um pequeno atraso,
+      pra não converter a cada tecla)
+    - "Vários números": cola uma coluna inteira de planilha, converte numa
+      thread separada em pedaços (a janela não trava), com progresso,
+      cancelar e exportar tudo pro clipboard ou pra um arquivo
+
 Uso:
     pip install numextenso[gui]
     python -m numextenso.gui
 """
 
+import queue
+import threading
+
 try:
     import customtkinter as ctk
 except ImportError:
     print("Pra usar a GUI, instale: pip install numextenso[gui]")
     exit(1)
 
-from . import por_extenso, por_extenso_moeda, por_extenso_ordinal
+from tkinter import filedialog
+
+from .fluxo import converter_texto
+from .lote import por_extenso_lote
 
 # Configuração do tema
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Espera depois da última tecla antes de converter (ms)
+ATRASO_DIGITACAO = 250
+
+# Linhas convertidas por vez na aba "Vários números"
+TAMANHO_PEDACO = 2000
+
+# De quanto em quanto tempo a janela confere o andamento da conversão (ms)
+INTERVALO_PROGRESSO = 50
+
+
+def converter_bloco(linhas: list, modo: str, feminino: bool) -> list:
+    """
+    Converte um pedaço da colagem: um resultado por linha, na mesma ordem.
+
+    Linha em branco vira resultado vazio e linha inválida vira "ERRO:
+    <motivo>", pra saída continuar alinhada com a coluna colada. Não mexe
+    em nada do Tk, então roda em qualquer thread.
+    """
+    textos = [linha.strip() for linha in linhas]
+    preenchidos = [texto for texto in textos if texto]
+
+    # Caso comum (tudo válido): um lote só, que lê e converte tudo de uma vez
+    try:
+        convertidos = iter(por_extenso_lote(preenchidos, modo=modo, feminino=feminino))
+    except (ValueError, TypeError, ArithmeticError):
+        convertidos = None
+
+    resultados = []
+    for texto in textos:
+        if not texto:
+            resultados.append("")
+        elif convertidos is not None:
+            resultados.append(next(convertidos))
+        else:
+            try:
+                resultados.append(converter_texto(texto, modo, feminino))
+            except (ValueError, TypeError, ArithmeticError) as e:
+                resultados.append(f"ERRO: {e}")
+    return resultados
+
+
+def _converter_em_pedacos(linhas: list, modo: str, feminino: bool, fila, cancelar) -> None:
+    """
+    Corpo da thread da aba "Vários números".
+
+    Manda pra fila ("pedaco", resultados) a cada TAMANHO_PEDACO linhas e
+    ("fim", None) no final - ou ("cancelado", None) / ("erro", e).
+    """
+    try:
+        for inicio in range(0, len(linhas), TAMANHO_PEDACO):
+            if cancelar.is_set():
+                fila.put(("cancelado", None))
+                return
+            fila.put(("pedaco", converter_bloco(linhas[inicio:inicio + TAMANHO_PEDACO], modo, feminino)))
+        fila.put(("fim", None))
+    except Exception as e:
+        fila.put(("erro", e))
+
 
 class NumExtensoApp(ctk.CTk):
     """Janela principal da aplicação."""
@@ -30,12 +101,19 @@ class NumExtensoApp(ctk.CTk):
 
         # Configuração da janela
         self.title("numextenso")
-        self.geometry("600x500")
-        self.minsize(500, 400)
+        self.geometry("700x640")
+        self.minsize(560, 520)
 
         # Grid principal
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(3, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        # Conversão ao vivo agendada (id do after) e conversão em massa
+        # em andamento: (thread, evento de cancelar, fila)
+        self._conversao_agendada = None
+        self._lote = None
+        self._resultados_lote = []
+        self._total_lote = 0
 
         self._criar_widgets()
 
@@ -61,30 +139,9 @@ class NumExtensoApp(ctk.CTk):
         )
         subtitulo.pack(anchor="w")
 
-        # === Input ===
-        input_frame = ctk.CTkFrame(self)
-        input_frame.grid(row=1, column=0, padx=20, pady=10, sticky="ew")
-        input_frame.grid_columnconfigure(0, weight=1)
-
-        input_label = ctk.CTkLabel(
-            input_frame,
-            text="Digite o número:",
-            font=ctk.CTkFont(size=14, weight="bold")
-        )
-        input_label.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="w")
-
-        self.entrada = ctk.CTkEntry(
-            input_frame,
-            placeholder_text="Ex: 1234.56",
-            font=ctk.CTkFont(size=16),
-            height=45
-        )
-        self.entrada.grid(row=1, column=0, padx=15, pady=(0, 15), sticky="ew")
-        self.entrada.bind("<Return>", lambda e: self._converter())
-
-        # === Opções ===
+        # === Opções (valem pras duas abas) ===
         opcoes_frame = ctk.CTkFrame(self)
-        opcoes_frame.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
+        opcoes_frame.grid(row=1, column=0, padx=20, pady=10, sticky="ew")
 
         opcoes_label = ctk.CTkLabel(
             opcoes_frame,
@@ -104,7 +161,8 @@ class NumExtensoApp(ctk.CTk):
             text="Cardinal (quarenta e dois)",
             variable=self.tipo_var,
             value="cardinal",
-            font=ctk.CTkFont(size=13)
+            font=ctk.CTkFont(size=13),
+            command=self._agendar_conversao
         ).pack(side="left", padx=(0, 20))
 
         ctk.CTkRadioButton(
@@ -112,7 +170,8 @@ class NumExtensoApp(ctk.CTk):
             text="Moeda (quarenta e dois reais)",
             variable=self.tipo_var,
             value="moeda",
-            font=ctk.CTkFont(size=13)
+            font=ctk.CTkFont(size=13),
+            command=self._agendar_conversao
         ).pack(side="left", padx=(0, 20))
 
         ctk.CTkRadioButton(
@@ -120,63 +179,170 @@ class NumExtensoApp(ctk.CTk):
             text="Ordinal (quadragésimo segundo)",
             variable=self.tipo_var,
             value="ordinal",
-            font=ctk.CTkFont(size=13)
+            font=ctk.CTkFont(size=13),
+            command=self._agendar_conversao
         ).pack(side="left")
 
-        # Checkbox feminino (só pra ordinal)
+        # Checkbox feminino (cardinal e ordinal)
         self.feminino_var = ctk.BooleanVar(value=False)
         self.feminino_check = ctk.CTkCheckBox(
             opcoes_frame,
-            text="Feminino (primeira, segunda...)",
+            text="Feminino (duas, duzentas; primeira, segunda...)",
             variable=self.feminino_var,
-            font=ctk.CTkFont(size=13)
+            font=ctk.CTkFont(size=13),
+            command=self._agendar_conversao
         )
         self.feminino_check.pack(anchor="w", padx=15, pady=(0, 15))
 
-        # Botão converter
-        self.btn_converter = ctk.CTkButton(
-            self,
-            text="Converter",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            height=45,
-            command=self._converter
+        # === Abas ===
+        abas = ctk.CTkTabview(self)
+        abas.grid(row=2, column=0, padx=20, pady=(0, 20), sticky="nsew")
+        self._criar_aba_um(abas.add("Um número"))
+        self._criar_aba_varios(abas.add("Vários números"))
+
+    def _criar_aba_um(self, aba):
+        """Aba "Um número": conversão ao vivo enquanto digita."""
+        aba.grid_columnconfigure(0, weight=1)
+        aba.grid_rowconfigure(3, weight=1)
+
+        input_label = ctk.CTkLabel(
+            aba,
+            text="Digite o número:",
+            font=ctk.CTkFont(size=14, weight="bold")
         )
-        self.btn_converter.grid(row=3, column=0, padx=20, pady=10, sticky="new")
+        input_label.grid(row=0, column=0, padx=15, pady=(10, 5), sticky="w")
 
-        # === Resultado ===
-        resultado_frame = ctk.CTkFrame(self)
-        resultado_frame.grid(row=4, column=0, padx=20, pady=(10, 20), sticky="nsew")
-        resultado_frame.grid_columnconfigure(0, weight=1)
-        resultado_frame.grid_rowconfigure(1, weight=1)
-        self.grid_rowconfigure(4, weight=1)
+        self.entrada = ctk.CTkEntry(
+            aba,
+            placeholder_text="Ex: 1.234,56",
+            font=ctk.CTkFont(size=16),
+            height=45
+        )
+        self.entrada.grid(row=1, column=0, padx=15, pady=(0, 10), sticky="ew")
+        self.entrada.bind("<KeyRelease>", lambda e: self._agendar_conversao())
+        self.entrada.bind("<Return>", lambda e: self._converter())
 
         resultado_label = ctk.CTkLabel(
-            resultado_frame,
+            aba,
             text="Resultado:",
             font=ctk.CTkFont(size=14, weight="bold")
         )
-        resultado_label.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="w")
-
-        self.resultado_text = ctk.CTkTextbox(
-            resultado_frame,
-            font=ctk.CTkFont(size=15),
-            wrap="word",
-            state="disabled"
-        )
-        self.resultado_text.grid(row=1, column=0, padx=15, pady=(0, 15), sticky="nsew")
+        resultado_label.grid(row=2, column=0, padx=15, pady=(5, 5), sticky="w")
 
         # Botão copiar
         self.btn_copiar = ctk.CTkButton(
-            resultado_frame,
+            aba,
             text="📋 Copiar",
             width=100,
             height=32,
             command=self._copiar
         )
-        self.btn_copiar.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="e")
+        self.btn_copiar.grid(row=2, column=0, padx=15, pady=(5, 5), sticky="e")
+
+        self.resultado_text = ctk.CTkTextbox(
+            aba,
+            font=ctk.CTkFont(size=15),
+            wrap="word",
+            state="disabled"
+        )
+        self.resultado_text.grid(row=3, column=0, padx=15, pady=(0, 10), sticky="nsew")
+
+    def _criar_aba_varios(self, aba):
+        """Aba "Vários números": colar uma coluna e converter em massa."""
+        aba.grid_columnconfigure((0, 1), weight=1, uniform="colunas")
+        aba.grid_rowconfigure(1, weight=1)
+
+        ctk.CTkLabel(
+            aba,
+            text="Cole um número por linha:",
+            font=ctk.CTkFont(size=14, weight="bold")
+        ).grid(row=0, column=0, padx=(15, 5), pady=(10, 5), sticky="w")
+
+        ctk.CTkLabel(
+            aba,
+            text="Resultado (uma linha pra cada):",
+            font=ctk.CTkFont(size=14, weight="bold")
+        ).grid(row=0, column=1, padx=(5, 15), pady=(10, 5), sticky="w")
+
+        self.entrada_lote = ctk.CTkTextbox(aba, font=ctk.CTkFont(size=13), wrap="none")
+        self.entrada_lote.grid(row=1, column=0, padx=(15, 5), pady=(0, 10), sticky="nsew")
+
+        self.resultado_lote = ctk.CTkTextbox(
+            aba,
+            font=ctk.CTkFont(size=13),
+            wrap="none",
+            state="disabled"
+        )
+        self.resultado_lote.grid(row=1, column=1, padx=(5, 15), pady=(0, 10), sticky="nsew")
+
+        # Andamento
+        self.progresso = ctk.CTkProgressBar(aba)
+        self.progresso.set(0)
+        self.progresso.grid(row=2, column=0, columnspan=2, padx=15, pady=(0, 5), sticky="ew")
+
+        self.status_lote = ctk.CTkLabel(aba, text="", font=ctk.CTkFont(size=12), text_color="gray")
+        self.status_lote.grid(row=3, column=0, columnspan=2, padx=15, sticky="w")
+
+        # Botões
+        botoes = ctk.CTkFrame(aba, fg_color="transparent")
+        botoes.grid(row=4, column=0, columnspan=2, padx=15, pady=(5, 10), sticky="ew")
+
+        self.btn_converter_lote = ctk.CTkButton(
+            botoes,
+            text="Converter tudo",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            command=self._converter_lote
+        )
+        self.btn_converter_lote.pack(side="left", padx=(0, 10))
+
+        self.btn_cancelar_lote = ctk.CTkButton(
+            botoes,
+            text="Cancelar",
+            fg_color="gray30",
+            state="disabled",
+            command=self._cancelar_lote
+        )
+        self.btn_cancelar_lote.pack(side="left", padx=(0, 10))
+
+        self.btn_salvar_lote = ctk.CTkButton(
+            botoes,
+            text="💾 Salvar...",
+            width=110,
+            state="disabled",
+            command=self._salvar_lote
+        )
+        self.btn_salvar_lote.pack(side="right")
+
+        self.btn_copiar_lote = ctk.CTkButton(
+            botoes,
+            text="📋 Copiar tudo",
+            width=130,
+            state="disabled",
+            command=self._copiar_lote
+        )
+        self.btn_copiar_lote.pack(side="right", padx=(0, 10))
+
+    # === Um número ===
+
+    def _agendar_conversao(self):
+        """Converte daqui a ATRASO_DIGITACAO ms; cada tecla nova reinicia a espera."""
+        if self._conversao_agendada is not None:
+            self.after_cancel(self._conversao_agendada)
+        self._conversao_agendada = self.after(ATRASO_DIGITACAO, self._converter_ao_vivo)
+
+    def _converter_ao_vivo(self):
+        self._conversao_agendada = None
+        if self.entrada.get().strip():
+            self._converter()
+        else:
+            self._mostrar_resultado("")
 
     def _converter(self):
         """Executa a conversão do número."""
+        if self._conversao_agendada is not None:
+            self.after_cancel(self._conversao_agendada)
+            self._conversao_agendada = None
+
         texto = self.entrada.get().strip()
 
         if not texto:
@@ -184,36 +350,12 @@ class NumExtensoApp(ctk.CTk):
             return
 
         try:
-            # Aceita vírgula como decimal
-            texto = texto.replace(",", ".")
-
-            # Determina se é decimal
-            if "." in texto:
-                numero = float(texto)
-            else:
-                numero = int(texto)
-
-            tipo = self.tipo_var.get()
-
-            if tipo == "moeda":
-                resultado = por_extenso_moeda(numero)
-            elif tipo == "ordinal":
-                if isinstance(numero, float) and numero != int(numero):
-                    self._mostrar_resultado("Ordinais não suportam decimais!", erro=True)
-                    return
-                resultado = por_extenso_ordinal(
-                    int(numero),
-                    feminino=self.feminino_var.get()
-                )
-            else:  # cardinal
-                if isinstance(numero, float) and numero != int(numero):
-                    self._mostrar_resultado(
-                        "Use 'Moeda' pra números decimais!",
-                        erro=True
-                    )
-                    return
-                resultado = por_extenso(int(numero))
-
+            # Mesmo leitor do CLI: "1.234,56", "R$ 99,90", "1234.56"...
+            resultado = converter_texto(
+                texto,
+                self.tipo_var.get(),
+                feminino=self.feminino_var.get()
+            )
             self._mostrar_resultado(resultado)
 
         except ValueError as e:
@@ -241,13 +383,140 @@ class NumExtensoApp(ctk.CTk):
         self.resultado_text.configure(state="disabled")
 
         if texto:
-            self.clipboard_clear()
-            self.clipboard_append(texto)
+            self._copiar_texto(texto, self.btn_copiar)
+
+    def _copiar_texto(self, texto: str, botao):
+        self.clipboard_clear()
+        self.clipboard_append(texto)
+
+        # Feedback visual
+        texto_original = botao.cget("text")
+        botao.configure(text="✓ Copiado!")
+        self.after(1500, lambda: botao.configure(text=texto_original))
 
-            # Feedback visual
-            texto_original = self.btn_copiar.cget("text")
-            self.btn_copiar.configure(text="✓ Copiado!")
-            self.after(1500, lambda: self.btn_copiar.configure(text=texto_original))
+    # === Vários números ===
+
+    def _converter_lote(self):
+        """Começa a conversão da colagem inteira numa thread separada."""
+        if self._lote is not None:
+            return
+
+        linhas = self.entrada_lote.get("1.0", "end").splitlines()
+        # O Textbox sempre termina com uma linha vazia a mais
+        while linhas and not linhas[-1].strip():
+            linhas.pop()
+        if not linhas:
+            self.status_lote.configure(text="Cole pelo menos um número na caixa da esquerda.")
+            return
+
+        self._resultados_lote = []
+        self._total_lote = len(linhas)
+        self.resultado_lote.configure(state="normal")
+        self.resultado_lote.delete("1.0", "end")
+        self.resultado_lote.configure(state="disabled")
+        self.progresso.set(0)
+
+        self.btn_converter_lote.configure(state="disabled")
+        self.btn_cancelar_lote.configure(state="normal")
+        self.btn_copiar_lote.configure(state="disabled")
+        self.btn_salvar_lote.configure(state="disabled")
+
+        # As opções são lidas aqui, na thread da janela: a thread de
+        # conversão não pode mexer em nada do Tk
+        cancelar = threading.Event()
+        fila = queue.Queue()
+        thread = threading.Thread(
+            target=_converter_em_pedacos,
+            args=(linhas, self.tipo_var.get(), self.feminino_var.get(), fila, cancelar),
+            daemon=True,
+        )
+        self._lote = (thread, cancelar, fila)
+        thread.start()
+        self.after(INTERVALO_PROGRESSO, self._acompanhar_lote)
+
+    def _acompanhar_lote(self):
+        """Pega o que a thread já converteu e mostra; se não acabou, agenda de novo."""
+        if self._lote is None:
+            return
+        _, _, fila = self._lote
+
+        final = None
+        novos = []
+        while final is None:
+            try:
+                tipo, dados = fila.get_nowait()
+            except queue.Empty:
+                break
+            if tipo == "pedaco":
+                novos.extend(dados)
+            else:
+                final = (tipo, dados)
+
+        if novos:
+            inicio = len(self._resultados_lote)
+            self._resultados_lote.extend(novos)
+            self.resultado_lote.configure(state="normal")
+            self.resultado_lote.insert("end", ("\n" if inicio else "") + "\n".join(novos))
+            self.resultado_lote.configure(state="disabled")
+            feitos = len(self._resultados_lote)
+            self.progresso.set(feitos / self._total_lote)
+            self.status_lote.configure(text=f"{feitos:,} de {self._total_lote:,} linhas".replace(",", "."))
+
+        if final is None:
+            self.after(INTERVALO_PROGRESSO, self._acompanhar_lote)
+            return
+
+        tipo, dados = final
+        self._lote = None
+        feitos = len(self._resultados_lote)
+        erros = sum(1 for resultado in self._resultados_lote if resultado.startswith("ERRO:"))
+        if tipo == "fim":
+            mensagem = f"Pronto: {feitos:,} linhas".replace(",", ".")
+            if erros:
+                mensagem += f", {erros:,} com erro".replace(",", ".")
+        elif tipo == "cancelado":
+            mensagem = f"Cancelado em {feitos:,} de {self._total_lote:,} linhas".replace(",", ".")
+        else:
+            mensagem = f"Erro inesperado: {dados}"
+        self.status_lote.configure(text=mensagem)
+
+        self.btn_converter_lote.configure(state="normal")
+        self.btn_cancelar_lote.configure(state="disabled")
+        if self._resultados_lote:
+            self.btn_copiar_lote.configure(state="normal")
+            self.btn_salvar_lote.configure(state="normal")
+
+    def _cancelar_lote(self):
+        """Pede pra thread parar (ela para no fim do pedaço atual)."""
+        if self._lote is not None:
+            self._lote[1].set()
+            self.btn_cancelar_lote.configure(state="disabled")
+
+    def _copiar_lote(self):
+        """Copia todos os resultados, um por linha (dá pra colar de volta na planilha)."""
+        if self._resultados_lote:
+            self._copiar_texto("\n".join(self._resultados_lote), self.btn_copiar_lote)
+
+    def _salvar_lote(self):
+        """Salva todos os resultados num arquivo de texto, um por linha."""
+        if not self._resultados_lote:
+            return
+        caminho = filedialog.asksaveasfilename(
+            parent=self,
+            title="Salvar resultados",
+            defaultextension=".txt",
+            filetypes=[("Texto", "*.txt"), ("Todos os arquivos", "*")],
+        )
+        if not caminho:
+            return
+        try:
+            with open(caminho, "w", encoding="utf-8", newline="\n") as arquivo:
+                arquivo.write("\n".join(self._resultados_lote))
+                arquivo.write("\n")
+        except OSError as e:
+            self.status_lote.configure(text=f"Erro ao salvar: {e}")
+            return
+        self.status_lote.configure(text=f"Salvo em {caminho}")
 
 
 def main():
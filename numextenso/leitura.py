@@ -0,0 +1,151 @@
+"""
+Leitura de números escritos do jeito brasileiro.
+
+"1.234,56", "R$ 1.234,56", "-R$ 0,99", "1234" e "1234.56" - o texto
+vai direto pra inteiro (centavos), sem passar por float:
+
+    >>> ler_centavos("R$ 1.234,56")
+    123456
+    >>> ler_inteiro("1.000.000")
+    1000000
+
+Regras (estritas, pra não adivinhar valor de dinheiro):
+    - vírgula é o separador decimal
+    - ponto é separador de milhar, e os grupos têm que ter 3 dígitos
+      ("1.234.567" ok, "1.23.4" não)
+    - sem vírgula, um ponto só seguido de 1, 2 ou 4+ dígitos é lido como
+      decimal ("1234.56", "99.9"), que é como sistemas exportam números;
+      "1.234" é sempre mil duzentos e trinta e quatro
+    - "R$" opcional no começo, sinal de menos antes ou depois dele e
+      espaços em volta
+    - só dígitos ASCII (nada de "²" ou dígitos de outros alfabetos)
+
+Tudo com métodos de str, sem regex.
+"""
+
+# Fator de cada quantidade de casas decimais (10 ** casas)
+_FATORES = (1, 10, 100, 1000, 10000)
+
+
+def _eh_digitos(texto: str) -> bool:
+    return texto.isdigit() and texto.isascii()
+
+
+def _inteiro_com_milhar(texto: str, original: str) -> str:
+    """'1.234.567' -> '1234567', conferindo os grupos de 3 dígitos."""
+    grupos = texto.split(".")
+    primeiro = grupos[0]
+    if not 1 <= len(primeiro) <= 3:
+        raise ValueError(f"Separador de milhar fora de lugar: {original!r}")
+    for grupo in grupos[1:]:
+        if len(grupo) != 3:
+            raise ValueError(f"Separador de milhar fora de lugar: {original!r}")
+    return "".join(grupos)
+
+
+def ler_partes(texto: str) -> tuple:
+    """
+    Quebra o texto em (negativo, parte inteira, dígitos decimais).
+
+    A parte inteira já vem como int; os decimais vêm como texto ("5" em
+    "1,5" e "05" em "1,05"), pra quem chama decidir quantas casas aceita.
+
+    Exemplos:
+        >>> ler_partes("-R$ 1.234,5")
+        (True, 1234, '5')
+    """
+    if not isinstance(texto, str):
+        raise TypeError(f"Esperava str, recebi {type(texto).__name__}")
+
+    t = texto.strip()
+    negativo = t.startswith("-")
+    if negativo:
+        t = t[1:].lstrip()
+    if t.startswith("R$"):
+        t = t[2:].lstrip()
+        if not negativo and t.startswith("-"):
+            negativo = True
+            t = t[1:]
+
+    inteiro, virgula, fracao = t.partition(",")
+    if "." in inteiro:
+        if virgula or inteiro.count(".") > 1 or len(inteiro) - inteiro.index(".") == 4:
+            inteiro = _inteiro_com_milhar(inteiro, texto)
+        else:
+            inteiro, _, fracao = inteiro.partition(".")
+            virgula = "."
+
+    if not _eh_digitos(inteiro) or (virgula and not _eh_digitos(fracao)):
+        raise ValueError(f"Número inválido: {texto!r}")
+    return negativo, int(inteiro), fracao
+
+
+def ler_centavos(texto: str, casas: int = 2) -> int:
+    """
+    Lê um valor em dinheiro e devolve em centavos (int).
+
+    Parâmetros:
+        texto: O valor ("1.234,56", "R$ 9,90", "-0,01"...)
+        casas: Casas decimais da moeda (2 pro real; 0 ou 3 em outras)
+
+    Levanta ValueError se o texto não for um valor válido ou tiver mais
+    casas decimais que a moeda.
+
+    Exemplos:
+        >>> ler_centavos("9,9")
+        990
+        >>> ler_centavos("1.500", casas=0)
+        1500
+    """
+    negativo, inteiro, fracao = ler_partes(texto)
+    if len(fracao) > casas:
+        raise ValueError(f"Mais de {casas} casas decimais: {texto!r}")
+
+    centavos = inteiro * _FATORES[casas]
+    if fracao:
+        centavos += int(fracao) * _FATORES[casas - len(fracao)]
+    return -centavos if negativo else centavos
+
+
+def ler_inteiro(texto: str) -> int:
+    """
+    Lê um número inteiro ("1.234", "-15"). Decimais zerados ("10,00")
+    são aceitos; qualquer outro decimal levanta ValueError.
+    """
+    negativo, inteiro, fracao = ler_partes(texto)
+    if fracao.strip("0"):
+        raise ValueError(f"Número com casas decimais: {texto!r}")
+    return -inteiro if negativo else inteiro
+
+
+def ler_centavos_lote(textos, casas: int = 2) -> list:
+    """
+    Mesmo que ler_centavos(), pra muitos textos de uma vez.
+
+    Os formatos mais comuns ("1234", "99,90", "1.234,56") são resolvidos
+    ali mesmo no loop; o resto (R$, sinal, espaços, erros) passa por
+    ler_centavos().
+    """
+    fator = _FATORES[casas]
+    centavos = []
+    adicionar = centavos.append
+    for texto in textos:
+        if type(texto) is not str:
+            adicionar(ler_centavos(texto, casas))  # levanta o TypeError
+            continue
+        inteiro, virgula, fracao = texto.partition(",")
+        if virgula:
+            if len(fracao) == casas and fracao.isdigit() and fracao.isascii():
+                if "." in inteiro:
+                    # Pontos de milhar certos: um a cada 4 posições, de trás pra frente
+                    pontos = inteiro[-4::-4]
+                    if pontos.count(".") == len(pontos) == inteiro.count(".") and inteiro[0] != ".":
+                        inteiro = inteiro.replace(".", "")
+                if inteiro.isdigit() and inteiro.isascii():
+                    adicionar(int(inteiro) * fator + int(fracao))
+                    continue
+        elif inteiro.isdigit() and inteiro.isascii():
+            adicionar(int(inteiro) * fator)
+            continue
+        adicionar(ler_centavos(texto, casas))
+    return centavos
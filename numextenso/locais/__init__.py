@@ -0,0 +1,44 @@
+"""
+Pacotes de locale (pt_BR, pt_PT...).
+
+O pt_BR é o padrão e é o que o resto da biblioteca usa direto, sem passar
+por aqui. Os outros só são importados (e só montam as tabelas deles) na
+primeira vez que alguém pede:
+
+    >>> por_extenso(2_000_000_000, locale="pt_PT")
+    'dois mil milhões'
+
+Cada locale é um módulo deste pacote com:
+    MAX_VALOR: Maior número que ele sabe escrever
+    MAIOR_CLASSE: Nome (no plural) da maior classe, pra mensagem de erro
+    extenso_positivo(numero): Extenso de um int de 1 a MAX_VALOR
+    extenso_positivo_feminino(numero): O mesmo, no feminino
+
+Pra adicionar um locale, crie o módulo e acrescente o nome em LOCAIS.
+"""
+
+import importlib
+
+LOCAL_PADRAO = "pt_BR"
+
+# Locales disponíveis (nome do módulo neste pacote)
+LOCAIS = ("pt_BR", "pt_PT")
+
+# "pt-pt", "PT_PT"... -> "pt_PT"
+_NOMES = {nome.lower(): nome for nome in LOCAIS}
+
+
+def carregar(locale: str):
+    """
+    Devolve o módulo do locale, importando na primeira vez.
+
+    Aceita "pt_PT", "pt-PT" ou "pt_pt". Levanta ValueError se o locale
+    não existir.
+    """
+    if not isinstance(locale, str):
+        raise TypeError(f"locale precisa ser str, recebi {type(locale).__name__}")
+    nome = _NOMES.get(locale.replace("-", "_").lower())
+    if nome is None:
+        raise ValueError(f"Locale desconhecido: {locale!r}. Use um de: {', '.join(LOCAIS)}")
+    # O import já é thread-safe e fica guardado em sys.modules
+    return importlib.import_module(f".{nome}", __name__)
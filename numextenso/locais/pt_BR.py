@@ -0,0 +1,14 @@
+"""
+Português do Brasil (o padrão).
+
+Só reexporta as tabelas de tabelas.py, que já são montadas no import do
+pacote - por_extenso() sem locale nem passa por aqui.
+"""
+
+from ..constantes import CLASSES
+from ..conversor import MAX_VALOR
+from ..tabelas import extenso_positivo, extenso_positivo_feminino
+
+MAIOR_CLASSE = CLASSES[-1][1]
+
+__all__ = ["MAIOR_CLASSE", "MAX_VALOR", "extenso_positivo", "extenso_positivo_feminino"]
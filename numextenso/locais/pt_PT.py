@@ -0,0 +1,109 @@
+"""
+Português europeu (pt_PT).
+
+O que muda em relação ao Brasil:
+    - escala longa: cada classe nova vale um milhão da anterior, e no
+      meio entra o "mil" (10^9 é "mil milhões", 10^12 é "um bilião")
+    - "catorze", "dezasseis", "dezassete", "dezanove"
+    - sem vírgula entre os grupos: "um milhão duzentos e trinta e quatro
+      mil quinhentos e sessenta e sete"
+
+O resto (centenas, "cem"/"cento", o "e" antes de dezenas e centenas
+redondas, o feminino) é igual. As tabelas deste módulo são montadas no
+import, e o import só acontece no primeiro por_extenso(..., locale="pt_PT").
+"""
+
+from ..constantes import CENTENAS_FEMININO, _raizes_classes
+from ..constantes import UNIDADES as UNIDADES_BR
+from ..tabelas import _converter_grupo
+
+UNIDADES = UNIDADES_BR[:14] + ("catorze", "quinze", "dezasseis", "dezassete", "dezoito", "dezanove")
+UNIDADES_FEMININO = ("zero", "uma", "duas") + UNIDADES[3:]
+
+# Escala longa: milhão (10^6), bilião (10^12), trilião (10^18)... Cada
+# classe agrupa 6 dígitos.
+CLASSES = (("", ""), ("milhão", "milhões")) + tuple(
+    (raiz + "lião", raiz + "liões") for raiz in _raizes_classes()[1:]
+)
+
+MAX_VALOR = 1_000_000 ** len(CLASSES) - 1
+MAIOR_CLASSE = CLASSES[-1][1]
+
+GRUPOS = tuple(_converter_grupo(n, UNIDADES) for n in range(1000))
+GRUPOS_FEMININO = tuple(
+    _converter_grupo(n, UNIDADES_FEMININO, CENTENAS_FEMININO) for n in range(1000)
+)
+
+# O "e" só entra antes de um grupo abaixo de 100 ou de centena redonda
+CONECTIVOS = tuple(" e " if n < 100 or n % 100 == 0 else " " for n in range(1000))
+
+
+def _milhares(grupos: tuple) -> tuple:
+    """MILHARES[n] -> "n mil" (com "mil" sozinho pro 1)."""
+    tabela = [texto + " mil" for texto in grupos]
+    tabela[0] = ""
+    tabela[1] = "mil"
+    return tuple(tabela)
+
+
+MILHARES = _milhares(GRUPOS)
+MILHARES_FEMININO = _milhares(GRUPOS_FEMININO)
+
+
+def _abaixo_de_um_milhao(numero: int, grupos: tuple, milhares: tuple) -> str:
+    """Extenso de 1 a 999.999 ("dois mil e quinhentos")."""
+    if numero < 1000:
+        return grupos[numero]
+    milhar, resto = divmod(numero, 1000)
+    if not resto:
+        return milhares[milhar]
+    return milhares[milhar] + CONECTIVOS[resto] + grupos[resto]
+
+
+def _conectivo(bloco: int) -> str:
+    """O que vai antes de um bloco de 6 dígitos que não é o primeiro."""
+    milhar, resto = divmod(bloco, 1000)
+    if milhar and resto:
+        return " "
+    return CONECTIVOS[resto or milhar]
+
+
+def _extenso(numero: int, grupos: tuple, milhares: tuple) -> str:
+    if numero < 1_000_000:
+        return _abaixo_de_um_milhao(numero, grupos, milhares)
+
+    blocos = []
+    while numero:
+        numero, bloco = divmod(numero, 1_000_000)
+        blocos.append(bloco)
+
+    partes = []
+    for i in range(len(blocos) - 1, -1, -1):
+        bloco = blocos[i]
+        if not bloco:
+            continue
+        if partes:
+            partes.append(_conectivo(bloco))
+        if i == 0:
+            partes.append(_abaixo_de_um_milhao(bloco, grupos, milhares))
+        elif bloco == 1:
+            partes.append("um " + CLASSES[i][0])
+        else:
+            # Milhão, bilião... são masculinos: o número na frente também
+            partes.append(_abaixo_de_um_milhao(bloco, GRUPOS, MILHARES) + " " + CLASSES[i][1])
+
+    return "".join(partes)
+
+
+def extenso_positivo(numero: int) -> str:
+    """
+    Extenso de um inteiro de 1 a MAX_VALOR (já validado).
+
+    Ex: 2_000_000_000 -> "dois mil milhões", 10**12 -> "um bilião".
+    """
+    return _extenso(numero, GRUPOS, MILHARES)
+
+
+def extenso_positivo_feminino(numero: int) -> str:
+    """Mesmo que extenso_positivo(), no feminino ("duas mil e duzentas")."""
+    return _extenso(numero, GRUPOS_FEMININO, MILHARES_FEMININO)
@@ -0,0 +1,344 @@
+"""
+Conversão em lote.
+
+Pra converter um milhão de valores, chamar por_extenso() um milhão de
+vezes paga a validação (isinstance, checagem de float, limite) em cada
+chamada. Aqui a validação é feita uma vez só pro lote inteiro e depois
+cada valor vai direto pras tabelas pré-calculadas.
+
+Se o NumPy estiver instalado e você passar um ndarray de inteiros, a
+quebra em grupos de 3 dígitos é feita de forma vetorizada. O NumPy
+nunca é importado por aqui - só é usado se o array já veio dele.
+"""
+
+import sys
+
+from . import metricas
+from .conversor import (
+    MAX_VALOR,
+    _centavos_decimal,
+    _erro_muito_grande,
+    _fator,
+    _moeda_de_centavos,
+    _por_extenso,
+    _por_extenso_moeda,
+    _por_extenso_ordinal,
+    _resolver_moeda,
+)
+from .leitura import ler_centavos_lote, ler_inteiro
+from .tabelas import (
+    CLASSES_PRE_CALCULADAS,
+    CONECTIVOS,
+    CONECTIVOS_APOS_MIL,
+    GRUPOS_CLASSE,
+    GRUPOS_CLASSE_FEMININO,
+    ORDINAIS_PRE_CALCULADOS,
+    extenso_positivo,
+    extenso_positivo_feminino,
+    ordinais,
+    ordinal_positivo,
+)
+
+MODOS = ("cardinal", "moeda", "ordinal")
+
+
+def por_extenso_lote(
+    valores,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    moeda: dict | str = None,
+) -> list:
+    """
+    Converte vários valores de uma vez.
+
+    Parâmetros:
+        valores: Qualquer iterável de números (ou ndarray do NumPy), ou
+            de textos no formato brasileiro ("1.234,56", "R$ 9,90")
+        modo: "cardinal", "moeda" ou "ordinal"
+        feminino: Forma feminina ("duas mil", "segunda"); não vale pro
+            modo "moeda"
+        moeda: Código ISO 4217 ou dicionário da moeda (só pro modo "moeda")
+
+    Retorna:
+        Lista de strings, na mesma ordem da entrada
+
+    Exemplos:
+        >>> por_extenso_lote([1, 2, 1001])
+        ['um', 'dois', 'mil e um']
+        >>> por_extenso_lote([1, 0.5], modo="moeda")
+        ['um real', 'cinquenta centavos']
+        >>> por_extenso_lote([1, 200], feminino=True)
+        ['uma', 'duzentas']
+    """
+    coletor = metricas.COLETOR
+    if coletor is not None:
+        return coletor.medir("por_extenso_lote", _por_extenso_lote, valores, modo, feminino, moeda)
+    return _por_extenso_lote(valores, modo, feminino, moeda)
+
+
+def _por_extenso_lote(valores, modo: str, feminino: bool, moeda) -> list:
+    """Miolo de por_extenso_lote() - sem métricas."""
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: {modo!r}. Use um de: {', '.join(MODOS)}")
+    if modo == "moeda":
+        moeda = _resolver_moeda(moeda)
+
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(valores, np.ndarray):
+        return _lote_numpy(np, valores, modo, feminino, moeda)
+
+    valores = list(valores)
+    if not valores:
+        return []
+
+    # Lote de textos ("1.234,56", "R$ 9,90") passa pelo leitor de leitura.py
+    if type(valores[0]) is str and set(map(type, valores)) == {str}:
+        if modo == "moeda":
+            return _lote_centavos(ler_centavos_lote(valores, moeda.get("casas", 2)), moeda)
+        valores = [ler_inteiro(texto) for texto in valores]
+
+    if modo == "cardinal":
+        return _lote_cardinal(valores, feminino)
+    if modo == "moeda":
+        return _lote_moeda(valores, moeda)
+    return _lote_ordinal(valores, feminino)
+
+
+def _categorias(valores, modo: str, feminino: bool, moeda) -> tuple:
+    """
+    Converte valores sem repetição e junta os textos que saírem iguais.
+
+    Retorna (categorias, posicoes): os textos distintos e, pra cada
+    valor, a posição do texto dele em categorias. Valores diferentes
+    podem dar o mesmo texto (1 e 1.0, ou 0.001 e 0 no modo "moeda"), e
+    coluna categórica não aceita categoria repetida. É o que
+    numextenso.pandas e numextenso.arrow usam.
+    """
+    indices = {}
+    posicoes = [
+        indices.setdefault(texto, len(indices))
+        for texto in por_extenso_lote(valores, modo=modo, feminino=feminino, moeda=moeda)
+    ]
+    return list(indices), posicoes
+
+
+def _so_inteiros(valores: list) -> bool:
+    """True se todos os valores são int de verdade (bool não conta)."""
+    return set(map(type, valores)) <= {int}
+
+
+def _lote_cardinal(valores: list, feminino: bool = False) -> list:
+    # Tipos misturados (float, bool...) vão pelo caminho normal, que já
+    # sabe dar as mensagens de erro certas. O miolo, sem métricas: o lote
+    # já foi contado uma vez, não conta de novo cada valor
+    if not _so_inteiros(valores):
+        return [_por_extenso(v, False, feminino) for v in valores]
+
+    # Limite validado uma vez só pro lote inteiro
+    if max(valores) > MAX_VALOR or -min(valores) > MAX_VALOR:
+        raise _erro_muito_grande()
+
+    converter = extenso_positivo_feminino if feminino else extenso_positivo
+    return [
+        converter(v) if v > 0
+        else "zero" if v == 0
+        else "menos " + converter(-v)
+        for v in valores
+    ]
+
+
+def _lote_moeda(valores: list, moeda: dict) -> list:
+    tipos_aceitos = {int, float}
+    decimal = sys.modules.get("decimal")
+    if decimal is not None:
+        tipos_aceitos.add(decimal.Decimal)
+
+    tipos = set(map(type, valores))
+    if not tipos <= tipos_aceitos:
+        return [_por_extenso_moeda(v, moeda) for v in valores]
+
+    # Mesmo arredondamento de por_extenso_moeda(), só que feito uma vez
+    fator = _fator(moeda)
+    if decimal is not None and decimal.Decimal in tipos:
+        # Decimal tem a conta exata dele (ver _centavos_decimal)
+        tipo_decimal, casas = decimal.Decimal, moeda.get("casas", 2)
+        centavos = [
+            _centavos_decimal(v, casas) if type(v) is tipo_decimal else round(abs(v) * fator)
+            for v in valores
+        ]
+    else:
+        centavos = [round(abs(v) * fator) for v in valores]
+    if max(centavos) // fator > MAX_VALOR:
+        raise _erro_muito_grande()
+
+    return [
+        "menos " + _moeda_de_centavos(c, moeda, fator) if v < 0
+        else _moeda_de_centavos(c, moeda, fator)
+        for v, c in zip(valores, centavos)
+    ]
+
+
+def _lote_centavos(centavos: list, moeda: dict) -> list:
+    """Lote de valores já em centavos (int), com sinal."""
+    fator = _fator(moeda)
+    if max(centavos) // fator > MAX_VALOR or -min(centavos) // fator > MAX_VALOR:
+        raise _erro_muito_grande()
+
+    return [
+        _moeda_de_centavos(c, moeda, fator) if c >= 0
+        else "menos " + _moeda_de_centavos(-c, moeda, fator)
+        for c in centavos
+    ]
+
+
+def _lote_ordinal(valores: list, feminino: bool) -> list:
+    if not _so_inteiros(valores) or min(valores) < 1 or max(valores) > MAX_VALOR:
+        # Deixa o caminho normal achar o valor ruim e reclamar dele
+        return [_por_extenso_ordinal(v, feminino) for v in valores]
+
+    feminino = bool(feminino)
+    tabela = ordinais(feminino)
+    if max(valores) < ORDINAIS_PRE_CALCULADOS:
+        return [tabela[v] for v in valores]
+    return [
+        tabela[v] if v < ORDINAIS_PRE_CALCULADOS else ordinal_positivo(v, feminino)
+        for v in valores
+    ]
+
+
+def _lote_numpy(np, valores, modo: str, feminino: bool, moeda: dict) -> list:
+    """Caminho vetorizado pra arrays do NumPy."""
+    if valores.size == 0:
+        return []
+    valores = valores.ravel()
+
+    if modo == "moeda":
+        fator = _fator(moeda)
+        if valores.dtype.kind == "f" and np.isfinite(valores).all():
+            # Mesmo critério do round() do Python: meio pro par
+            centavos = np.rint(np.abs(valores.astype(np.float64)) * fator)
+            if centavos.max() >= _LIMITE_INT64:
+                return _lote_moeda(valores.tolist(), moeda)
+            centavos = centavos.astype(np.int64)
+        elif valores.dtype.kind in "iu" and _cabe_em_int64(valores, fator):
+            centavos = np.abs(valores.astype(np.int64)) * fator
+        else:
+            return _lote_moeda(valores.tolist(), moeda)
+        return _moeda_vetorizado(np, centavos, valores < 0, moeda, fator)
+
+    if valores.dtype.kind not in "iu" or not _cabe_em_int64(valores):
+        # Arrays de float/objeto (ou inteiros grandes demais pra conta
+        # vetorizada) seguem as regras de sempre, valor a valor
+        lista = valores.tolist()
+        if modo == "ordinal":
+            return _lote_ordinal(lista, feminino)
+        return _lote_cardinal(lista, feminino)
+
+    if modo == "ordinal":
+        return _lote_ordinal(valores.tolist(), feminino)
+
+    textos = _cardinal_vetorizado(np, np.abs(valores.astype(np.int64)), feminino)
+    textos[valores == 0] = "zero"
+    negativos = valores < 0
+    if negativos.any():
+        textos = np.where(negativos, "menos " + textos, textos)
+    return textos.tolist()
+
+
+# Acima disso a conta em int64 estoura
+_LIMITE_INT64 = 2 ** 63
+
+
+def _cabe_em_int64(valores, fator: int = 1) -> bool:
+    """True se |valor| * fator cabe num int64 pra todo valor do array."""
+    limite = (_LIMITE_INT64 - 1) // fator
+    return int(valores.max()) <= limite and -int(valores.min()) <= limite
+
+
+_tabelas_numpy = [None, None]
+
+
+def _tabelas_objeto(np, feminino: bool = False) -> tuple:
+    """
+    As tabelas de tabelas.py como arrays de objeto do NumPy.
+
+    Com elas dá pra fazer GRUPOS[array] e somar strings elemento a
+    elemento sem loop em Python. Montadas só no primeiro uso (uma vez
+    por gênero).
+    """
+    tabelas = _tabelas_numpy[feminino]
+    if tabelas is None:
+        grupos_classe = GRUPOS_CLASSE_FEMININO if feminino else GRUPOS_CLASSE
+        tabelas = _tabelas_numpy[feminino] = (
+            tuple(np.array(tabela, dtype=object) for tabela in grupos_classe),
+            np.array(CONECTIVOS, dtype=object),
+            np.array(CONECTIVOS_APOS_MIL, dtype=object),
+        )
+    return tabelas
+
+
+def _cardinal_vetorizado(np, absolutos, feminino: bool = False):
+    """
+    Converte um array de inteiros >= 0 num array de objeto com os textos.
+
+    Faz o mesmo que juntar_grupos(), só que classe por classe pro array
+    inteiro de uma vez. Zero vira "" (quem chama decide o que pôr).
+    """
+    grupos_classe, conectivos, conectivos_apos_mil = _tabelas_objeto(np, bool(feminino))
+
+    # Quebra todos os valores em grupos de 3 dígitos de uma vez só
+    colunas = []
+    resto = absolutos
+    for _ in range(CLASSES_PRE_CALCULADAS):
+        resto, grupo = np.divmod(resto, 1000)
+        colunas.append(grupo)
+
+    textos = np.full(absolutos.shape, "", dtype=object)
+    tem_anterior = np.zeros(absolutos.shape, dtype=bool)
+    for i in range(CLASSES_PRE_CALCULADAS - 1, -1, -1):
+        grupo = colunas[i]
+        tem_grupo = grupo != 0
+        if not tem_grupo.any():
+            continue
+
+        # Só o grupo das unidades pode vir logo depois de um "mil" sozinho
+        if i == 0:
+            conectivo = np.where(colunas[1] == 1, conectivos_apos_mil[grupo], conectivos[grupo])
+        else:
+            conectivo = conectivos[grupo]
+
+        textos = textos + np.where(tem_anterior & tem_grupo, conectivo, "") + grupos_classe[i][grupo]
+        tem_anterior |= tem_grupo
+
+    return textos
+
+
+def _moeda_vetorizado(np, centavos, negativos, moeda: dict, fator: int) -> list:
+    """Mesma montagem de _moeda_de_centavos(), pro array inteiro."""
+    inteiros, resto = np.divmod(centavos, fator)
+    tem_inteiros = inteiros > 0
+    tem_centavos = resto > 0
+
+    nome_inteiro = np.where(inteiros > 1, moeda["inteiro_plural"], moeda["inteiro_singular"])
+    parte_inteira = np.where(
+        tem_inteiros,
+        _cardinal_vetorizado(np, inteiros, moeda.get("feminino", False)) + " " + nome_inteiro,
+        "",
+    )
+
+    # Moeda sem fração (casas = 0) nunca tem resto
+    if tem_centavos.any():
+        nome_centavos = np.where(resto > 1, moeda["decimal_plural"], moeda["decimal_singular"])
+        parte_centavos = np.where(
+            tem_centavos,
+            _cardinal_vetorizado(np, resto, moeda.get("decimal_feminino", False)) + " " + nome_centavos,
+            "",
+        )
+        textos = parte_inteira + np.where(tem_inteiros & tem_centavos, " e ", "") + parte_centavos
+    else:
+        textos = parte_inteira.astype(object)
+    textos[~(tem_inteiros | tem_centavos)] = f"zero {moeda['inteiro_plural']}"
+
+    if negativos.any():
+        textos = np.where(negativos, "menos " + textos, textos)
+    return textos.tolist()
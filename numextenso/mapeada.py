@@ -0,0 +1,394 @@
+"""
+Tabela pré-calculada em arquivo, mapeada na memória (mmap).
+
+As tabelas de grupo de tabelas.py são pequenas (uns 3 ms no import).
+O que pesa é ter o texto pronto de TODO valor comum: os cardinais de 0
+a 999.999 ou os valores em reais até R$ 9.999,99 levam ~0,5 s pra
+montar e ~100 MB de str em cada processo. Num servidor com 16
+trabalhadores (gunicorn, multiprocessing) são 16 cópias iguais.
+
+Aqui esses textos são compilados uma vez num arquivo binário:
+
+    numextenso tabela compilar extensos.bin
+
+e cada processo só faz um mmap somente leitura dele. Todos os processos
+leem as mesmas páginas do cache do sistema, e subir um trabalhador vira
+abrir um arquivo:
+
+    >>> tabela = abrir_tabela("extensos.bin")
+    >>> tabela.por_extenso(1234)
+    'mil duzentos e trinta e quatro'
+    >>> tabela.por_extenso_centavos(990)
+    'nove reais e noventa centavos'
+
+O arquivo só tem essas duas faixas completas ("cardinal" e "moeda").
+Fora delas (e no feminino, ordinal, outras moedas) quem responde são as
+funções de sempre, com as tabelas de grupo de tabelas.py montadas no
+import como em qualquer processo: elas custam pouco e não valem um mmap.
+O numextenso.por_extenso() em si não olha a tabela; quem quer usá-la
+chama tabela.por_extenso().
+
+Formato (bytes na ordem da máquina que compilou):
+    cabeçalho: "NUMEXTAB", versão do formato, ordem dos bytes,
+        quantidade de seções, assinatura (sha256)
+    diretório: por seção, nome, quantidade de itens, posições,
+        tamanho do blob e crc32
+    seções: offsets (uint32, quantidade + 1) e o blob UTF-8 com todos
+        os textos colados; o item i é blob[offsets[i]:offsets[i + 1]]
+
+A assinatura é um hash das tabelas de grupo de tabelas.py e de uma amostra de
+conversões feitas pelo código atual. Se o numextenso mudar a forma de
+escrever algum número, a tabela antiga é recusada em vez de dar texto
+velho. O crc32 de cada seção é conferido na primeira vez que ela é usada
+(uma seção que o processo nunca usa nem é lida do disco).
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+
+from .conversor import por_extenso, por_extenso_centavos
+from .lote import por_extenso_lote
+from .tabelas import (
+    CLASSES_PRE_CALCULADAS,
+    CONECTIVOS,
+    CONECTIVOS_APOS_MIL,
+    GRUPOS,
+    GRUPOS_CLASSE,
+    GRUPOS_CLASSE_FEMININO,
+    GRUPOS_FEMININO,
+    SUFIXOS,
+    SUFIXOS_APOS_MIL,
+    SUFIXOS_APOS_MIL_FEMININO,
+    SUFIXOS_FEMININO,
+)
+
+MAGICO = b"NUMEXTAB"
+
+# Muda sempre que o layout do arquivo mudar
+FORMATO = 1
+
+# Faixa das seções ("cardinal" de 0 a 999.999 e "moeda" de R$ 0,00 a
+# R$ 9.999,99, em centavos)
+TAMANHO_COMPLETO = 1_000_000
+
+_CABECALHO = struct.Struct("<8sIcxxxI32s")
+_ENTRADA = struct.Struct("<32sIQQQI4x")
+_ORDEM = b"L" if sys.byteorder == "little" else b"B"
+
+# Valores convertidos na hora de calcular a assinatura: cobrem os
+# conectivos, "mil" sozinho, classes grandes, feminino e moeda
+_AMOSTRA = (
+    0, 1, 2, 10, 16, 100, 101, 110, 1000, 1001, 1100, 1101, 2000, 2200,
+    21_000, 100_000, 101_000, 999_999, 1_000_000, 1_000_001, 1_001_000,
+    1_100_000, 2_000_000, 2_200_001, 10**9 + 1, 10**12 + 10**9, 10**18, 10**21 + 1,
+)
+
+_assinatura = None
+
+
+def _tabelas_base() -> dict:
+    """As tabelas de grupo de tabelas.py, por nome (entram na assinatura)."""
+    secoes = {
+        "grupos": GRUPOS,
+        "grupos_feminino": GRUPOS_FEMININO,
+        "conectivos": CONECTIVOS,
+        "conectivos_apos_mil": CONECTIVOS_APOS_MIL,
+        "sufixos": SUFIXOS,
+        "sufixos_apos_mil": SUFIXOS_APOS_MIL,
+        "sufixos_feminino": SUFIXOS_FEMININO,
+        "sufixos_apos_mil_feminino": SUFIXOS_APOS_MIL_FEMININO,
+        "classe_1_feminino": GRUPOS_CLASSE_FEMININO[1],
+    }
+    for i in range(1, CLASSES_PRE_CALCULADAS):
+        secoes[f"classe_{i}"] = GRUPOS_CLASSE[i]
+    return secoes
+
+
+def assinatura() -> bytes:
+    """sha256 das tabelas e da amostra de conversões do código atual."""
+    global _assinatura
+    if _assinatura is None:
+        h = hashlib.sha256(b"%d\n" % FORMATO)
+        for nome, tabela in _tabelas_base().items():
+            h.update(nome.encode() + b"\n" + "\n".join(tabela).encode() + b"\n")
+        for numero in _AMOSTRA:
+            h.update(por_extenso(numero).encode() + b"\n")
+            h.update(por_extenso(numero, feminino=True).encode() + b"\n")
+            h.update(por_extenso_centavos(numero).encode() + b"\n")
+        _assinatura = h.digest()
+    return _assinatura
+
+
+def _alinhar(arquivo) -> None:
+    """Completa com zeros até a próxima posição múltipla de 8."""
+    resto = arquivo.tell() % 8
+    if resto:
+        arquivo.write(b"\0" * (8 - resto))
+
+
+def compilar_tabela(caminho: str) -> int:
+    """
+    Gera o arquivo da tabela, com as seções "cardinal" (0 a 999.999) e
+    "moeda" (R$ 0,00 a R$ 9.999,99).
+
+    Parâmetros:
+        caminho: Onde gravar (o arquivo é trocado de uma vez no final, então
+            processos que já estão com a versão antiga aberta não veem
+            um arquivo pela metade)
+
+    Retorna:
+        Tamanho do arquivo, em bytes
+    """
+    secoes = {
+        "cardinal": por_extenso_lote(range(TAMANHO_COMPLETO)),
+        "moeda": [por_extenso_centavos(c) for c in range(TAMANHO_COMPLETO)],
+    }
+
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(_CABECALHO.pack(MAGICO, FORMATO, _ORDEM, len(secoes), assinatura()))
+            diretorio = arquivo.tell()
+            arquivo.write(b"\0" * (_ENTRADA.size * len(secoes)))
+
+            entradas = []
+            for nome, textos in secoes.items():
+                blob = "".join(textos).encode("utf-8")
+                # Offsets em bytes: com acento, len() do str não serve
+                offsets = array("I", accumulate((len(t.encode("utf-8")) for t in textos), initial=0))
+                dados_offsets = offsets.tobytes()
+
+                _alinhar(arquivo)
+                pos_offsets = arquivo.tell()
+                arquivo.write(dados_offsets)
+                _alinhar(arquivo)
+                pos_blob = arquivo.tell()
+                arquivo.write(blob)
+
+                crc = zlib.crc32(blob, zlib.crc32(dados_offsets))
+                entradas.append(_ENTRADA.pack(
+                    nome.encode(), len(textos), pos_offsets, pos_blob, len(blob), crc
+                ))
+
+            arquivo.seek(diretorio)
+            arquivo.write(b"".join(entradas))
+            tamanho = arquivo.seek(0, 2)
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    return tamanho
+
+
+class TabelaMapeada:
+    """
+    Um arquivo de compilar_tabela() aberto com mmap (somente leitura).
+
+    Pode ser usado à vontade por várias threads: depois de aberto, nada
+    aqui muda a não ser a marcação de seção já conferida.
+    """
+
+    __slots__ = ("caminho", "_mapa", "_secoes", "_verificar", "_conferidas", "_faixas")
+
+    def __init__(self, caminho: str, verificar: bool = True):
+        """
+        Parâmetros:
+            caminho: O arquivo gerado por compilar_tabela()
+            verificar: Confere o crc32 de cada seção no primeiro uso
+
+        Levanta ValueError se o arquivo não for uma tabela, estiver
+        truncado, for de outro formato ou arquitetura, ou tiver sido gerado
+        por uma versão que escreve os números de outro jeito.
+        """
+        self.caminho = caminho
+        self._verificar = verificar
+        self._conferidas = set()
+        self._faixas = {}
+        self._mapa = None
+        with open(caminho, "rb") as arquivo:
+            if arquivo.seek(0, 2) < _CABECALHO.size:
+                raise ValueError(f"{caminho} não é uma tabela do numextenso")
+            # O mmap continua válido depois de fechar o arquivo
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._secoes = self._ler_diretorio()
+        except BaseException:
+            self.fechar()
+            raise
+
+    def _ler_diretorio(self) -> dict:
+        mapa = self._mapa
+        magico, formato, ordem, quantidade, gravada = _CABECALHO.unpack_from(mapa, 0)
+        if magico != MAGICO:
+            raise ValueError(f"{self.caminho} não é uma tabela do numextenso")
+        if formato != FORMATO:
+            raise ValueError(
+                f"Tabela no formato {formato}, esta versão lê o formato {FORMATO}: "
+                "gere de novo com 'numextenso tabela compilar'"
+            )
+        if ordem != _ORDEM:
+            raise ValueError("Tabela gerada numa máquina com outra ordem de bytes")
+        if gravada != assinatura():
+            raise ValueError(
+                f"Tabela desatualizada ({self.caminho}): foi gerada por uma versão do "
+                "numextenso que escreve os números de outro jeito. "
+                "Gere de novo com 'numextenso tabela compilar'"
+            )
+
+        # Arquivo cortado no meio do diretório: confere antes de ler as
+        # entradas, senão o unpack_from estoura struct.error
+        if _CABECALHO.size + quantidade * _ENTRADA.size > len(mapa):
+            raise ValueError(f"{self.caminho} está truncado")
+
+        secoes = {}
+        for i in range(quantidade):
+            nome, itens, pos_offsets, pos_blob, tamanho_blob, crc = _ENTRADA.unpack_from(
+                mapa, _CABECALHO.size + i * _ENTRADA.size
+            )
+            if pos_blob + tamanho_blob > len(mapa) or pos_offsets + 4 * (itens + 1) > len(mapa):
+                raise ValueError(f"{self.caminho} está truncado")
+            offsets = memoryview(mapa)[pos_offsets:pos_offsets + 4 * (itens + 1)].cast("I")
+            secoes[nome.rstrip(b"\0").decode()] = (itens, offsets, pos_blob, tamanho_blob, crc)
+        return secoes
+
+    @property
+    def secoes(self) -> dict:
+        """Nome de cada seção -> quantidade de itens."""
+        return {nome: secao[0] for nome, secao in self._secoes.items()}
+
+    def _secao(self, nome: str) -> tuple:
+        try:
+            secao = self._secoes[nome]
+        except KeyError:
+            raise ValueError(f"A tabela não tem a seção {nome!r}") from None
+        if self._verificar and nome not in self._conferidas:
+            _, offsets, pos_blob, tamanho_blob, crc = secao
+            calculado = zlib.crc32(memoryview(self._mapa)[pos_blob:pos_blob + tamanho_blob],
+                                   zlib.crc32(offsets.cast("B")))
+            if calculado != crc:
+                raise ValueError(f"Seção {nome!r} de {self.caminho} está corrompida (crc32 não bate)")
+            self._conferidas.add(nome)
+        return secao
+
+    def bytes(self, secao: str, indice: int) -> bytes:
+        """O item `indice` da seção, em UTF-8 (sem decodificar)."""
+        itens, offsets, pos_blob, _, _ = self._secao(secao)
+        if not 0 <= indice < itens:
+            raise IndexError(f"Índice {indice} fora da seção {secao!r} (0 a {itens - 1})")
+        return self._mapa[pos_blob + offsets[indice]:pos_blob + offsets[indice + 1]]
+
+    def texto(self, secao: str, indice: int) -> str:
+        """O item `indice` da seção, como str."""
+        return self.bytes(secao, indice).decode("utf-8")
+
+    def tem(self, secao: str) -> bool:
+        """Se o arquivo tem a seção ("cardinal", "moeda")."""
+        return secao in self._secoes
+
+    def _faixa(self, nome: str) -> tuple:
+        """(itens, offsets, início do blob) da seção já conferida, ou None se ela não existe."""
+        faixa = self._faixas.get(nome)
+        if faixa is None and nome in self._secoes:
+            itens, offsets, pos_blob, _, _ = self._secao(nome)
+            faixa = self._faixas[nome] = (itens, offsets, pos_blob)
+        return faixa
+
+    def por_extenso(self, numero) -> str:
+        """Mesmo que numextenso.por_extenso(numero), lendo da seção "cardinal" quando dá."""
+        faixa = self._faixas.get("cardinal") or self._faixa("cardinal")
+        if faixa is not None and type(numero) is int and 0 <= numero < faixa[0]:
+            _, offsets, inicio = faixa
+            return self._mapa[inicio + offsets[numero]:inicio + offsets[numero + 1]].decode("utf-8")
+        return por_extenso(numero)
+
+    def por_extenso_centavos(self, centavos) -> str:
+        """Mesmo que numextenso.por_extenso_centavos(centavos) em reais, lendo da seção "moeda"."""
+        faixa = self._faixas.get("moeda") or self._faixa("moeda")
+        if faixa is not None and type(centavos) is int and 0 <= centavos < faixa[0]:
+            _, offsets, inicio = faixa
+            return self._mapa[inicio + offsets[centavos]:inicio + offsets[centavos + 1]].decode("utf-8")
+        return por_extenso_centavos(centavos)
+
+    def fechar(self) -> None:
+        """Fecha o mmap (depois disso a tabela não pode mais ser usada)."""
+        if self._mapa is None:
+            return
+        for _, offsets, _, _, _ in getattr(self, "_secoes", {}).values():
+            offsets.release()
+        self._secoes = {}
+        self._faixas = {}
+        self._mapa.close()
+        self._mapa = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+# Tabelas já abertas neste processo, por caminho
+_abertas = {}
+
+
+def abrir_tabela(caminho: str, verificar: bool = True) -> TabelaMapeada:
+    """
+    Abre a tabela (ou devolve a que já está aberta neste processo).
+
+    Chamando isto antes do fork (gunicorn --preload, por exemplo), os
+    trabalhadores já nascem com o mapeamento.
+    """
+    chave = os.path.abspath(caminho)
+    tabela = _abertas.get(chave)
+    if tabela is None:
+        nova = TabelaMapeada(caminho, verificar)
+        # Duas threads abrindo ao mesmo tempo: fica a primeira que chegou
+        tabela = _abertas.setdefault(chave, nova)
+        if tabela is not nova:
+            nova.fechar()
+    return tabela
+
+
+def main_tabela(args: list = None) -> int:
+    """numextenso tabela: compila ou confere o arquivo de tabela."""
+    parser = argparse.ArgumentParser(
+        prog="numextenso tabela",
+        description="Compila a tabela pré-calculada pra ser mapeada na memória (mmap).",
+    )
+    subcomandos = parser.add_subparsers(dest="acao", required=True)
+
+    compilar = subcomandos.add_parser(
+        "compilar",
+        help="Gera o arquivo com todo cardinal de 0 a 999.999 e todo valor de R$ 0,00 a R$ 9.999,99 (~120 MB)"
+    )
+    compilar.add_argument("arquivo", help="Arquivo de saída")
+
+    info = subcomandos.add_parser("info", help="Confere o arquivo e lista as seções")
+    info.add_argument("arquivo", help="Arquivo da tabela")
+
+    opts = parser.parse_args(args)
+
+    try:
+        if opts.acao == "compilar":
+            tamanho = compilar_tabela(opts.arquivo)
+            print(f"{opts.arquivo}: {tamanho / 1e6:.1f} MB")
+            return 0
+
+        with TabelaMapeada(opts.arquivo) as tabela:
+            for nome, itens in tabela.secoes.items():
+                tabela.bytes(nome, 0)  # confere o crc32
+                print(f"{nome:<28} {itens:>10,} itens".replace(",", "."))
+        print("ok: tabela íntegra e atualizada")
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
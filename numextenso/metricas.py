@@ -0,0 +1,307 @@
+"""
+Métricas opcionais: chamadas, erros e latência de cada ponto de entrada.
+
+Pra saber em produção quantas conversões de cada tipo estão saindo,
+quantas falham na validação (e por quê) e quanto tempo elas levam.
+
+Vem desligado. Pra ligar:
+
+    >>> from numextenso import metricas
+    >>> metricas.ativar()
+    >>> por_extenso_moeda(19.90)
+    'dezenove reais e noventa centavos'
+    >>> metricas.snapshot()["por_extenso_moeda"]["chamadas"]
+    1
+
+Pontos de entrada medidos: por_extenso, por_extenso_moeda,
+por_extenso_centavos, por_extenso_ordinal, por_extenso_lote (uma
+medição por lote), por_extenso_bytes, por_extenso_bytes_lote e
+converter_texto (a leitura + conversão de cada linha do CLI). Cada
+chamada conta uma vez só, no ponto de entrada que foi chamado: o lote
+não conta de novo cada valor. Conversor e gerar_extenso ficam de fora
+de propósito: são os caminhos pra quem quer o mínimo possível por
+chamada.
+
+Igual ao cache, o conversor só olha a variável COLETOR - desligado,
+custa um "is None" por chamada. Ligado, cada chamada paga duas
+leituras de relógio e uma trava (da fatia da thread, não uma global).
+Tudo aqui é thread-safe.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+# Limites dos baldes do histograma de latência, em nanossegundos
+LIMITES_NS = (
+    500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000,
+    100_000, 250_000, 1_000_000, 10_000_000, 100_000_000,
+)
+
+# Pedaços do Coletor, cada um com a sua trava (ver Coletor). Primo: o id
+# da thread costuma ser o endereço dela na memória (múltiplo de potência
+# de 2), e com 16 fatias todas cairiam na mesma
+FATIAS = 17
+
+# Maior tamanho do motivo de erro (o motivo vira label no Prometheus)
+TAMANHO_MOTIVO = 80
+
+# None = métricas desligadas. Quando ligadas, o Coletor em uso.
+COLETOR = None
+
+
+def _motivo(erro: Exception) -> str:
+    """
+    Motivo do erro, sem o valor que causou ele.
+
+    Fica só a primeira frase, antes de qualquer ":" - "Moeda
+    desconhecida: 'XYZ'" vira "Moeda desconhecida". Senão cada valor
+    inválido diferente viraria um motivo novo.
+    """
+    motivo = str(erro).split(":", 1)[0].split(". ", 1)[0].strip() or type(erro).__name__
+    return motivo[:TAMANHO_MOTIVO]
+
+
+class _Entrada:
+    """Contadores de um ponto de entrada."""
+
+    __slots__ = ("chamadas", "erros", "baldes", "soma_ns")
+
+    def __init__(self):
+        self.chamadas = 0
+        self.erros = {}
+        self.baldes = [0] * (len(LIMITES_NS) + 1)  # o último é o +Inf
+        self.soma_ns = 0
+
+
+class Coletor:
+    """
+    Guarda as métricas de todos os pontos de entrada.
+
+    Os contadores ficam divididos em FATIAS pedaços, cada um com a sua
+    trava, e cada thread escreve no pedaço do seu id. Threads diferentes
+    quase nunca disputam a mesma trava (no Python sem GIL, uma trava só
+    pra todo mundo vira o gargalo). O snapshot soma os pedaços.
+    """
+
+    __slots__ = ("_fatias",)
+
+    def __init__(self):
+        self._fatias = tuple((threading.Lock(), {}) for _ in range(FATIAS))
+
+    def medir(self, entrada: str, funcao, *args):
+        """Chama funcao(*args) registrando tempo e erro (se houver)."""
+        relogio = time.perf_counter_ns
+        inicio = relogio()
+        try:
+            resultado = funcao(*args)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            self.registrar(entrada, relogio() - inicio, e)
+            raise
+        self.registrar(entrada, relogio() - inicio)
+        return resultado
+
+    def registrar(self, entrada: str, duracao_ns: int, erro: Exception = None) -> None:
+        """Registra uma chamada já medida."""
+        balde = bisect_left(LIMITES_NS, duracao_ns)
+        motivo = None if erro is None else _motivo(erro)
+        trava, entradas = self._fatias[threading.get_ident() % FATIAS]
+        with trava:
+            contadores = entradas.get(entrada)
+            if contadores is None:
+                contadores = entradas[entrada] = _Entrada()
+            contadores.chamadas += 1
+            contadores.baldes[balde] += 1
+            contadores.soma_ns += duracao_ns
+            if motivo is not None:
+                contadores.erros[motivo] = contadores.erros.get(motivo, 0) + 1
+
+    def snapshot(self) -> dict:
+        somadas = {}
+        for trava, entradas in self._fatias:
+            with trava:
+                for entrada, c in entradas.items():
+                    total = somadas.get(entrada)
+                    if total is None:
+                        total = somadas[entrada] = _Entrada()
+                    total.chamadas += c.chamadas
+                    total.soma_ns += c.soma_ns
+                    total.baldes = [x + y for x, y in zip(total.baldes, c.baldes)]
+                    for motivo, quantidade in c.erros.items():
+                        total.erros[motivo] = total.erros.get(motivo, 0) + quantidade
+        return {
+            entrada: {
+                "chamadas": c.chamadas,
+                "erros": c.erros,
+                "latencia": {
+                    "limites_ns": LIMITES_NS,
+                    "baldes": c.baldes,
+                    "soma_ns": c.soma_ns,
+                },
+            }
+            for entrada, c in sorted(somadas.items())
+        }
+
+    def zerar(self) -> None:
+        for trava, entradas in self._fatias:
+            with trava:
+                entradas.clear()
+
+
+def ativar() -> None:
+    """Liga as métricas (se já estavam ligadas, continua contando)."""
+    global COLETOR
+    if COLETOR is None:
+        COLETOR = Coletor()
+
+
+def desativar() -> None:
+    """Desliga as métricas e descarta o que foi contado."""
+    global COLETOR
+    COLETOR = None
+
+
+def ativo() -> bool:
+    """True se as métricas estão ligadas."""
+    return COLETOR is not None
+
+
+def snapshot() -> dict:
+    """
+    Cópia das métricas do momento.
+
+    Retorna:
+        Dicionário ponto de entrada -> {"chamadas", "erros", "latencia"}.
+        "erros" é motivo -> quantidade; "latencia" traz os limites dos
+        baldes (ns), a contagem de cada balde (o último é acima do maior
+        limite) e a soma dos tempos. Vazio se estiver desligado.
+    """
+    coletor = COLETOR
+    if coletor is None:
+        return {}
+    return coletor.snapshot()
+
+
+def zerar() -> None:
+    """Zera todos os contadores (continua ligado)."""
+    coletor = COLETOR
+    if coletor is not None:
+        coletor.zerar()
+
+
+def percentil_ns(latencia: dict, p: float) -> int:
+    """
+    Percentil aproximado (limite do balde onde ele cai), em ns.
+
+    Devolve None se não teve nenhuma chamada, e o maior limite se o
+    percentil cair no balde de cima (+Inf).
+    """
+    total = sum(latencia["baldes"])
+    if not total:
+        return None
+    alvo = p * total
+    acumulado = 0
+    for limite, quantidade in zip(latencia["limites_ns"], latencia["baldes"]):
+        acumulado += quantidade
+        if acumulado >= alvo:
+            return limite
+    return latencia["limites_ns"][-1]
+
+
+def _formatar_ns(ns: int) -> str:
+    if ns is None:
+        return "-"
+    if ns < 1_000:
+        return f"{ns} ns"
+    if ns < 1_000_000:
+        return f"{ns / 1_000:g} µs"
+    return f"{ns / 1_000_000:g} ms"
+
+
+def resumo(dados: dict = None) -> str:
+    """
+    Tabela legível das métricas (é o que o numextenso --stats imprime).
+
+    Parâmetros:
+        dados: Um snapshot() (opcional, padrão é o do momento)
+    """
+    if dados is None:
+        dados = snapshot()
+
+    linhas = [f"{'entrada':<22} {'chamadas':>10} {'erros':>8} {'p50 <=':>10} {'p99 <=':>10}"]
+    motivos = []
+    for entrada, m in sorted(dados.items()):
+        erros = sum(m["erros"].values())
+        linhas.append(
+            f"{entrada:<22} {m['chamadas']:>10,} {erros:>8,} "
+            f"{_formatar_ns(percentil_ns(m['latencia'], 0.50)):>10} "
+            f"{_formatar_ns(percentil_ns(m['latencia'], 0.99)):>10}"
+        )
+        for motivo, quantidade in sorted(m["erros"].items(), key=lambda item: -item[1]):
+            motivos.append(f"  {entrada}: {motivo} ({quantidade:,})")
+
+    if motivos:
+        linhas.append("erros por motivo:")
+        linhas.extend(motivos)
+    return "\n".join(linhas)
+
+
+def _escapar_label(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def exportar_prometheus(dados: dict = None) -> str:
+    """
+    Métricas no formato de texto do Prometheus (pra expor em /metrics).
+
+    Parâmetros:
+        dados: Um snapshot() (opcional, padrão é o do momento)
+
+    Exemplo com Flask:
+        @app.get("/metrics")
+        def metrics():
+            return exportar_prometheus(), 200, {"Content-Type": "text/plain; version=0.0.4"}
+    """
+    if dados is None:
+        dados = snapshot()
+
+    chamadas = [
+        "# HELP numextenso_chamadas_total Chamadas por ponto de entrada.",
+        "# TYPE numextenso_chamadas_total counter",
+    ]
+    erros = [
+        "# HELP numextenso_erros_total Chamadas que terminaram em erro, por motivo.",
+        "# TYPE numextenso_erros_total counter",
+    ]
+    latencia = [
+        "# HELP numextenso_latencia_segundos Duração de cada chamada.",
+        "# TYPE numextenso_latencia_segundos histogram",
+    ]
+
+    for entrada, m in sorted(dados.items()):
+        rotulo = f'entrada="{_escapar_label(entrada)}"'
+        chamadas.append(f"numextenso_chamadas_total{{{rotulo}}} {m['chamadas']}")
+
+        for motivo, quantidade in sorted(m["erros"].items()):
+            erros.append(
+                f'numextenso_erros_total{{{rotulo},motivo="{_escapar_label(motivo)}"}} {quantidade}'
+            )
+
+        # No Prometheus os baldes são acumulados
+        acumulado = 0
+        dados_latencia = m["latencia"]
+        for limite, quantidade in zip(dados_latencia["limites_ns"], dados_latencia["baldes"]):
+            acumulado += quantidade
+            latencia.append(
+                f'numextenso_latencia_segundos_bucket{{{rotulo},le="{limite / 1e9!r}"}} {acumulado}'
+            )
+        total = sum(dados_latencia["baldes"])
+        latencia.append(f'numextenso_latencia_segundos_bucket{{{rotulo},le="+Inf"}} {total}')
+        # repr, não :g - com 6 dígitos a soma acumulada para de andar e o
+        # rate() calculado em cima dela sai errado
+        latencia.append(
+            f"numextenso_latencia_segundos_sum{{{rotulo}}} {dados_latencia['soma_ns'] / 1e9!r}"
+        )
+        latencia.append(f"numextenso_latencia_segundos_count{{{rotulo}}} {total}")
+
+    return "\n".join(chamadas + erros + latencia) + "\n"
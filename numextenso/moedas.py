@@ -0,0 +1,169 @@
+"""
+Registro de moedas pelo código ISO 4217.
+
+    >>> por_extenso_moeda(1.5, moeda="USD")
+    'um dólar e cinquenta centavos'
+    >>> por_extenso_moeda(2500, moeda="PYG")
+    'dois mil e quinhentos guaranis'
+    >>> por_extenso_moeda(1.5, moeda="KWD")
+    'um dinar kuwaitiano e quinhentos fils'
+    >>> por_extenso_moeda(2.02, moeda="EGP")
+    'duas libras egípcias e duas piastras'
+
+Este módulo só é importado quando alguém passa um código (string) como
+moeda - quem usa só reais não paga nada por ele. E cada definição só
+vira dicionário na primeira vez que o código é pedido.
+
+"casas" é o expoente da menor unidade da moeda (ISO 4217): 2 pra
+centavos, 0 pra moedas sem fração (guarani, iene) e 3 pros dinares
+que se dividem em mil fils.
+
+Moedas de nome feminino (libra, coroa, rupia) levam feminino=True, e o
+número na frente vai pro feminino ("duas libras", "duzentas e uma
+libras"). A fração tem o gênero dela: decimal_feminino=True pra "duas
+piastras", e o pêni da libra esterlina continua "dois pence".
+"""
+
+import threading
+
+from .constantes import MOEDA_BRL
+
+# Menor e maior expoente aceitos (ISO 4217 vai de 0 a 4)
+CASAS_VALIDAS = range(0, 5)
+
+# código -> (singular, plural, fração singular, fração plural, casas, símbolo
+#           [, moeda feminina, fração feminina])
+_DEFINICOES = {
+    "USD": ("dólar", "dólares", "centavo", "centavos", 2, "US$"),
+    "EUR": ("euro", "euros", "cêntimo", "cêntimos", 2, "€"),
+    "ARS": ("peso argentino", "pesos argentinos", "centavo", "centavos", 2, "$"),
+    "UYU": ("peso uruguaio", "pesos uruguaios", "centésimo", "centésimos", 2, "$U"),
+    "CLP": ("peso chileno", "pesos chilenos", None, None, 0, "$"),
+    "COP": ("peso colombiano", "pesos colombianos", "centavo", "centavos", 2, "$"),
+    "MXN": ("peso mexicano", "pesos mexicanos", "centavo", "centavos", 2, "$"),
+    "PYG": ("guarani", "guaranis", None, None, 0, "₲"),
+    "BOB": ("boliviano", "bolivianos", "centavo", "centavos", 2, "Bs"),
+    "CAD": ("dólar canadense", "dólares canadenses", "centavo", "centavos", 2, "C$"),
+    "AUD": ("dólar australiano", "dólares australianos", "centavo", "centavos", 2, "A$"),
+    "CHF": ("franco suíço", "francos suíços", "cêntimo", "cêntimos", 2, "CHF"),
+    "JPY": ("iene", "ienes", None, None, 0, "¥"),
+    "KRW": ("won", "wons", None, None, 0, "₩"),
+    "AOA": ("kwanza", "kwanzas", "cêntimo", "cêntimos", 2, "Kz"),
+    "CVE": ("escudo cabo-verdiano", "escudos cabo-verdianos", "centavo", "centavos", 2, "$"),
+    "MZN": ("metical", "meticais", "centavo", "centavos", 2, "MT"),
+    "KWD": ("dinar kuwaitiano", "dinares kuwaitianos", "fils", "fils", 3, "KD"),
+    "BHD": ("dinar bareinita", "dinares bareinitas", "fils", "fils", 3, "BD"),
+    "JOD": ("dinar jordaniano", "dinares jordanianos", "fils", "fils", 3, "JD"),
+    "TND": ("dinar tunisiano", "dinares tunisianos", "milim", "milins", 3, "DT"),
+    "OMR": ("rial omanense", "riais omanenses", "baisa", "baisas", 3, "RO"),
+    "GBP": ("libra esterlina", "libras esterlinas", "pêni", "pence", 2, "£", True),
+    "EGP": ("libra egípcia", "libras egípcias", "piastra", "piastras", 2, "E£", True, True),
+}
+
+# Definições já montadas (código -> dicionário). O real já vem pronto.
+_compiladas = {"BRL": MOEDA_BRL}
+_trava = threading.Lock()
+
+
+def criar_moeda(
+    inteiro_singular: str,
+    inteiro_plural: str,
+    decimal_singular: str = None,
+    decimal_plural: str = None,
+    casas: int = 2,
+    simbolo: str = "",
+    feminino: bool = False,
+    decimal_feminino: bool = False,
+) -> dict:
+    """
+    Monta (e confere) o dicionário de uma moeda.
+
+    Parâmetros:
+        inteiro_singular, inteiro_plural: Nome da moeda ("dólar", "dólares")
+        decimal_singular, decimal_plural: Nome da fração ("centavo", "centavos")
+        casas: Casas decimais da moeda (0 se ela não tem fração)
+        simbolo: Símbolo, só informativo
+        feminino: Nome da moeda é feminino ("duas libras")
+        decimal_feminino: Nome da fração é feminino ("duas piastras")
+
+    Retorna:
+        Dicionário no formato que por_extenso_moeda() aceita
+    """
+    if not isinstance(casas, int) or casas not in CASAS_VALIDAS:
+        raise ValueError(f"casas precisa ser um int de 0 a 4, recebi {casas!r}")
+    if not isinstance(feminino, bool) or not isinstance(decimal_feminino, bool):
+        raise ValueError("feminino e decimal_feminino precisam ser True ou False")
+
+    nomes = [inteiro_singular, inteiro_plural]
+    if casas:
+        nomes += [decimal_singular, decimal_plural]
+    for nome in nomes:
+        if not isinstance(nome, str) or not nome.strip():
+            raise ValueError("Faltou o nome da moeda (ou da fração) no singular e no plural")
+
+    return {
+        "inteiro_singular": inteiro_singular,
+        "inteiro_plural": inteiro_plural,
+        "decimal_singular": decimal_singular if casas else None,
+        "decimal_plural": decimal_plural if casas else None,
+        "simbolo": simbolo,
+        "casas": casas,
+        "feminino": feminino,
+        "decimal_feminino": decimal_feminino and bool(casas),
+    }
+
+
+def registrar_moeda(codigo: str, moeda: dict) -> None:
+    """
+    Registra (ou substitui) uma moeda pra ser usada pelo código.
+
+    Exemplos:
+        >>> registrar_moeda("XPT", criar_moeda("ponto", "pontos", casas=0))
+        >>> por_extenso_moeda(3, moeda="XPT")
+        'três pontos'
+    """
+    codigo = _normalizar_codigo(codigo)
+    conferida = criar_moeda(
+        moeda.get("inteiro_singular"),
+        moeda.get("inteiro_plural"),
+        moeda.get("decimal_singular"),
+        moeda.get("decimal_plural"),
+        moeda.get("casas", 2),
+        moeda.get("simbolo", ""),
+        moeda.get("feminino", False),
+        moeda.get("decimal_feminino", False),
+    )
+    with _trava:
+        _compiladas[codigo] = conferida
+
+
+def obter_moeda(codigo: str) -> dict:
+    """
+    Devolve o dicionário da moeda com esse código ISO 4217 ("USD", "eur"...).
+
+    Levanta ValueError se o código não estiver registrado.
+    """
+    moeda = _compiladas.get(codigo)
+    if moeda is not None:
+        return moeda
+
+    codigo = _normalizar_codigo(codigo)
+    with _trava:
+        moeda = _compiladas.get(codigo)
+        if moeda is None:
+            definicao = _DEFINICOES.get(codigo)
+            if definicao is None:
+                raise ValueError(f"Moeda desconhecida: {codigo!r}")
+            moeda = _compiladas[codigo] = criar_moeda(*definicao)
+    return moeda
+
+
+def moedas_disponiveis() -> list:
+    """Códigos de todas as moedas registradas, em ordem alfabética."""
+    return sorted(set(_DEFINICOES) | set(_compiladas))
+
+
+def _normalizar_codigo(codigo) -> str:
+    if not isinstance(codigo, str):
+        raise TypeError(f"Código da moeda precisa ser str, recebi {type(codigo).__name__}")
+    return codigo.strip().upper()
@@ -0,0 +1,92 @@
+"""
+Integração com o pandas: o acessor .extenso das Series.
+
+    >>> import numextenso.pandas  # registra o acessor
+    >>> precos = pd.Series([19.9, 5, 19.9, 19.9])
+    >>> precos.extenso.moeda()
+    0    dezenove reais e noventa centavos
+    1                          cinco reais
+    2    dezenove reais e noventa centavos
+    3    dezenove reais e noventa centavos
+    dtype: category
+
+Diferente de precos.map(por_extenso_moeda), que chama a função uma vez
+por linha e guarda uma string por linha, aqui só os valores distintos
+são convertidos (num por_extenso_lote só) e o resultado é uma coluna
+category: cada linha é um código apontando pro texto. Tempo e memória
+crescem com a quantidade de valores diferentes, não de linhas.
+
+Valores ausentes (NaN, None, pd.NA) continuam ausentes no resultado.
+
+O pandas só é importado aqui: "import numextenso" não carrega nada disso.
+"""
+
+try:
+    import pandas as pd
+except ImportError:
+    raise ImportError("numextenso.pandas precisa do pandas: pip install numextenso[pandas]") from None
+
+import numpy as np
+
+from .lote import _categorias
+
+
+def por_extenso_series(
+    serie,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    moeda: dict | str = None,
+):
+    """
+    Converte uma Series inteira, devolvendo uma Series category.
+
+    Parâmetros:
+        serie: pandas.Series de números (ou de textos como "1.234,56")
+        modo: "cardinal", "moeda" ou "ordinal"
+        feminino: Forma feminina ("duas mil", "segunda"); não vale pro modo "moeda"
+        moeda: Código ISO 4217 ou dicionário da moeda (só pro modo "moeda")
+
+    Retorna:
+        Series com o mesmo índice e nome, dtype category
+    """
+    # codigos[i] = posição do valor da linha i em unicos (-1 pra ausente)
+    codigos, unicos = serie.factorize()
+    valores = unicos.to_numpy()
+    if valores.dtype == object:
+        valores = valores.tolist()
+
+    categorias, posicoes = _categorias(valores, modo, feminino, moeda)
+    if posicoes:
+        # O -1 no fim faz mapa[-1] continuar -1: ausente segue ausente
+        mapa = np.array(posicoes + [-1], dtype=np.intp)
+        codigos = mapa[codigos]
+
+    return pd.Series(
+        pd.Categorical.from_codes(codigos, categories=categorias),
+        index=serie.index,
+        name=serie.name,
+    )
+
+
+@pd.api.extensions.register_series_accessor("extenso")
+class AcessorExtenso:
+    """
+    s.extenso.cardinal(), s.extenso.moeda() e s.extenso.ordinal().
+
+    Também dá pra chamar direto: s.extenso(modo="moeda", moeda="USD").
+    """
+
+    def __init__(self, serie):
+        self._serie = serie
+
+    def __call__(self, modo: str = "cardinal", feminino: bool = False, moeda: dict | str = None):
+        return por_extenso_series(self._serie, modo, feminino, moeda)
+
+    def cardinal(self, feminino: bool = False):
+        return por_extenso_series(self._serie, "cardinal", feminino)
+
+    def moeda(self, moeda: dict | str = None):
+        return por_extenso_series(self._serie, "moeda", moeda=moeda)
+
+    def ordinal(self, feminino: bool = False):
+        return por_extenso_series(self._serie, "ordinal", feminino)
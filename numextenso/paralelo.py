@@ -0,0 +1,214 @@
+"""
+Conversão usando vários núcleos.
+
+Um processo Python só usa um núcleo. Pra arquivos com centenas de
+milhões de valores, a entrada é quebrada em blocos e cada bloco vai
+pra um processo de um ProcessPoolExecutor. Os resultados voltam na
+mesma ordem da entrada.
+
+Só os blocos (e o modo) viajam entre processos. As tabelas de
+tabelas.py são montadas no import do pacote, então cada processo
+trabalhador já as tem desde que nasce (no Linux, herdadas do processo
+pai via fork, sem cópia nenhuma) - nada disso é serializado por tarefa.
+
+No Python sem GIL (3.13t, free-threaded), threads rodam de verdade em
+paralelo e não pagam nada disso: com pool="thread" os blocos vão pra um
+ThreadPoolExecutor, sem serializar entrada nem resultado. As conversões
+não mexem em estado compartilhado (as tabelas são tuplas montadas uma
+vez; cache e métricas têm travas por fatia), então dá pra chamar
+por_extenso, por_extenso_moeda e por_extenso_ordinal de quantas threads
+quiser. No Python com GIL as threads não passam de um núcleo, então lá o
+padrão (pool=None) continua sendo processo.
+"""
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+
+from .fluxo import converter_linhas, validar_opcoes
+from .lote import por_extenso_lote
+
+# Linhas (ou valores) por tarefa mandada pra um processo
+TAMANHO_BLOCO = 10_000
+
+# Tipos de pool aceitos (parâmetro pool e aio.configurar_pool)
+TIPOS_POOL = ("thread", "processo")
+
+
+def gil_ativo() -> bool:
+    """False no Python sem GIL (3.13t rodando com o GIL desligado)."""
+    verificar = getattr(sys, "_is_gil_enabled", None)
+    return True if verificar is None else verificar()
+
+
+def _tipo_pool(pool: str | None) -> str:
+    """None -> thread no Python sem GIL, processo no resto."""
+    if pool is None:
+        return "processo" if gil_ativo() else "thread"
+    if pool not in TIPOS_POOL:
+        raise ValueError(f"Tipo de pool inválido: {pool!r}. Use um de: {', '.join(TIPOS_POOL)}")
+    return pool
+
+
+def _blocos(iteravel, tamanho: int):
+    """Quebra um iterável em listas de até `tamanho` itens, sem ler tudo."""
+    iterador = iter(iteravel)
+    while True:
+        bloco = list(islice(iterador, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def _mapear_em_ordem(funcao, blocos, jobs: int, pool: str = "processo"):
+    """
+    Aplica `funcao` em cada bloco num pool de processos (ou threads), em ordem.
+
+    Diferente de Executor.map(), não submete a entrada inteira de uma vez:
+    no máximo 2 blocos por trabalhador ficam em voo, então a memória fica
+    constante mesmo com entradas enormes.
+    """
+    if pool == "thread":
+        executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="numextenso")
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+    with executor:
+        pendentes = deque()
+        for bloco in blocos:
+            pendentes.append(executor.submit(funcao, bloco))
+            if len(pendentes) >= jobs * 2:
+                yield pendentes.popleft().result()
+        while pendentes:
+            yield pendentes.popleft().result()
+
+
+def _jobs(jobs: int | None) -> int:
+    """None ou 0 -> um processo por núcleo."""
+    if not jobs:
+        return os.cpu_count() or 1
+    if jobs < 0:
+        raise ValueError("O número de processos precisa ser positivo")
+    return jobs
+
+
+def _converter_bloco_linhas(modo: str, feminino: bool, erros: str, bloco: tuple) -> tuple:
+    """Roda no trabalhador (processo ou thread): converte um bloco de linhas."""
+    primeira_linha, linhas = bloco
+    avisos = []
+    resultados = list(converter_linhas(
+        linhas,
+        modo=modo,
+        feminino=feminino,
+        erros=erros,
+        avisar=lambda numero_linha, erro: avisos.append((numero_linha, str(erro))),
+        primeira_linha=primeira_linha,
+    ))
+    return resultados, avisos
+
+
+def converter_linhas_paralelo(
+    linhas,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    erros: str = "abortar",
+    avisar=None,
+    jobs: int = None,
+    tamanho_bloco: int = TAMANHO_BLOCO,
+    pool: str = None,
+):
+    """
+    Mesmo que fluxo.converter_linhas(), mas usando vários processos (ou threads).
+
+    Parâmetros:
+        linhas, modo, feminino, erros, avisar: ver converter_linhas()
+        jobs: Número de processos/threads (None = um por núcleo)
+        tamanho_bloco: Linhas por tarefa
+        pool: "processo", "thread" ou None (thread no Python sem GIL,
+            processo no resto)
+
+    Gera:
+        Uma string por linha convertida, na ordem da entrada. Com
+        avisar, os avisos chegam como texto (o erro já formatado).
+    """
+    validar_opcoes(modo, erros)
+    jobs = _jobs(jobs)
+    pool = _tipo_pool(pool)
+    if jobs == 1:
+        yield from converter_linhas(linhas, modo, feminino, erros, avisar)
+        return
+
+    # Cada bloco leva junto o número da sua primeira linha, pras
+    # mensagens de erro apontarem a linha certa do arquivo
+    blocos = (
+        (i * tamanho_bloco + 1, bloco)
+        for i, bloco in enumerate(_blocos(linhas, tamanho_bloco))
+    )
+    funcao = partial(_converter_bloco_linhas, modo, feminino, erros)
+
+    for resultados, avisos in _mapear_em_ordem(funcao, blocos, jobs, pool):
+        if avisar is not None:
+            for numero_linha, erro in avisos:
+                avisar(numero_linha, erro)
+        yield from resultados
+
+
+def _converter_bloco_valores(modo: str, feminino: bool, moeda: dict, bloco: list) -> list:
+    """Roda no trabalhador (processo ou thread): converte um bloco de valores."""
+    return por_extenso_lote(bloco, modo=modo, feminino=feminino, moeda=moeda)
+
+
+def por_extenso_lote_paralelo(
+    valores,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    moeda: dict = None,
+    jobs: int = None,
+    tamanho_bloco: int = TAMANHO_BLOCO,
+    pool: str = None,
+) -> list:
+    """
+    Mesmo que por_extenso_lote(), mas dividindo o trabalho entre processos
+    (ou threads, com pool="thread").
+
+    Com processos, só compensa pra lotes grandes (centenas de milhares de
+    valores ou mais) - pra lotes pequenos, subir os processos custa mais
+    que converter. Threads sobem rápido e não serializam nada, mas só
+    ganham de um núcleo no Python sem GIL.
+
+    Parâmetros:
+        valores, modo, feminino, moeda: Como em por_extenso_lote()
+        jobs: Número de processos/threads (None = um por núcleo)
+        tamanho_bloco: Valores por tarefa
+        pool: "processo", "thread" ou None (thread no Python sem GIL,
+            processo no resto)
+
+    Exemplos:
+        >>> por_extenso_lote_paralelo(range(3), jobs=2)
+        ['zero', 'um', 'dois']
+        >>> por_extenso_lote_paralelo([1.5, 2], modo="moeda", jobs=4, pool="thread")
+        ['um real e cinquenta centavos', 'dois reais']
+    """
+    jobs = _jobs(jobs)
+    pool = _tipo_pool(pool)
+    if jobs == 1:
+        return por_extenso_lote(valores, modo=modo, feminino=feminino, moeda=moeda)
+
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(valores, np.ndarray):
+        # Fatias do array continuam arrays (e caem no caminho vetorizado)
+        valores = valores.ravel()
+        blocos = (
+            valores[i:i + tamanho_bloco]
+            for i in range(0, len(valores), tamanho_bloco)
+        )
+    else:
+        blocos = _blocos(valores, tamanho_bloco)
+
+    funcao = partial(_converter_bloco_valores, modo, feminino, moeda)
+    resultado = []
+    for textos in _mapear_em_ordem(funcao, blocos, jobs, pool):
+        resultado.extend(textos)
+    return resultado
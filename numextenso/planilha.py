@@ -0,0 +1,328 @@
+"""
+Conversão de uma coluna de CSV (numextenso csv).
+
+Pra arquivos exportados de vários GB: o arquivo de entrada é mapeado na
+memória (mmap) e percorrido linha a linha procurando os separadores
+direto nos bytes, sem montar uma lista de campos por linha. Só o campo
+da coluna pedida vira objeto Python. Cada linha sai do jeito que entrou,
+com a coluna nova no fim, montada num bytearray e escrita em blocos de
+4 MiB.
+
+A cada bloco escrito, as páginas do mmap que já foram lidas são
+devolvidas pro sistema (madvise), então a memória fica do mesmo tamanho
+com 10 MB ou 10 GB de entrada.
+
+Uso:
+    numextenso csv --coluna valor --modo moeda entrada.csv saida.csv
+    numextenso csv --coluna valor --separador ";" entrada.csv - > saida.csv
+
+Linhas com aspas (campo com separador ou quebra de linha dentro) são
+raras nesses arquivos; quando aparecem, só aquela linha passa pelo
+módulo csv da biblioteca padrão. Igual a ele, aspa só abre um campo
+quando vem logo no começo do campo: em 12" pipe ela é texto normal.
+"""
+
+import argparse
+import csv
+import mmap
+import os
+import sys
+
+from .fluxo import ERROS, converter_texto, validar_opcoes
+from .lote import MODOS
+
+# A saída é escrita em blocos desse tamanho (4 MiB)
+TAMANHO_BLOCO = 4 << 20
+
+
+def _indice_coluna(cabecalho: bytes, coluna: str, separador: str) -> int:
+    """Posição (0, 1, 2...) da coluna no cabeçalho."""
+    texto = cabecalho.decode("utf-8-sig").rstrip("\r\n")
+    try:
+        nomes = next(csv.reader([texto], delimiter=separador))
+    except csv.Error as e:
+        raise ValueError(f"Cabeçalho mal formado: {e}") from None
+    try:
+        return nomes.index(coluna)
+    except ValueError:
+        raise ValueError(
+            f"Coluna {coluna!r} não está no cabeçalho ({', '.join(nomes)})"
+        ) from None
+
+
+def _campo_com_aspas(linha: bytes, indice: int, separador: str) -> bytes:
+    try:
+        campos = next(csv.reader([linha.decode("utf-8")], delimiter=separador))
+    except csv.Error as e:
+        raise ValueError(f"linha mal formada: {e}") from None
+    if indice >= len(campos):
+        return None
+    return campos[indice].encode("utf-8")
+
+
+def _fim_da_linha(mapa, inicio: int) -> int:
+    """Posição logo depois do \n que fecha a linha que começa em `inicio`."""
+    fim = mapa.find(b"\n", inicio)
+    return len(mapa) if fim == -1 else fim + 1
+
+
+def _abre_aspas(mapa, inicio: int, fim: int, sep: bytes) -> bool:
+    """True se algum campo da linha começa com aspas."""
+    return mapa[inicio:inicio + 1] == b'"' or mapa.find(sep + b'"', inicio, fim) != -1
+
+
+def _fim_com_aspas(mapa, inicio: int, sep: bytes) -> int:
+    """
+    Fim do registro que começa em `inicio`, pulando o que está dentro de
+    campos entre aspas (separador e quebra de linha ali são texto).
+
+    Aspa só abre campo no começo dele; no meio de um campo sem aspas é
+    texto normal. "" dentro do campo é uma aspa escapada, e um campo que
+    nunca fecha vai até o fim do arquivo (o módulo csv reclama dele).
+    """
+    tamanho = len(mapa)
+    pos = inicio
+    while True:
+        if mapa[pos:pos + 1] == b'"':
+            pos += 1
+            while True:
+                pos = mapa.find(b'"', pos)
+                if pos == -1:
+                    return tamanho
+                if mapa[pos + 1:pos + 2] != b'"':
+                    break
+                pos += 2
+            pos += 1
+        fim = _fim_da_linha(mapa, pos)
+        proximo = mapa.find(sep, pos, fim)
+        if proximo == -1:
+            return fim
+        pos = proximo + len(sep)
+
+
+def _fim_do_conteudo(mapa, inicio: int, fim: int) -> int:
+    """Fim da linha sem o \n (ou \r\n) do final."""
+    if fim > inicio and mapa[fim - 1] == 0x0A:  # \n
+        fim -= 1
+        if fim > inicio and mapa[fim - 1] == 0x0D:  # \r
+            fim -= 1
+    return fim
+
+
+def _celula(texto: str, sep: str) -> bytes:
+    # "mil, duzentos..." tem vírgula: com separador "," a célula vai entre aspas
+    if sep in texto or '"' in texto:
+        texto = '"' + texto.replace('"', '""') + '"'
+    return texto.encode("utf-8")
+
+
+def converter_csv(
+    entrada: str,
+    saida,
+    coluna: str,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    separador: str = ",",
+    nome_coluna: str = None,
+    erros: str = "abortar",
+    avisar=None,
+) -> int:
+    """
+    Copia um CSV acrescentando uma coluna com o extenso de outra.
+
+    Parâmetros:
+        entrada: Caminho do CSV de entrada (com cabeçalho, em UTF-8)
+        saida: Caminho do CSV de saída, ou um arquivo binário já aberto.
+            O caminho só é trocado no fim, então pode ser o próprio
+            arquivo de entrada
+        coluna: Nome da coluna com os números
+        modo: "cardinal", "moeda" ou "ordinal"
+        feminino: Forma feminina ("duas mil", "segunda"); não vale pro modo "moeda"
+        separador: Separador de campos ("," ou ";", por exemplo)
+        nome_coluna: Nome da coluna nova (padrão: "<coluna>_extenso")
+        erros: O que fazer com valores inválidos:
+            "abortar" levanta ValueError na primeira linha ruim,
+            "pular" deixa a célula nova vazia,
+            "marcar" põe "ERRO: <motivo>" na célula nova
+        avisar: Função opcional chamada como avisar(numero_linha, erro)
+
+    Retorna:
+        Quantas linhas de dados foram escritas
+    """
+    validar_opcoes(modo, erros)
+    if len(separador) != 1:
+        raise ValueError("O separador precisa ser um caractere só")
+    if nome_coluna is None:
+        nome_coluna = f"{coluna}_extenso"
+
+    sep = separador.encode("utf-8")
+    with open(entrada, "rb") as arquivo:
+        if arquivo.seek(0, 2) == 0:
+            raise ValueError(f"{entrada} está vazio")
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if hasattr(mapa, "madvise"):
+                # Leitura sequencial: o kernel lê adiante e descarta o que já passou
+                mapa.madvise(mmap.MADV_SEQUENTIAL)
+
+            if isinstance(saida, str):
+                # Escreve num temporário ao lado e troca no fim: com saida igual
+                # à entrada, abrir com "wb" truncaria o arquivo mapeado (SIGBUS)
+                temporario = f"{saida}.{os.getpid()}.tmp"
+                try:
+                    with open(temporario, "wb") as destino:
+                        escritas = _converter_mapa(
+                            mapa, destino, coluna, modo, feminino, separador, sep,
+                            nome_coluna, erros, avisar,
+                        )
+                    os.replace(temporario, saida)
+                except BaseException:
+                    if os.path.exists(temporario):
+                        os.remove(temporario)
+                    raise
+                return escritas
+            return _converter_mapa(
+                mapa, saida, coluna, modo, feminino, separador, sep,
+                nome_coluna, erros, avisar,
+            )
+
+
+def _converter_mapa(mapa, destino, coluna, modo, feminino, separador, sep,
+                    nome_coluna, erros, avisar) -> int:
+    fim = _fim_com_aspas(mapa, 0, sep)
+    conteudo = _fim_do_conteudo(mapa, 0, fim)
+    indice = _indice_coluna(mapa[:conteudo], coluna, separador)
+
+    # A saída vai sendo montada num bytearray e escrita em blocos grandes
+    bloco = bytearray(mapa[:conteudo])
+    bloco += sep + _celula(nome_coluna, separador) + (mapa[conteudo:fim] or b"\n")
+
+    find = mapa.find
+    tamanho = len(mapa)
+    tamanho_sep = len(sep)  # "¦" e outros separadores têm mais de um byte
+    liberado = 0
+    escritas = 0
+    numero_linha = 1
+    inicio = fim
+
+    while inicio < tamanho:
+        numero_linha += 1
+        fim = find(b"\n", inicio)
+        fim = tamanho if fim == -1 else fim + 1
+        com_aspas = find(b'"', inicio, fim) != -1 and _abre_aspas(mapa, inicio, fim, sep)
+        if com_aspas:
+            fim = _fim_com_aspas(mapa, inicio, sep)
+        conteudo = _fim_do_conteudo(mapa, inicio, fim)
+        if conteudo == inicio:
+            # Linha em branco: passa igual, sem célula nova
+            bloco += mapa[inicio:fim]
+            inicio = fim
+            continue
+
+        try:
+            if com_aspas:
+                campo = _campo_com_aspas(mapa[inicio:conteudo], indice, separador)
+            else:
+                # Pula `indice` separadores direto no mmap, sem split()
+                comeco = inicio
+                for _ in range(indice):
+                    comeco = find(sep, comeco, conteudo)
+                    if comeco == -1:
+                        break
+                    comeco += tamanho_sep
+                if comeco == -1:
+                    campo = None
+                else:
+                    final = find(sep, comeco, conteudo)
+                    campo = mapa[comeco:conteudo if final == -1 else final]
+
+            if campo is None:
+                raise ValueError(f"a linha não tem a coluna {coluna!r}")
+            celula = _celula(converter_texto(campo.decode("utf-8"), modo, feminino), separador)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            if erros == "abortar":
+                raise ValueError(f"linha {numero_linha}: {e}") from e
+            if avisar is not None:
+                avisar(numero_linha, e)
+            celula = _celula(f"ERRO: {e}", separador) if erros == "marcar" else b""
+
+        bloco += mapa[inicio:conteudo]
+        bloco += sep
+        bloco += celula
+        bloco += mapa[conteudo:fim] or b"\n"
+        escritas += 1
+        inicio = fim
+
+        if len(bloco) >= TAMANHO_BLOCO:
+            destino.write(bloco)
+            bloco.clear()
+            liberado = _liberar(mapa, liberado, inicio)
+
+    destino.write(bloco)
+    return escritas
+
+
+def _liberar(mapa, liberado: int, ate: int) -> int:
+    """
+    Devolve pro sistema as páginas do mmap que já foram lidas.
+
+    Sem isso elas continuam contando na memória do processo até o
+    kernel precisar delas; com isso o pico fica do tamanho de um bloco.
+    """
+    ate -= ate % mmap.PAGESIZE
+    if ate > liberado and hasattr(mapa, "madvise"):
+        mapa.madvise(mmap.MADV_DONTNEED, liberado, ate - liberado)
+        return ate
+    return liberado
+
+
+def main_csv(args: list = None) -> int:
+    """numextenso csv: acrescenta a coluna por extenso num CSV."""
+    parser = argparse.ArgumentParser(
+        prog="numextenso csv",
+        description="Copia um CSV acrescentando uma coluna com o valor por extenso.",
+    )
+    parser.add_argument("entrada", help="CSV de entrada (com cabeçalho, UTF-8)")
+    parser.add_argument("saida", help="CSV de saída (- pra saída padrão)")
+    parser.add_argument("-c", "--coluna", required=True, help="Nome da coluna com os números")
+    parser.add_argument("--modo", choices=MODOS, default="cardinal", help="Padrão: cardinal")
+    parser.add_argument("-f", "--feminino", action="store_true", help="Forma feminina (duas mil, segunda)")
+    parser.add_argument("-s", "--separador", default=",", help="Separador de campos (padrão: ,)")
+    parser.add_argument("--nome-coluna", help="Nome da coluna nova (padrão: <coluna>_extenso)")
+    parser.add_argument(
+        "--erros",
+        choices=ERROS,
+        default="abortar",
+        help="O que fazer com valores inválidos (padrão: abortar; pular deixa a célula vazia)"
+    )
+    opts = parser.parse_args(args)
+
+    erros_encontrados = 0
+
+    def avisar(numero_linha, erro):
+        nonlocal erros_encontrados
+        erros_encontrados += 1
+        print(f"Aviso: linha {numero_linha}: {erro}", file=sys.stderr)
+
+    saida = sys.stdout.buffer if opts.saida == "-" else opts.saida
+    try:
+        converter_csv(
+            opts.entrada,
+            saida,
+            opts.coluna,
+            modo=opts.modo,
+            feminino=opts.feminino,
+            separador=opts.separador,
+            nome_coluna=opts.nome_coluna,
+            erros=opts.erros,
+            avisar=avisar,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if saida is sys.stdout.buffer:
+            saida.flush()
+
+    if erros_encontrados:
+        print(f"{erros_encontrados} linha(s) com erro", file=sys.stderr)
+    return 0
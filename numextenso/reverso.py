@@ -0,0 +1,521 @@
+"""
+O caminho de volta: texto por extenso -> número.
+
+Serve pra conferir se o valor escrito num cheque ou contrato bate com
+o campo numérico. Usa as mesmas tabelas de constantes.py, então tudo
+que por_extenso(), por_extenso_moeda() e por_extenso_ordinal() geram
+volta exatamente pro número original.
+
+A leitura é uma passada só pelas palavras, cada uma consultada num
+dicionário palavra -> valor (montado no primeiro uso). Sem regex.
+Aceita também as palavras sem acento ("tres", "milhao"), que é como
+elas costumam sair de OCR.
+"""
+
+import unicodedata
+
+from .constantes import (
+    CENTENAS,
+    CENTENAS_FEMININO,
+    CLASSES,
+    DEZENAS,
+    ORDINAIS_CENTENAS,
+    ORDINAIS_CLASSES,
+    ORDINAIS_DEZENAS,
+    ORDINAIS_UNIDADES,
+    UNIDADES,
+    UNIDADES_FEMININO,
+)
+from .conversor import _fator, _resolver_moeda
+
+# Tipos de palavra no índice
+_NUMERO = 0     # um, vinte, duzentos... (valor de 1 a 999)
+_CLASSE = 1     # mil, milhão, milhões... (valor = (índice da classe, plural?))
+_ORDINAL = 2    # primeiro, vigésima... (valor de 1 a 900)
+_ZERO = 3
+_MENOS = 4
+_CLASSE_ORDINAL = 5  # milésimo, milionésimas... (valor = (índice da classe, plural?))
+
+# Palavras que só ligam as outras ("mil e um", "um milhão de reais")
+_CONECTIVOS = frozenset(("e", "de"))
+
+_indice = None
+
+
+def _sem_acento(palavra: str) -> str:
+    decomposta = unicodedata.normalize("NFD", palavra)
+    return "".join(c for c in decomposta if not unicodedata.combining(c))
+
+
+def _montar_indice() -> dict:
+    """
+    Monta o dicionário palavra -> (tipo, valor, gênero) a partir das
+    constantes. O gênero é "m" ou "f", ou None nas palavras que são iguais
+    nos dois ("três", "vinte", "mil").
+    """
+    indice = {
+        "zero": (_ZERO, 0, None),
+        "menos": (_MENOS, 0, None),
+        "cem": (_NUMERO, 100, None),
+    }
+
+    for escala, masculinas, femininas in ((1, UNIDADES, UNIDADES_FEMININO),
+                                          (100, CENTENAS, CENTENAS_FEMININO)):
+        for valor, (masculina, feminina) in enumerate(zip(masculinas, femininas)):
+            if not valor or not masculina:
+                continue
+            if masculina == feminina:
+                indice[masculina] = (_NUMERO, valor * escala, None)
+            else:
+                indice[masculina] = (_NUMERO, valor * escala, "m")
+                indice[feminina] = (_NUMERO, valor * escala, "f")
+    for dezena, palavra in enumerate(DEZENAS):
+        if palavra:
+            indice[palavra] = (_NUMERO, dezena * 10, None)
+
+    for classe, (singular, plural) in enumerate(CLASSES[1:], 1):
+        indice[singular] = (_CLASSE, (classe, False), None)
+        if plural != singular:
+            indice[plural] = (_CLASSE, (classe, True), None)
+
+    # Os ordinais compostos ("décimo primeiro") se resolvem palavra a palavra
+    for final, genero in (("o", "m"), ("a", "f")):
+        for escala, raizes in ((1, ORDINAIS_UNIDADES), (10, ORDINAIS_DEZENAS),
+                               (100, ORDINAIS_CENTENAS)):
+            for valor, raiz in enumerate(raizes):
+                if raiz:
+                    indice[raiz + final] = (_ORDINAL, valor * escala, genero)
+        for classe, raiz in enumerate(ORDINAIS_CLASSES[1:], 1):
+            indice[raiz + final] = (_CLASSE_ORDINAL, (classe, False), genero)
+            indice[raiz + final + "s"] = (_CLASSE_ORDINAL, (classe, True), genero)
+
+    # Versões sem acento, sem sobrescrever nenhuma palavra que já existe
+    for palavra, info in list(indice.items()):
+        indice.setdefault(_sem_acento(palavra), info)
+
+    return indice
+
+
+def _obter_indice() -> dict:
+    global _indice
+    if _indice is None:
+        _indice = _montar_indice()
+    return _indice
+
+
+def _palavras(texto: str) -> list:
+    """Quebra o texto em palavras minúsculas, ignorando vírgulas."""
+    if not isinstance(texto, str):
+        raise TypeError(f"Esperava str, recebi {type(texto).__name__}")
+    return texto.lower().replace(",", " ").split()
+
+
+def _somar_no_grupo(grupo: int, valor: int, palavra: str) -> int:
+    """
+    Soma uma palavra (1 a 999) no grupo atual, conferindo a ordem.
+
+    Centena tem que vir antes de dezena, que vem antes de unidade, e
+    cada posição só aparece uma vez: "duzentos e trinta e quatro" ok,
+    "trinta duzentos" ou "vinte dez" não. De 10 a 19 a palavra ocupa
+    dezena e unidade juntas ("dez e um" não existe).
+    """
+    if valor >= 100:
+        ok = grupo == 0
+    elif valor >= 10:
+        ok = grupo % 100 == 0
+    else:
+        resto = grupo % 100
+        ok = resto % 10 == 0 and not 10 <= resto <= 19
+    if not ok:
+        raise ValueError(f"Palavra fora de ordem: {palavra!r}")
+    return grupo + valor
+
+
+def _juntar_genero(genero: str, novo: str, palavra: str) -> str:
+    """Gênero do número até aqui, conferindo que a palavra nova não mistura."""
+    if novo is None or novo == genero:
+        return genero
+    if genero is not None:
+        raise ValueError(f"Mistura de masculino e feminino em {palavra!r}")
+    return novo
+
+
+def _ler_cardinal(palavras: list, indice: dict, genero: str = None) -> int:
+    """
+    Lê uma sequência de palavras de um número cardinal positivo.
+
+    O "e" só vale entre duas palavras de número ("mil e um", "duzentos e
+    três", "um milhão e mil"). O número tem um gênero só ("duas mil e duzentas", nunca "duas
+    mil e duzentos"); `genero` ("m" ou "f") obriga um deles. Os grupos
+    antes de milhão, bilhão... ficam de fora: eles concordam com
+    "milhões", que é masculino ("dois milhões e duzentas mil").
+    """
+    total = 0
+    grupo = 0
+    genero_grupo = None
+    ultima_classe = len(CLASSES)
+    anterior = None   # última palavra de número do grupo atual
+    depois_de = None  # tipo da palavra anterior (None no começo)
+    conectivo = None  # "e" esperando a próxima palavra de número
+
+    for palavra in palavras:
+        if palavra in _CONECTIVOS:
+            if palavra != "e" or depois_de is None or conectivo is not None:
+                raise ValueError(f"Palavra fora de lugar: {palavra!r}")
+            conectivo = palavra
+            continue
+
+        info = indice.get(palavra)
+        if info is None:
+            raise ValueError(f"Palavra desconhecida: {palavra!r}")
+        tipo, valor, genero_palavra = info
+
+        if tipo == _NUMERO:
+            # "cem" fecha o grupo; "cento" sempre tem continuação
+            if anterior == "cem":
+                raise ValueError(f"Palavra fora de ordem: {palavra!r}")
+            grupo = _somar_no_grupo(grupo, valor, palavra)
+            genero_grupo = _juntar_genero(genero_grupo, genero_palavra, palavra)
+            anterior = palavra
+            depois_de = tipo
+            conectivo = None
+            continue
+
+        # Classe depois do "e" só o "mil" sozinho ("um bilhão e mil")
+        if conectivo is not None and not (tipo == _CLASSE and valor[0] == 1 and grupo == 0):
+            raise ValueError(f"'{conectivo}' fora de lugar antes de {palavra!r}")
+        if tipo != _CLASSE:
+            raise ValueError(f"Palavra fora de lugar: {palavra!r}")
+        _conferir_fim_do_grupo(anterior)
+        conectivo = None
+
+        classe, plural = valor
+        if classe >= ultima_classe:
+            raise ValueError(f"Classe fora de ordem: {palavra!r}")
+        if grupo == 0:
+            if classe != 1:
+                raise ValueError(f"Faltou o número antes de {palavra!r}")
+            grupo = 1  # "mil" sozinho
+        elif classe > 1 and plural != (grupo > 1):
+            raise ValueError(f"Concordância errada em {palavra!r}")
+
+        if classe > 1:
+            if genero_grupo == "f":
+                raise ValueError(f"Concordância errada em {palavra!r}")
+        elif grupo == 1 and genero_grupo == "f":
+            # "um mil" ainda aparece em cheque; "uma mil" não existe
+            raise ValueError(f"Concordância errada em {palavra!r}")
+        else:
+            genero = _juntar_genero(genero, genero_grupo, palavra)
+
+        total += grupo * 1000 ** classe
+        grupo = 0
+        genero_grupo = None
+        ultima_classe = classe
+        anterior = None
+        depois_de = tipo
+
+    if conectivo is not None:
+        raise ValueError(f"Texto terminando em '{conectivo}'")
+    _conferir_fim_do_grupo(anterior)
+    _juntar_genero(genero, genero_grupo, palavras[-1])
+    return total + grupo
+
+
+def _conferir_fim_do_grupo(anterior: str) -> None:
+    if anterior == "cento":
+        raise ValueError("'cento' sozinho: o certo é 'cem'")
+
+
+def _ler_ordinal(palavras: list, indice: dict, genero: str = None) -> int:
+    """
+    Lê um ordinal: "quadragésimo segundo", "milésimo ducentésimo
+    trigésimo quarto", "dois milionésimos".
+
+    Acima de mil cada classe é o número (cardinal, opcional se for 1)
+    seguido do ordinal da classe; o resto é ordinal palavra a palavra.
+    Tudo no mesmo gênero, inclusive o número antes da classe ("duas
+    milionésimas", nunca "dois milionésimas").
+    """
+    total = 0
+    grupo = 0   # número na frente da próxima classe ("duzentos e dois")
+    final = 0   # parte abaixo de mil ("trigésimo quarto")
+    ultima_classe = len(CLASSES)
+    anterior = None
+    conectivo = None
+
+    for palavra in palavras:
+        if palavra in _CONECTIVOS:
+            # O "e" só aparece dentro do número antes da classe
+            if palavra != "e" or not grupo or conectivo is not None:
+                raise ValueError(f"Palavra fora de lugar num ordinal: {palavra!r}")
+            conectivo = palavra
+            continue
+
+        info = indice.get(palavra)
+        if info is None:
+            raise ValueError(f"Palavra inválida num ordinal: {palavra!r}")
+        tipo, valor, genero_palavra = info
+        genero = _juntar_genero(genero, genero_palavra, palavra)
+
+        if tipo == _NUMERO and not final:
+            if anterior == "cem":
+                raise ValueError(f"Palavra fora de ordem: {palavra!r}")
+            grupo = _somar_no_grupo(grupo, valor, palavra)
+            anterior = palavra
+            conectivo = None
+            continue
+
+        if conectivo is not None:
+            raise ValueError(f"'{conectivo}' fora de lugar antes de {palavra!r}")
+
+        if tipo == _CLASSE_ORDINAL and not final:
+            _conferir_fim_do_grupo(anterior)
+            classe, plural = valor
+            if classe >= ultima_classe:
+                raise ValueError(f"Classe fora de ordem: {palavra!r}")
+            if plural != (grupo > 1):
+                raise ValueError(f"Concordância errada em {palavra!r}")
+            total += (grupo or 1) * 1000 ** classe
+            grupo = 0
+            ultima_classe = classe
+            anterior = None
+            continue
+
+        if tipo != _ORDINAL or grupo:
+            raise ValueError(f"Palavra fora de lugar num ordinal: {palavra!r}")
+
+        # Nos ordinais o 10 é uma dezena como as outras ("décimo primeiro")
+        if valor >= 100:
+            ok = final == 0
+        elif valor >= 10:
+            ok = final % 100 == 0
+        else:
+            ok = final % 10 == 0
+        if not ok:
+            raise ValueError(f"Palavra fora de ordem: {palavra!r}")
+        final += valor
+
+    if grupo:
+        raise ValueError("Ordinal terminando num número sem classe")
+    return total + final
+
+
+def _para_numero(palavras: list, indice: dict, genero: str = None) -> int:
+    if not palavras:
+        raise ValueError("Texto vazio")
+
+    if palavras[0] == "menos":
+        if palavras[1:2] == ["menos"]:
+            raise ValueError("'menos' repetido")
+        numero = _para_numero(palavras[1:], indice, genero)
+        if numero == 0:
+            raise ValueError("'menos zero' não é um número válido")
+        return -numero
+
+    if palavras == ["zero"]:
+        return 0
+
+    # Todo ordinal termina numa palavra ordinal ("quarto", "milionésimos")
+    ultima = indice.get(palavras[-1])
+    if ultima is not None and ultima[0] in (_ORDINAL, _CLASSE_ORDINAL):
+        return _ler_ordinal(palavras, indice, genero)
+
+    return _ler_cardinal(palavras, indice, genero)
+
+
+def para_numero(texto: str) -> int:
+    """
+    Converte um número por extenso (cardinal ou ordinal) de volta pra int.
+
+    Parâmetros:
+        texto: O número por extenso
+
+    Retorna:
+        O número inteiro
+
+    Levanta ValueError se o texto não for um número por extenso válido.
+
+    Exemplos:
+        >>> para_numero("mil duzentos e trinta e quatro")
+        1234
+        >>> para_numero("menos um milhão e um")
+        -1000001
+        >>> para_numero("quadragésimo segundo")
+        42
+        >>> para_numero("dois milionésimos")
+        2000000
+    """
+    return _para_numero(_palavras(texto), _obter_indice())
+
+
+def para_numero_lote(textos) -> list:
+    """
+    Mesmo que para_numero(), pra vários textos de uma vez.
+
+    Exemplos:
+        >>> para_numero_lote(["um", "dois mil"])
+        [1, 2000]
+    """
+    indice = _obter_indice()
+    return [_para_numero(_palavras(texto), indice) for texto in textos]
+
+
+def _nome_na_posicao(palavras: list, i: int, nomes: tuple) -> tuple:
+    """
+    Quantas palavras o nome da moeda ocupa a partir de i (0 se não é ele)
+    e as formas que ele pode ser: {False} singular, {True} plural, os dois
+    quando o singular e o plural são iguais ("fils").
+    """
+    for nome, formas in nomes:
+        tamanho = len(nome)
+        if palavras[i:i + tamanho] == nome:
+            return tamanho, formas
+    return 0, None
+
+
+def _nomes(singular: str, plural: str) -> tuple:
+    # "pesos argentinos" -> ["pesos", "argentinos"]; o mais longo primeiro
+    formas = {}
+    for nome, eh_plural in ((singular, False), (plural, True)):
+        if nome:
+            formas.setdefault(tuple(nome.lower().split()), set()).add(eh_plural)
+    return tuple(
+        (list(nome), frozenset(formas[nome]))
+        for nome in sorted(formas, key=len, reverse=True)
+    )
+
+
+def _conferir_concordancia(valor: int, formas: frozenset, nome: str) -> None:
+    """Singular só pra 1 ("um real", "dois reais", "zero centavos")."""
+    if (valor != 1) not in formas:
+        raise ValueError(f"Concordância errada em {nome!r}")
+
+
+def _sem_de_no_fim(trecho: list, indice: dict) -> list:
+    """Tira o "de" de "um milhão de reais" (só depois de milhão, bilhão...)."""
+    if trecho[-1:] != ["de"]:
+        return trecho
+    info = indice.get(trecho[-2]) if len(trecho) > 1 else None
+    if info is None or info[0] != _CLASSE or info[1][0] < 2:
+        raise ValueError("Palavra fora de lugar: 'de'")
+    return trecho[:-1]
+
+
+def _para_centavos(palavras: list, indice: dict, moeda: dict) -> int:
+    if palavras and palavras[0] == "menos":
+        if palavras[1:2] == ["menos"]:
+            raise ValueError("'menos' repetido")
+        valor = _para_centavos(palavras[1:], indice, moeda)
+        if valor == 0:
+            raise ValueError("'menos zero' não é um valor válido")
+        return -valor
+
+    fator = _fator(moeda)
+    # O número concorda com o nome: "duas libras", nunca "dois reais" trocado
+    genero_inteiro = "f" if moeda.get("feminino") else "m"
+    genero_decimal = "f" if moeda.get("decimal_feminino") else "m"
+    nomes_inteiro = _nomes(moeda["inteiro_singular"], moeda["inteiro_plural"])
+    nomes_decimal = _nomes(moeda.get("decimal_singular"), moeda.get("decimal_plural"))
+
+    inteiros = centavos = 0
+    inicio = i = 0
+    tem_inteiro = tem_decimal = False
+    while i < len(palavras):
+        tamanho, formas = _nome_na_posicao(palavras, i, nomes_inteiro)
+        if tamanho:
+            if tem_inteiro or tem_decimal:
+                raise ValueError(f"Palavra fora de lugar: {palavras[i]!r}")
+            inteiros = _para_numero(_sem_de_no_fim(palavras[inicio:i], indice), indice, genero_inteiro)
+            _conferir_concordancia(inteiros, formas, " ".join(palavras[i:i + tamanho]))
+            tem_inteiro = True
+            inicio = i = i + tamanho
+            continue
+
+        tamanho, formas = _nome_na_posicao(palavras, i, nomes_decimal) if fator > 1 else (0, None)
+        if tamanho:
+            if tem_decimal:
+                raise ValueError(f"Palavra fora de lugar: {palavras[i]!r}")
+            trecho = palavras[inicio:i]
+            if tem_inteiro:
+                if not trecho or trecho[0] != "e":
+                    raise ValueError("Faltou o 'e' entre inteiros e centavos")
+                trecho = trecho[1:]
+            centavos = _para_numero(trecho, indice, genero_decimal)
+            if not 0 <= centavos < fator:
+                raise ValueError(f"Centavos precisam estar entre 0 e {fator - 1}")
+            _conferir_concordancia(centavos, formas, " ".join(palavras[i:i + tamanho]))
+            tem_decimal = True
+            inicio = i = i + tamanho
+            continue
+        i += 1
+
+    if not (tem_inteiro or tem_decimal) or inicio != len(palavras):
+        raise ValueError("Texto não termina com o nome da moeda")
+    if inteiros < 0 or centavos < 0:
+        raise ValueError("Sinal fora de lugar")
+
+    return inteiros * fator + centavos
+
+
+def para_centavos(texto: str, moeda: dict | str = None) -> int:
+    """
+    Converte um valor monetário por extenso de volta pra centavos (int).
+
+    Parâmetros:
+        texto: O valor por extenso ("mil reais e dez centavos")
+        moeda: Código ISO 4217 ou dicionário da moeda (opcional, padrão é BRL)
+
+    Em moedas com outro número de casas o resultado vem na menor unidade
+    delas (fils, no dinar kuwaitiano).
+
+    Exemplos:
+        >>> para_centavos("mil duzentos e trinta e quatro reais e cinquenta e seis centavos")
+        123456
+        >>> para_centavos("um milhão de reais")
+        100000000
+    """
+    return _para_centavos(_palavras(texto), _obter_indice(), _resolver_moeda(moeda))
+
+
+def para_valor_moeda(texto: str, moeda: dict | str = None):
+    """
+    Converte um valor monetário por extenso de volta pra decimal.Decimal.
+
+    Mesmo que para_centavos(), só que devolve o valor com as casas da
+    moeda (duas no real), pronto pra comparar com o campo numérico.
+
+    Exemplos:
+        >>> para_valor_moeda("noventa e nove reais e noventa centavos")
+        Decimal('99.90')
+    """
+    moeda = _resolver_moeda(moeda)
+    return _decimal_exato(para_centavos(texto, moeda), _casas(moeda))
+
+
+def para_valor_moeda_lote(textos, moeda: dict | str = None) -> list:
+    """Mesmo que para_valor_moeda(), pra vários textos de uma vez."""
+    moeda = _resolver_moeda(moeda)
+    casas = _casas(moeda)
+    indice = _obter_indice()
+    return [
+        _decimal_exato(_para_centavos(_palavras(texto), indice, moeda), casas)
+        for texto in textos
+    ]
+
+
+def _decimal_exato(centavos: int, casas: int):
+    """
+    centavos com a vírgula `casas` dígitos pra esquerda, como Decimal.
+
+    Montado direto da tupla (sinal, dígitos, expoente): scaleb() arredonda
+    pro contexto (28 dígitos) e estragaria a volta de valores grandes.
+    """
+    # Import tardio: decimal só entra no processo de quem usa essas funções
+    from decimal import Decimal
+
+    return Decimal((centavos < 0, tuple(map(int, str(abs(centavos)))), -casas))
+
+
+def _casas(moeda: dict) -> int:
+    return moeda.get("casas", 2)
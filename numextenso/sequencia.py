@@ -0,0 +1,97 @@
+"""
+Sequências de números por extenso (bilhetes, formulários numerados...).
+
+Entre dois números vizinhos, quase sempre só o último grupo de 3 dígitos
+muda: de "um milhão e duzentos mil e um" pra "um milhão e duzentos mil e
+dois", o prefixo "um milhão e duzentos mil" é o mesmo. Então o prefixo é
+montado uma vez por bloco de mil e cada número do bloco vira uma única
+concatenação com o sufixo já pronto (conectivo + grupo, de tabelas.py).
+"""
+
+from .conversor import MAX_VALOR, _erro_muito_grande
+from .tabelas import GRUPOS, SUFIXOS, SUFIXOS_APOS_MIL, extenso_positivo
+
+
+def _prefixo(alto: int) -> tuple:
+    """
+    Prefixo (tudo acima das unidades) e tabela de sufixos pro bloco `alto`.
+
+    `alto` é o número sem o último grupo (n // 1000). O sufixo depende de
+    o grupo logo antes ser um "mil" sozinho ("mil e um", mas "mil duzentos").
+    """
+    if alto == 0:
+        return "", None
+    sufixos = SUFIXOS_APOS_MIL if alto % 1000 == 1 else SUFIXOS
+    return extenso_positivo(alto * 1000), sufixos
+
+
+def gerar_extenso(inicio: int, fim: int, passo: int = 1):
+    """
+    Gera o extenso de cada número de range(inicio, fim, passo).
+
+    Mesmo resultado que [por_extenso(n) for n in range(inicio, fim, passo)],
+    mas sem remontar os grupos mais altos a cada número. Como no range(),
+    o `fim` não entra.
+
+    Exemplos:
+        >>> list(gerar_extenso(999, 1002))
+        ['novecentos e noventa e nove', 'mil', 'mil e um']
+        >>> list(gerar_extenso(1_200_000, 1_200_002))
+        ['um milhão e duzentos mil', 'um milhão e duzentos mil e um']
+    """
+    for nome, valor in (("inicio", inicio), ("fim", fim), ("passo", passo)):
+        if not isinstance(valor, int):
+            raise TypeError(f"{nome} precisa ser int, recebi {type(valor).__name__}")
+    if passo == 0:
+        raise ValueError("passo não pode ser zero")
+
+    numeros = range(inicio, fim, passo)
+    if not numeros:
+        return
+    if max(abs(numeros[0]), abs(numeros[-1])) > MAX_VALOR:
+        raise _erro_muito_grande()
+
+    if passo > 0 and inicio >= 0:
+        yield from _gerar_crescente(numeros)
+    else:
+        yield from _gerar_generico(numeros)
+
+
+def _gerar_crescente(numeros: range):
+    """Caminho rápido: números >= 0 em ordem crescente, bloco a bloco."""
+    grupos = GRUPOS
+    passo = numeros.step
+    n = numeros.start
+    fim = numeros.stop
+
+    while n < fim:
+        alto, baixo = divmod(n, 1000)
+        # Todos os números do range que caem no mesmo bloco de mil
+        baixos = range(baixo, min(fim - alto * 1000, 1000), passo)
+        n += len(baixos) * passo
+
+        if alto == 0:
+            yield from (grupos[b] if b else "zero" for b in baixos)
+            continue
+
+        prefixo, sufixos = _prefixo(alto)
+        yield from [prefixo + sufixos[b] for b in baixos]
+
+
+def _gerar_generico(numeros: range):
+    """Qualquer range (negativos, passo negativo), com o prefixo em cache."""
+    alto_atual = None
+    prefixo = sufixos = None
+
+    for n in numeros:
+        absoluto = -n if n < 0 else n
+        alto, baixo = divmod(absoluto, 1000)
+        if alto != alto_atual:
+            alto_atual = alto
+            prefixo, sufixos = _prefixo(alto)
+
+        if alto:
+            texto = prefixo + sufixos[baixo]
+        else:
+            texto = GRUPOS[baixo] if baixo else "zero"
+        yield "menos " + texto if n < 0 else texto
@@ -0,0 +1,328 @@
+"""
+Servidor de conversão num socket Unix (numextenso serve).
+
+Pra quem chama o CLI de shell, PHP ou cron a cada documento: em vez de
+pagar o startup do Python toda vez, sobe um processo só e manda os
+valores pelo socket. Cada linha enviada recebe exatamente uma linha de
+resposta, na mesma ordem - dá pra mandar várias linhas sem esperar
+(pipelining).
+
+Protocolo em texto (uma requisição por linha):
+    1234                   -> mil duzentos e trinta e quatro
+    moeda 99,90            -> noventa e nove reais e noventa centavos
+    moeda R$ 1.234,56      -> mil duzentos e trinta e quatro reais e ...
+    ordinal 3              -> terceiro
+    ordinal_feminino 3     -> terceira
+    cardinal_feminino 2    -> duas
+    abc                    -> ERRO: Número inválido: 'abc'
+
+Protocolo JSON (linha começando com "{"):
+    {"id": 1, "modo": "moeda", "valor": "99.90"}
+        -> {"id": 1, "resultado": "noventa e nove reais e noventa centavos"}
+    {"id": 2, "modo": "ordinal", "feminino": true, "valores": [1, 2]}
+        -> {"id": 2, "resultados": ["primeira", "segunda"]}
+    Erros voltam como {"id": ..., "erro": "..."}; num lote, o item com
+    erro vem como null e a lista "erros" traz [índice, mensagem].
+    "feminino" precisa ser true ou false, e um lote tem no máximo
+    LIMITE_LOTE valores.
+
+Uso:
+    numextenso serve --socket /run/numextenso.sock
+    numextenso cliente --socket /run/numextenso.sock 1234 99,90 --moeda
+    cat valores.txt | numextenso cliente --socket /run/numextenso.sock -m
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import threading
+
+from .fluxo import converter_numero, converter_texto
+from .lote import MODOS
+
+SOCKET_PADRAO = "/tmp/numextenso.sock"
+
+# Maior linha aceita (lotes grandes em JSON cabem numa linha só)
+LIMITE_LINHA = 16 * 1024 * 1024
+
+# Maior lote aceito num pedido JSON ("valores")
+LIMITE_LOTE = 100_000
+
+# Linhas maiores que isso (lotes JSON) são respondidas numa thread à parte,
+# pra não segurar o event loop e os outros clientes enquanto convertem
+LIMITE_NO_LOOP = 4096
+
+
+def _converter(valor, modo: str, feminino: bool) -> str:
+    # JSON pode mandar texto ("1.234,56", lido como no CLI) ou número
+    # (1234.56, que já vem no formato de máquina)
+    if isinstance(valor, str):
+        return converter_texto(valor, modo, feminino)
+    return converter_numero(valor, modo, feminino)
+
+
+def _responder_texto(linha: str) -> str:
+    modo, _, valor = linha.partition(" ")
+    feminino = False
+    if modo in ("cardinal_feminino", "ordinal_feminino"):
+        modo, feminino = modo[:-len("_feminino")], True
+    elif modo not in MODOS:
+        modo, valor = "cardinal", linha
+
+    try:
+        return _converter(valor.strip(), modo, feminino)
+    except (ValueError, TypeError, ArithmeticError) as e:
+        return f"ERRO: {e}"
+
+
+def _responder_json(linha: str) -> str:
+    try:
+        pedido = json.loads(linha)
+        if not isinstance(pedido, dict):
+            raise ValueError("o pedido JSON precisa ser um objeto")
+    except ValueError as e:
+        return json.dumps({"erro": f"JSON inválido: {e}"}, ensure_ascii=False)
+    except RecursionError:
+        # [[[[...]]]] com milhares de níveis estoura a pilha do json.loads
+        return json.dumps({"erro": "JSON inválido: aninhado demais"}, ensure_ascii=False)
+
+    resposta = {"id": pedido.get("id")}
+    modo = pedido.get("modo", "cardinal")
+    feminino = pedido.get("feminino", False)
+
+    if modo not in MODOS:
+        resposta["erro"] = f"Modo inválido: {modo!r}. Use um de: {', '.join(MODOS)}"
+    elif not isinstance(feminino, bool):
+        # bool("false") é True: só aceita o true/false do JSON
+        resposta["erro"] = f"'feminino' precisa ser true ou false, recebi {feminino!r}"
+    elif "valores" in pedido:
+        if not isinstance(pedido["valores"], list):
+            resposta["erro"] = "'valores' precisa ser uma lista"
+        elif len(pedido["valores"]) > LIMITE_LOTE:
+            resposta["erro"] = f"Lote grande demais: no máximo {LIMITE_LOTE} valores por pedido"
+        else:
+            _responder_lote(pedido["valores"], modo, feminino, resposta)
+    elif "valor" in pedido:
+        try:
+            resposta["resultado"] = _converter(pedido["valor"], modo, feminino)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            resposta["erro"] = str(e)
+    else:
+        resposta["erro"] = "Faltou 'valor' ou 'valores'"
+
+    return json.dumps(resposta, ensure_ascii=False)
+
+
+def _responder_lote(valores: list, modo: str, feminino: bool, resposta: dict) -> None:
+    resultados, erros = [], []
+    for i, valor in enumerate(valores):
+        try:
+            resultados.append(_converter(valor, modo, feminino))
+        except (ValueError, TypeError, ArithmeticError) as e:
+            resultados.append(None)
+            erros.append([i, str(e)])
+    resposta["resultados"] = resultados
+    if erros:
+        resposta["erros"] = erros
+
+
+def responder(linha: str) -> str:
+    """
+    Processa uma linha do protocolo e devolve a linha de resposta (sem "\\n").
+
+    É a função que o servidor chama pra cada linha recebida; fica
+    separada pra dar pra testar o protocolo sem abrir socket nenhum.
+
+    Exemplos:
+        >>> responder("moeda 1,50")
+        'um real e cinquenta centavos'
+        >>> responder('{"id": 7, "valor": 2}')
+        '{"id": 7, "resultado": "dois"}'
+    """
+    linha = linha.strip()
+    if not linha:
+        return "ERRO: linha vazia"
+    try:
+        if linha.startswith("{"):
+            return _responder_json(linha)
+        return _responder_texto(linha)
+    except Exception as e:
+        # Nenhuma linha derruba a conexão: cada linha recebe uma resposta,
+        # senão os pedidos que vieram depois dela (pipelining) ficam sem
+        if linha.startswith("{"):
+            return json.dumps({"erro": f"Erro interno: {e!r}"}, ensure_ascii=False)
+        return f"ERRO: erro interno: {e!r}"
+
+
+async def _atender(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Atende uma conexão: lê linha, responde linha, até o cliente fechar."""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                linha = await reader.readline()
+            except ValueError:  # linha maior que LIMITE_LINHA
+                writer.write(b"ERRO: linha grande demais\n")
+                break
+            if not linha:
+                break
+
+            texto = linha.decode("utf-8", "replace")
+            if len(linha) > LIMITE_NO_LOOP:
+                resposta = await loop.run_in_executor(None, responder, texto)
+            else:
+                resposta = responder(texto)
+            writer.write(resposta.encode("utf-8") + b"\n")
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def _remover_socket_antigo(caminho: str) -> None:
+    """Apaga um socket que sobrou de uma execução anterior (nunca um arquivo comum)."""
+    try:
+        modo = os.stat(caminho).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(modo):
+        raise OSError(f"{caminho} existe e não é um socket")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as teste:
+        try:
+            teste.connect(caminho)
+        except OSError:
+            os.unlink(caminho)  # ninguém ouvindo: sobra de um servidor morto
+        else:
+            raise OSError(f"Já tem um servidor ouvindo em {caminho}")
+
+
+async def servir(caminho: str = SOCKET_PADRAO, pronto=None) -> None:
+    """
+    Sobe o servidor no socket Unix e atende até ser cancelado.
+
+    Parâmetros:
+        caminho: Caminho do arquivo de socket
+        pronto: Função opcional chamada quando o socket já está ouvindo
+    """
+    _remover_socket_antigo(caminho)
+    servidor = await asyncio.start_unix_server(_atender, path=caminho, limit=LIMITE_LINHA)
+    try:
+        if pronto is not None:
+            pronto()
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        try:
+            os.unlink(caminho)
+        except FileNotFoundError:
+            pass
+
+
+def main_servir(args: list = None) -> int:
+    """numextenso serve: sobe o servidor até Ctrl+C / SIGTERM."""
+    parser = argparse.ArgumentParser(
+        prog="numextenso serve",
+        description="Servidor de conversão num socket Unix.",
+    )
+    parser.add_argument(
+        "-s", "--socket",
+        default=SOCKET_PADRAO,
+        help=f"Caminho do socket (padrão: {SOCKET_PADRAO})"
+    )
+    opts = parser.parse_args(args)
+
+    async def principal():
+        # SIGTERM (systemd, kill) e Ctrl+C encerram limpo, apagando o socket
+        tarefa = asyncio.current_task()
+        loop = asyncio.get_running_loop()
+        for sinal in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sinal, tarefa.cancel)
+        try:
+            await servir(
+                opts.socket,
+                pronto=lambda: print(f"Ouvindo em {opts.socket}", file=sys.stderr),
+            )
+        except asyncio.CancelledError:
+            pass
+
+    try:
+        asyncio.run(principal())
+    except OSError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _pedidos(valores: list, modo: str):
+    """Linhas do protocolo em texto, pra cada valor (ou linha do stdin)."""
+    origem = valores if valores else sys.stdin
+    for valor in origem:
+        valor = valor.strip()
+        if valor:
+            yield f"{modo} {valor}\n".encode("utf-8")
+
+
+def main_cliente(args: list = None) -> int:
+    """numextenso cliente: manda valores pro servidor e imprime as respostas."""
+    parser = argparse.ArgumentParser(
+        prog="numextenso cliente",
+        description="Converte valores usando um 'numextenso serve' já rodando.",
+    )
+    parser.add_argument("valores", nargs="*", help="Valores (sem nenhum, lê do stdin)")
+    parser.add_argument("-s", "--socket", default=SOCKET_PADRAO, help="Caminho do socket")
+    parser.add_argument("-m", "--moeda", action="store_true", help="Modo moeda")
+    parser.add_argument("-o", "--ordinal", action="store_true", help="Modo ordinal")
+    parser.add_argument("-f", "--feminino", action="store_true", help="Forma feminina (duas mil, segunda)")
+    opts = parser.parse_args(args)
+
+    if opts.moeda and not opts.ordinal:
+        modo = "moeda"
+    else:
+        modo = "ordinal" if opts.ordinal else "cardinal"
+        if opts.feminino:
+            modo += "_feminino"
+
+    try:
+        conexao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conexao.connect(opts.socket)
+    except OSError as e:
+        print(f"Erro: não consegui conectar em {opts.socket}: {e}", file=sys.stderr)
+        return 1
+
+    # Uma thread manda tudo (pipelining) enquanto a principal lê as
+    # respostas - assim nenhum dos lados trava com o buffer cheio
+    falha_envio = []
+
+    def enviar():
+        try:
+            for pedido in _pedidos(opts.valores, modo):
+                conexao.sendall(pedido)
+            conexao.shutdown(socket.SHUT_WR)
+        except (BrokenPipeError, ConnectionResetError) as e:
+            # O servidor fechou a conexão no meio (caiu, ou linha grande demais)
+            falha_envio.append(e)
+
+    remetente = threading.Thread(target=enviar, daemon=True)
+    remetente.start()
+
+    houve_erro = False
+    try:
+        with conexao, conexao.makefile("r", encoding="utf-8") as respostas:
+            for resposta in respostas:
+                houve_erro = houve_erro or resposta.startswith("ERRO: ")
+                sys.stdout.write(resposta)
+    except ConnectionResetError as e:
+        falha_envio.append(e)
+    remetente.join()
+
+    if falha_envio:
+        print(f"Erro: o servidor fechou a conexão: {falha_envio[0]}", file=sys.stderr)
+        return 1
+    return 1 if houve_erro else 0
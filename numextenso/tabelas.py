@@ -0,0 +1,282 @@
+"""
+Tabelas pré-calculadas usadas na conversão.
+
+Em vez de montar cada grupo de 3 dígitos toda vez que alguém chama
+por_extenso(), a gente monta as 1000 renderizações possíveis (0 a 999)
+uma vez só, no import, e também as versões já com a classe grudada
+("duzentos mil", "dois milhões"...). Aí converter um número vira
+algumas consultas em tupla e um "".join().
+
+As tabelas são tuplas (imutáveis) de propósito: dá pra compartilhar
+entre threads sem medo.
+"""
+
+from .constantes import (
+    CENTENAS,
+    CENTENAS_FEMININO,
+    CLASSES,
+    DEZENAS,
+    ORDINAIS_CENTENAS,
+    ORDINAIS_CLASSES,
+    ORDINAIS_DEZENAS,
+    ORDINAIS_UNIDADES,
+    UNIDADES,
+    UNIDADES_FEMININO,
+)
+
+
+def _converter_grupo(n: int, unidades: tuple = UNIDADES, centenas: tuple = CENTENAS) -> str:
+    """
+    Converte um número de 0 a 999 em extenso.
+
+    Essa é a função base - ela sabe lidar com centenas, dezenas e unidades.
+    Só é chamada na hora de montar as tabelas; a conversão em si
+    consulta GRUPOS direto. Outras tabelas de unidades/centenas dão o
+    feminino ("duas", "duzentas") ou outro locale ("dezasseis").
+    """
+    if n == 0:
+        return ""
+
+    if n < 20:
+        return unidades[n]
+
+    if n < 100:
+        dezena = n // 10
+        unidade = n % 10
+        if unidade == 0:
+            return DEZENAS[dezena]
+        return f"{DEZENAS[dezena]} e {unidades[unidade]}"
+
+    # Centenas
+    centena = n // 100
+    resto = n % 100
+
+    # Caso especial: 100 é "cem", não "cento"
+    if n == 100:
+        return "cem"
+
+    if resto == 0:
+        return centenas[centena]
+
+    return f"{centenas[centena]} e {_converter_grupo(resto, unidades, centenas)}"
+
+
+def _grupos_com_classe(indice: int, grupos: tuple = None) -> tuple:
+    """Monta os 1000 grupos já com o nome da classe (mil, milhão...)."""
+    if grupos is None:
+        grupos = GRUPOS
+    if indice == 0:  # unidades não têm nome de classe
+        return grupos
+
+    # Concordância especial pro português:
+    # - "mil" (sem "um" na frente)
+    # - "um milhão", "dois milhões" (com número e concordância)
+    singular, plural = CLASSES[indice]
+    sufixo = " " + plural
+    tabela = [texto + sufixo for texto in grupos]
+    tabela[0] = ""
+    tabela[1] = "mil" if indice == 1 else "um " + singular
+    return tuple(tabela)
+
+
+def _conectivo(proximo: int, apos_mil: bool) -> str:
+    """Decide o que vai entre um grupo e o próximo grupo não-zero."""
+    # Usa "e" se o próximo é < 100 ou centena exata (100, 200, etc)
+    if proximo < 100 or proximo % 100 == 0:
+        return " e "
+    # Se o grupo atual é só "mil" (1000) e o próximo tem centenas com resto,
+    # usa só espaço (não vírgula)
+    if apos_mil:
+        return " "
+    return ", "
+
+
+# GRUPOS[n] -> extenso de n (0 a 999), com GRUPOS[0] == ""
+GRUPOS = tuple(_converter_grupo(n) for n in range(1000))
+
+# GRUPOS_CLASSE[i][n] -> grupo n já com o nome da classe i
+# Ex: GRUPOS_CLASSE[2][3] == "três milhões"
+# Só as classes até quintilhões (tudo que cabe num int64) ficam prontas;
+# acima disso o texto é montado na hora (ver juntar_grupos), senão seriam
+# 100 mil strings na memória pra números que quase ninguém usa.
+CLASSES_PRE_CALCULADAS = 7
+GRUPOS_CLASSE = tuple(_grupos_com_classe(i) for i in range(CLASSES_PRE_CALCULADAS))
+MILHARES = GRUPOS_CLASSE[1]
+
+# Conectivo que vai antes do grupo n (ver _conectivo)
+CONECTIVOS = tuple(_conectivo(n, False) for n in range(1000))
+CONECTIVOS_APOS_MIL = tuple(_conectivo(n, True) for n in range(1000))
+
+# SUFIXOS[n] -> conectivo + grupo n, pronto pra grudar depois das classes
+# mais altas. SUFIXOS[0] == "" (grupo zerado não aparece).
+SUFIXOS = ("",) + tuple(CONECTIVOS[n] + GRUPOS[n] for n in range(1, 1000))
+SUFIXOS_APOS_MIL = ("",) + tuple(CONECTIVOS_APOS_MIL[n] + GRUPOS[n] for n in range(1, 1000))
+
+# Feminino ("duas mil pessoas", "duzentas e uma toneladas"). Só as unidades
+# e o milhar mudam: milhão, bilhão... são masculinos, então o número na
+# frente deles também ("dois milhões de pessoas").
+GRUPOS_FEMININO = tuple(
+    _converter_grupo(n, UNIDADES_FEMININO, CENTENAS_FEMININO) for n in range(1000)
+)
+GRUPOS_CLASSE_FEMININO = (
+    GRUPOS_FEMININO, _grupos_com_classe(1, GRUPOS_FEMININO)
+) + GRUPOS_CLASSE[2:]
+MILHARES_FEMININO = GRUPOS_CLASSE_FEMININO[1]
+SUFIXOS_FEMININO = ("",) + tuple(CONECTIVOS[n] + GRUPOS_FEMININO[n] for n in range(1, 1000))
+SUFIXOS_APOS_MIL_FEMININO = ("",) + tuple(
+    CONECTIVOS_APOS_MIL[n] + GRUPOS_FEMININO[n] for n in range(1, 1000)
+)
+
+
+def extenso_positivo(numero: int) -> str:
+    """
+    Converte um inteiro positivo (já validado) usando as tabelas.
+
+    Não faz nenhuma validação - quem chama garante que o número
+    é int, maior que zero e cabe nas classes de CLASSES.
+    """
+    if numero < 1000:
+        return GRUPOS[numero]
+
+    # Atalho pro caso mais comum (até 999.999): no máximo dois grupos
+    if numero < 1_000_000:
+        milhar, resto = divmod(numero, 1000)
+        if milhar == 1:
+            return "mil" + SUFIXOS_APOS_MIL[resto]
+        return MILHARES[milhar] + SUFIXOS[resto]
+
+    # Quebra em grupos de 3 dígitos (da direita pra esquerda).
+    # Até o limite de CLASSES (306 dígitos) o divmod por 1000 é mais rápido
+    # que fatiar str(numero) ou dividir ao meio recursivamente - o custo
+    # quadrático do divmod só aparece com milhares de dígitos.
+    grupos = []
+    while numero:
+        numero, grupo = divmod(numero, 1000)
+        grupos.append(grupo)
+
+    return juntar_grupos(grupos)
+
+
+def extenso_positivo_feminino(numero: int) -> str:
+    """Mesmo que extenso_positivo(), com as tabelas do feminino."""
+    if numero < 1000:
+        return GRUPOS_FEMININO[numero]
+
+    if numero < 1_000_000:
+        milhar, resto = divmod(numero, 1000)
+        if milhar == 1:
+            return "mil" + SUFIXOS_APOS_MIL_FEMININO[resto]
+        return MILHARES_FEMININO[milhar] + SUFIXOS_FEMININO[resto]
+
+    grupos = []
+    while numero:
+        numero, grupo = divmod(numero, 1000)
+        grupos.append(grupo)
+
+    return juntar_grupos(grupos, GRUPOS_CLASSE_FEMININO)
+
+
+def juntar_grupos(grupos, grupos_classe: tuple = GRUPOS_CLASSE) -> str:
+    """
+    Junta grupos de 3 dígitos (do menos pro mais significativo) em extenso.
+
+    Ex: juntar_grupos((567, 234, 1)) -> "um milhão, duzentos e trinta
+    e quatro mil, quinhentos e sessenta e sete". Grupos zerados (inclusive
+    à esquerda) são pulados; pelo menos um grupo precisa ser não-zero.
+    `grupos_classe` é GRUPOS_CLASSE ou GRUPOS_CLASSE_FEMININO.
+
+    O custo é linear no número de grupos: cada grupo é uma consulta em
+    tupla (ou uma concatenação, nas classes acima de quintilhões).
+    """
+    partes = []
+    apos_mil = False
+    for i in range(len(grupos) - 1, -1, -1):
+        grupo = grupos[i]
+        if not grupo:
+            continue
+        if partes:
+            partes.append(CONECTIVOS_APOS_MIL[grupo] if apos_mil else CONECTIVOS[grupo])
+        if i < CLASSES_PRE_CALCULADAS:
+            partes.append(grupos_classe[i][grupo])
+        elif grupo == 1:
+            partes.append("um " + CLASSES[i][0])
+        else:
+            partes.append(GRUPOS[grupo] + " " + CLASSES[i][1])
+        apos_mil = i == 1 and grupo == 1
+
+    return "".join(partes)
+
+
+# Ordinais. Diferente dos cardinais, as tabelas só são montadas no primeiro
+# ordinal pedido (muita gente nunca usa): ordinais(feminino)[n] é o ordinal
+# de n, de 1 a 9999. Acima disso o texto é montado grupo a grupo.
+ORDINAIS_PRE_CALCULADOS = 10_000
+_ordinais = [None, None]
+
+
+def _ordinal_grupo(n: int, genero: str) -> str:
+    """Ordinal de 1 a 999: "ducentésimo trigésimo quarto"."""
+    centena, resto = divmod(n, 100)
+    dezena, unidade = divmod(resto, 10)
+    raizes = (ORDINAIS_CENTENAS[centena], ORDINAIS_DEZENAS[dezena], ORDINAIS_UNIDADES[unidade])
+    return " ".join(raiz + genero for raiz in raizes if raiz)
+
+
+def _classe_ordinal(grupo: int, classe: int, feminino: bool) -> str:
+    """
+    Grupo (maior que zero) seguido do ordinal da classe.
+
+    1 fica só com a classe ("milésimo", "milionésimo"); do 2 em diante o
+    número vai na frente, no gênero do ordinal, e a classe vai pro plural:
+    "dois milionésimos", "duzentas milésimas".
+    """
+    genero = "a" if feminino else "o"
+    if grupo == 1:
+        return ORDINAIS_CLASSES[classe] + genero
+    numero = GRUPOS_FEMININO[grupo] if feminino else GRUPOS[grupo]
+    return f"{numero} {ORDINAIS_CLASSES[classe]}{genero}s"
+
+
+def ordinais(feminino: bool) -> tuple:
+    """
+    Tabela com os ordinais de 0 a 9999 (índice 0 vazio), montada uma vez
+    por gênero no primeiro uso.
+    """
+    tabela = _ordinais[feminino]
+    if tabela is None:
+        genero = "a" if feminino else "o"
+        abaixo_de_mil = [""] + [_ordinal_grupo(n, genero) for n in range(1, 1000)]
+        lista = list(abaixo_de_mil)
+        for milhar in range(1, ORDINAIS_PRE_CALCULADOS // 1000):
+            prefixo = _classe_ordinal(milhar, 1, feminino)
+            lista.append(prefixo)
+            lista.extend(prefixo + " " + texto for texto in abaixo_de_mil[1:])
+        # Uma atribuição só: outra thread vê a tabela inteira ou nada
+        tabela = _ordinais[feminino] = tuple(lista)
+    return tabela
+
+
+def ordinal_positivo(numero: int, feminino: bool = False) -> str:
+    """
+    Ordinal de um inteiro positivo (já validado), até centilionésimo.
+
+    Ex: 1234 -> "milésimo ducentésimo trigésimo quarto",
+    2_000_000 -> "dois milionésimos".
+    """
+    tabela = ordinais(feminino)
+    if numero < ORDINAIS_PRE_CALCULADOS:
+        return tabela[numero]
+
+    grupos = []
+    while numero:
+        numero, grupo = divmod(numero, 1000)
+        grupos.append(grupo)
+
+    partes = [
+        _classe_ordinal(grupos[i], i, feminino)
+        for i in range(len(grupos) - 1, 0, -1)
+        if grupos[i]
+    ]
+    if grupos[0]:
+        partes.append(tabela[grupos[0]])
+    return " ".join(partes)
@@ -0,0 +1,435 @@
+"""
+Saída direto em bytes UTF-8, sem passar por str.
+
+Pra exportador de alto volume, que grava o extenso em arquivo ou socket:
+montar a str e depois fazer .encode("utf-8") aloca tudo duas vezes, e
+texto com acento ("milhão", "três") cai no caminho lento do encoder.
+Aqui as tabelas de tabelas.py ficam guardadas já codificadas e os
+pedaços vão direto pro buffer:
+
+    >>> por_extenso_bytes(1234)
+    b'mil duzentos e trinta e quatro'
+    >>> buffer = bytearray()
+    >>> por_extenso_bytes_lote([1, 2], destino=buffer)
+    8
+    >>> buffer
+    bytearray(b'um\\ndois\\n')
+
+O destino pode ser um bytearray (o lote é acrescentado no fim) ou um
+memoryview gravável (o lote é escrito a partir do começo). As tabelas em
+bytes só são montadas no primeiro import deste módulo.
+"""
+
+import sys
+
+from . import metricas
+from .constantes import CLASSES, MOEDA_BRL
+from .conversor import (
+    MAX_VALOR,
+    _erro_muito_grande,
+    _fator,
+    _por_extenso,
+    _por_extenso_moeda,
+    _por_extenso_ordinal,
+    _resolver_moeda,
+)
+from .fluxo import ler_texto, validar_opcoes
+from .lote import MODOS, _por_extenso_lote, _so_inteiros
+from .tabelas import (
+    CLASSES_PRE_CALCULADAS,
+    CONECTIVOS,
+    CONECTIVOS_APOS_MIL,
+    GRUPOS,
+    GRUPOS_CLASSE,
+    GRUPOS_CLASSE_FEMININO,
+    ORDINAIS_PRE_CALCULADOS,
+    SUFIXOS,
+    SUFIXOS_APOS_MIL,
+    SUFIXOS_APOS_MIL_FEMININO,
+    SUFIXOS_FEMININO,
+    ordinais,
+    ordinal_positivo,
+)
+
+
+def _codificar(tabela) -> tuple:
+    return tuple(texto.encode("utf-8") for texto in tabela)
+
+
+# As mesmas tabelas de tabelas.py, em bytes. As classes de milhão pra
+# cima são iguais nos dois gêneros, então são codificadas uma vez só.
+_CLASSES_B = tuple(_codificar(tabela) for tabela in GRUPOS_CLASSE)
+_CLASSES_FEMININO_B = (
+    _codificar(GRUPOS_CLASSE_FEMININO[0]), _codificar(GRUPOS_CLASSE_FEMININO[1])
+) + _CLASSES_B[2:]
+
+# (grupos com classe, sufixos, sufixos depois de "mil") de cada gênero
+_MASCULINO = (_CLASSES_B, _codificar(SUFIXOS), _codificar(SUFIXOS_APOS_MIL))
+_FEMININO = (
+    _CLASSES_FEMININO_B, _codificar(SUFIXOS_FEMININO), _codificar(SUFIXOS_APOS_MIL_FEMININO)
+)
+
+_GRUPOS_B = _codificar(GRUPOS)
+_CONECTIVOS_B = _codificar(CONECTIVOS)
+_CONECTIVOS_APOS_MIL_B = _codificar(CONECTIVOS_APOS_MIL)
+_NOMES_CLASSES_B = tuple((singular.encode(), plural.encode()) for singular, plural in CLASSES)
+
+# Os blocos de converter_linhas_bytes() saem com pelo menos isso (1 MiB)
+TAMANHO_BLOCO = 1 << 20
+
+# Ordinais de 1 a 9999 em bytes, por gênero (montados no primeiro uso)
+_ordinais_b = [None, None]
+
+
+def _escrever_cardinal(destino: bytearray, numero: int, tabelas: tuple) -> None:
+    """Acrescenta o extenso de um int de 1 a MAX_VALOR (já validado)."""
+    grupos_classe, sufixos, sufixos_apos_mil = tabelas
+    if numero < 1000:
+        destino += grupos_classe[0][numero]
+        return
+
+    if numero < 1_000_000:
+        milhar, resto = divmod(numero, 1000)
+        destino += grupos_classe[1][milhar]
+        destino += sufixos_apos_mil[resto] if milhar == 1 else sufixos[resto]
+        return
+
+    # Mesmo que tabelas.juntar_grupos(), pedaço a pedaço no buffer
+    grupos = []
+    while numero:
+        numero, grupo = divmod(numero, 1000)
+        grupos.append(grupo)
+
+    primeiro = True
+    apos_mil = False
+    for i in range(len(grupos) - 1, -1, -1):
+        grupo = grupos[i]
+        if not grupo:
+            continue
+        if not primeiro:
+            destino += _CONECTIVOS_APOS_MIL_B[grupo] if apos_mil else _CONECTIVOS_B[grupo]
+        if i < CLASSES_PRE_CALCULADAS:
+            destino += grupos_classe[i][grupo]
+        elif grupo == 1:
+            destino += b"um "
+            destino += _NOMES_CLASSES_B[i][0]
+        else:
+            destino += _GRUPOS_B[grupo]
+            destino += b" "
+            destino += _NOMES_CLASSES_B[i][1]
+        primeiro = False
+        apos_mil = i == 1 and grupo == 1
+
+
+def _nomes_moeda(moeda: dict) -> tuple:
+    """
+    Nomes da moeda já codificados, com o espaço na frente, e as tabelas
+    do gênero da moeda e da fração ("duas libras", "dois pence").
+    """
+    return (
+        (" " + moeda["inteiro_singular"]).encode(),
+        (" " + moeda["inteiro_plural"]).encode(),
+        (" " + (moeda.get("decimal_singular") or "")).encode(),
+        (" " + (moeda.get("decimal_plural") or "")).encode(),
+        ("zero " + moeda["inteiro_plural"]).encode(),
+        _FEMININO if moeda.get("feminino") else _MASCULINO,
+        _FEMININO if moeda.get("decimal_feminino") else _MASCULINO,
+    )
+
+
+def _escrever_moeda(destino: bytearray, centavos: int, fator: int, nomes: tuple) -> None:
+    """Mesma montagem de _moeda_de_centavos() (centavos >= 0, já validado)."""
+    inteiros, resto = divmod(centavos, fator)
+    if inteiros:
+        _escrever_cardinal(destino, inteiros, nomes[5])
+        destino += nomes[0] if inteiros == 1 else nomes[1]
+    if resto:
+        if inteiros:
+            destino += b" e "
+        _escrever_cardinal(destino, resto, nomes[6])
+        destino += nomes[2] if resto == 1 else nomes[3]
+    if not (inteiros or resto):
+        destino += nomes[4]
+
+
+_NOMES_BRL = _nomes_moeda(MOEDA_BRL)
+
+
+def _tabela_ordinais(feminino: bool) -> tuple:
+    tabela = _ordinais_b[feminino]
+    if tabela is None:
+        tabela = _ordinais_b[feminino] = _codificar(ordinais(feminino))
+    return tabela
+
+
+def _escrever_inteiro(destino: bytearray, numero, modo: str, feminino: bool) -> None:
+    """
+    Acrescenta um cardinal ou ordinal. Valor fora do normal (tipo errado,
+    fora do limite) vai pela função de str, que levanta o erro certo.
+    """
+    if type(numero) is int and -MAX_VALOR <= numero <= MAX_VALOR:
+        if modo == "cardinal":
+            if numero > 0:
+                _escrever_cardinal(destino, numero, _FEMININO if feminino else _MASCULINO)
+            elif numero == 0:
+                destino += b"zero"
+            else:
+                destino += b"menos "
+                _escrever_cardinal(destino, -numero, _FEMININO if feminino else _MASCULINO)
+            return
+        if 0 < numero < ORDINAIS_PRE_CALCULADOS:
+            destino += _tabela_ordinais(bool(feminino))[numero]
+            return
+        if numero > 0:
+            destino += ordinal_positivo(numero, bool(feminino)).encode()
+            return
+
+    # Os miolos, sem métricas: quem chamou já foi contado
+    if modo == "cardinal":
+        destino += _por_extenso(numero, False, feminino).encode()
+    else:
+        destino += _por_extenso_ordinal(numero, feminino).encode()
+
+
+def _escrever_centavos(destino: bytearray, centavos: int) -> None:
+    """Acrescenta um valor em reais, já em centavos (int, com sinal)."""
+    absoluto = -centavos if centavos < 0 else centavos
+    if absoluto // 100 > MAX_VALOR:
+        raise _erro_muito_grande()
+    if centavos < 0:
+        destino += b"menos "
+    _escrever_moeda(destino, absoluto, 100, _NOMES_BRL)
+
+
+def por_extenso_bytes(
+    valor,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    moeda: dict | str = None,
+) -> bytes:
+    """
+    Mesmo que por_extenso() (ou o modo pedido), já em bytes UTF-8.
+
+    Parâmetros:
+        valor: O número (int; int ou float no modo "moeda")
+        modo: "cardinal", "moeda" ou "ordinal"
+        feminino: Forma feminina ("duas mil", "segunda")
+        moeda: Código ISO 4217 ou dicionário da moeda (só pro modo "moeda")
+
+    Exemplos:
+        >>> por_extenso_bytes(3)
+        b'tr\\xc3\\xaas'
+        >>> por_extenso_bytes(1.5, modo="moeda").decode()
+        'um real e cinquenta centavos'
+    """
+    coletor = metricas.COLETOR
+    if coletor is not None:
+        return coletor.medir("por_extenso_bytes", _por_extenso_bytes, valor, modo, feminino, moeda)
+    return _por_extenso_bytes(valor, modo, feminino, moeda)
+
+
+def _por_extenso_bytes(valor, modo: str, feminino: bool, moeda) -> bytes:
+    """Miolo de por_extenso_bytes() - sem métricas."""
+    if modo == "cardinal" and type(valor) is int and 0 < valor < 1_000_000:
+        # Atalho: no máximo duas consultas em tabela, sem buffer nenhum
+        grupos_classe, sufixos, sufixos_apos_mil = _FEMININO if feminino else _MASCULINO
+        if valor < 1000:
+            return grupos_classe[0][valor]
+        milhar, resto = divmod(valor, 1000)
+        return grupos_classe[1][milhar] + (sufixos_apos_mil[resto] if milhar == 1 else sufixos[resto])
+
+    if modo == "moeda" and type(valor) not in (int, float):
+        # Decimal, textos e tipos errados: mesmo comportamento de por_extenso_moeda()
+        return _por_extenso_moeda(valor, moeda).encode()
+
+    buffer = bytearray()
+    if modo in ("cardinal", "ordinal"):
+        _escrever_inteiro(buffer, valor, modo, feminino)
+    else:
+        _escrever_lote(buffer, [valor], b"", modo, feminino, moeda)
+    return bytes(buffer)
+
+
+def por_extenso_bytes_lote(
+    valores,
+    destino=None,
+    separador: bytes = b"\n",
+    modo: str = "cardinal",
+    feminino: bool = False,
+    moeda: dict | str = None,
+):
+    """
+    Converte vários valores direto pra bytes UTF-8, um depois do outro.
+
+    Parâmetros:
+        valores: Qualquer iterável de números (ou ndarray do NumPy)
+        destino: Onde escrever (opcional):
+            bytearray - o lote é acrescentado no fim dele;
+            memoryview gravável - o lote é escrito a partir do começo
+            (ValueError se não couber, e nada é escrito)
+        separador: Bytes que vão depois de cada valor (padrão b"\\n")
+        modo, feminino, moeda: Como em por_extenso_lote()
+
+    Retorna:
+        Sem destino, um bytearray novo com o lote. Com destino, quantos
+        bytes foram escritos nele.
+
+    Se algum valor for inválido, o erro é levantado antes de escrever
+    qualquer coisa no destino.
+
+    Exemplos:
+        >>> por_extenso_bytes_lote([1, 2], separador=b";")
+        bytearray(b'um;dois;')
+    """
+    coletor = metricas.COLETOR
+    if coletor is not None:
+        return coletor.medir(
+            "por_extenso_bytes_lote", _por_extenso_bytes_lote,
+            valores, destino, separador, modo, feminino, moeda,
+        )
+    return _por_extenso_bytes_lote(valores, destino, separador, modo, feminino, moeda)
+
+
+def _por_extenso_bytes_lote(valores, destino, separador, modo, feminino, moeda):
+    """Miolo de por_extenso_bytes_lote() - sem métricas."""
+    if not isinstance(separador, (bytes, bytearray)):
+        raise TypeError(f"O separador precisa ser bytes, recebi {type(separador).__name__}")
+
+    if type(destino) is bytearray:
+        inicio = len(destino)
+        try:
+            _escrever_lote(destino, valores, separador, modo, feminino, moeda)
+        except BaseException:
+            del destino[inicio:]  # não deixa um lote pela metade no destino
+            raise
+        return len(destino) - inicio
+
+    if destino is not None:
+        alvo = memoryview(destino)
+        if alvo.readonly:
+            raise TypeError("O destino precisa ser gravável (bytearray ou memoryview gravável)")
+        alvo = alvo.cast("B")
+
+    buffer = bytearray()
+    _escrever_lote(buffer, valores, separador, modo, feminino, moeda)
+    if destino is None:
+        return buffer
+
+    # memoryview: monta o lote inteiro e copia uma vez só
+    if len(buffer) > len(alvo):
+        raise ValueError(f"O lote tem {len(buffer)} bytes e o destino só {len(alvo)}")
+    alvo[:len(buffer)] = buffer
+    return len(buffer)
+
+
+def _escrever_lote(buffer: bytearray, valores, separador: bytes, modo, feminino, moeda) -> None:
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: {modo!r}. Use um de: {', '.join(MODOS)}")
+
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(valores, np.ndarray):
+        valores = valores.ravel().tolist()
+    else:
+        valores = list(valores)
+    if not valores:
+        return
+
+    if modo == "cardinal" and _so_inteiros(valores):
+        # Limite validado uma vez só pro lote inteiro
+        if max(valores) > MAX_VALOR or -min(valores) > MAX_VALOR:
+            raise _erro_muito_grande()
+        tabelas = _FEMININO if feminino else _MASCULINO
+        for numero in valores:
+            if numero > 0:
+                _escrever_cardinal(buffer, numero, tabelas)
+            elif numero == 0:
+                buffer += b"zero"
+            else:
+                buffer += b"menos "
+                _escrever_cardinal(buffer, -numero, tabelas)
+            buffer += separador
+        return
+
+    if modo == "moeda" and set(map(type, valores)) <= {int, float}:
+        moeda = _resolver_moeda(moeda)
+        # Mesmo arredondamento de por_extenso_moeda(), feito uma vez
+        fator = _fator(moeda)
+        centavos = [round(abs(v) * fator) for v in valores]
+        if max(centavos) // fator > MAX_VALOR:
+            raise _erro_muito_grande()
+        nomes = _nomes_moeda(moeda)
+        for valor, absoluto in zip(valores, centavos):
+            if valor < 0:
+                buffer += b"menos "
+            _escrever_moeda(buffer, absoluto, fator, nomes)
+            buffer += separador
+        return
+
+    if modo == "ordinal" and _so_inteiros(valores) and min(valores) > 0 and max(valores) <= MAX_VALOR:
+        for numero in valores:
+            _escrever_inteiro(buffer, numero, modo, feminino)
+            buffer += separador
+        return
+
+    # O resto (Decimal, textos, valores inválidos) passa pelo lote de str,
+    # que valida tudo e levanta os erros de sempre antes de escrevermos
+    for texto in _por_extenso_lote(valores, modo, feminino, moeda):
+        buffer += texto.encode("utf-8")
+        buffer += separador
+
+
+def converter_linhas_bytes(
+    linhas,
+    modo: str = "cardinal",
+    feminino: bool = False,
+    erros: str = "abortar",
+    avisar=None,
+    primeira_linha: int = 1,
+    separador: bytes = b"\n",
+):
+    """
+    Mesmo que fluxo.converter_linhas(), gerando blocos de bytes UTF-8.
+
+    Cada linha convertida vai pro bloco seguida do separador; o bloco é
+    entregue quando passa de TAMANHO_BLOCO (e o que sobrar, no fim). É o
+    que o CLI usa no modo fluxo: os blocos vão direto pro sys.stdout.buffer,
+    sem str nem encoder no meio.
+
+    Gera:
+        bytearrays (o mesmo objeto é reaproveitado - grave ou copie antes
+        de pedir o próximo)
+    """
+    validar_opcoes(modo, erros)
+
+    bloco = bytearray()
+    for numero_linha, linha in enumerate(linhas, primeira_linha):
+        texto = linha.strip()
+        if not texto:
+            continue
+
+        tamanho = len(bloco)
+        try:
+            numero = ler_texto(texto, modo)
+            if modo == "moeda":
+                _escrever_centavos(bloco, numero)
+            else:
+                _escrever_inteiro(bloco, numero, modo, feminino)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            del bloco[tamanho:]  # descarta o que a linha ruim chegou a escrever
+            if erros == "abortar":
+                if bloco:
+                    yield bloco
+                raise ValueError(f"linha {numero_linha}: {e}") from e
+            if avisar is not None:
+                avisar(numero_linha, e)
+            if erros != "marcar":
+                continue
+            bloco += f"ERRO: {e}".encode("utf-8")
+        bloco += separador
+
+        if len(bloco) >= TAMANHO_BLOCO:
+            yield bloco
+            bloco.clear()
+
+    if bloco:
+        yield bloco